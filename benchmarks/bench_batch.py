@@ -0,0 +1,43 @@
+"""Cost of N single mutation calls vs one N-item batch call.
+
+Uses the fake ``osascript`` on PATH, so every single call pays a real process
+spawn plus the simulated compile and per-event costs:
+
+    python benchmarks/bench_batch.py --sizes 1 10 50 --event-ms 2
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import fake_osascript
+from reminders_mcp import reminders
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--event-ms", type=float, default=2)
+    args = parser.parse_args()
+
+    os.environ["FAKE_OSASCRIPT_EVENT_MS"] = str(args.event_ms)
+    reminders.configure_pool(0)
+    with tempfile.TemporaryDirectory() as directory:
+        fake_osascript.install(directory)
+        print(f"{'items':>6} {'single calls':>13} {'one batch':>10} {'speedup':>8}")
+        for size in args.sizes:
+            items = [{"name": f"Reminder {i}", "list_name": "Inbox"} for i in range(size)]
+            single = timed(lambda: [reminders.complete_reminder(**item) for item in items])
+            batch = timed(lambda: reminders.complete_reminders(items))
+            print(f"{size:>6} {single:>12.3f}s {batch:>9.3f}s {single / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
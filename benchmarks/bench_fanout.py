@@ -0,0 +1,67 @@
+"""Wall time of cross-list reads and name lookups: one script vs per-list fan-out.
+
+The fake runner charges ``--list-ms`` for every list a script visits, so one
+script over all lists takes about lists × list-ms while the fan-out overlaps
+the lists on a pool of ``max(--widths)`` workers:
+
+    python benchmarks/bench_fanout.py --lists 8 --list-ms 20 --widths 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from reminders_mcp import reminders
+
+FAKE = Path(__file__).with_name("fake_osascript.py")
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lists", type=int, default=8)
+    parser.add_argument("--list-ms", type=float, default=20)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--widths", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ["FAKE_OSASCRIPT_LISTS"] = str(args.lists)
+    os.environ["FAKE_OSASCRIPT_LIST_MS"] = str(args.list_ms)
+    os.environ["FAKE_OSASCRIPT_ITEMS"] = str(args.items)
+    os.environ["FAKE_OSASCRIPT_EXEC_MS"] = "0"
+    reminders.configure_pool(max(args.widths), [sys.executable, str(FAKE), "--worker"])
+    # A reminder in the last list, so a sequential name search visits them all.
+    name = f"List {args.lists} reminder 0" if args.lists > 1 else "Reminder 0"
+
+    def read() -> None:
+        assert len(reminders.get_reminders()) == args.lists * args.items
+
+    def complete() -> None:
+        reminders.name_index.clear()
+        assert reminders.complete_reminder(name)
+
+    print(f"{'fan-out':>8} {'read all ms':>12} {'complete ms':>12}")
+    baseline = None
+    for width in [0, *args.widths]:
+        reminders.FANOUT = width
+        read(), complete()  # warm up: compile every script on every worker
+        row = timed(read, args.repeat), timed(complete, args.repeat)
+        baseline = baseline or row
+        speedups = "  ".join(f"{base / value:5.1f}x" for base, value in zip(baseline, row))
+        print(f"{width or 'off':>8} {row[0] * 1000:>12.1f} {row[1] * 1000:>12.1f}   {speedups}")
+    reminders.configure_pool(0)
+
+
+if __name__ == "__main__":
+    main()
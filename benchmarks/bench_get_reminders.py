@@ -0,0 +1,87 @@
+"""Per-item cost of listing reminders: per-item Apple events vs bulk columns.
+
+The fake runner charges ``--event-ms`` per simulated Apple event, so the
+numbers show how cost scales with list size rather than absolute timings.
+The last column lists names only (``fields=[]``), skipping three columns:
+
+    python benchmarks/bench_get_reminders.py --sizes 100 1000 5000 --event-ms 0.5
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from reminders_mcp import reminders
+
+FAKE = Path(__file__).with_name("fake_osascript.py")
+
+# Stand-in for the previous per-item handler, which made a round trip per
+# property per reminder. The fake runner recognises it by its marker comment
+# and answers in the old pipe-delimited format.
+PER_ITEM_SCRIPT = """
+-- per-item listing
+on run argv
+    set {listName} to argv
+    tell application "Reminders"
+        set output to {}
+        repeat with r in (reminders of list listName whose completed is false)
+            set end of output to (name of list listName) & "|" & name of r & "|" & (completed of r as string)
+        end repeat
+        return output
+    end tell
+end run
+"""
+
+
+def per_item(list_name: str) -> list[dict]:
+    output = reminders._run_applescript(PER_ITEM_SCRIPT, list_name)
+    items = []
+    for line in output.splitlines():
+        parts = line.split("|", 4)
+        items.append({
+            "list": parts[0],
+            "name": parts[1],
+            "completed": parts[2] == "true",
+            "due_date": parts[3] if parts[3] != "missing value" else None,
+            "notes": parts[4].replace("⏎", "\n") or None,
+        })
+    return items
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--event-ms", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ["FAKE_OSASCRIPT_EVENT_MS"] = str(args.event_ms)
+    os.environ["FAKE_OSASCRIPT_EXEC_MS"] = "0"
+    print(f"{'items':>7} {'per-item ms/item':>17} {'bulk ms/item':>13} {'speedup':>8} {'names ms/item':>14}")
+    for size in args.sizes:
+        os.environ["FAKE_OSASCRIPT_ITEMS"] = str(size)
+        reminders.configure_pool(1, [sys.executable, str(FAKE), "--worker"])
+        assert len(per_item("Inbox")) == len(reminders.get_reminders("Inbox")) == size
+        slow = timed(lambda: per_item("Inbox"), args.repeat)
+        fast = timed(lambda: reminders.get_reminders("Inbox"), args.repeat)
+        names = timed(lambda: reminders.get_reminders("Inbox", fields=[]), args.repeat)
+        print(
+            f"{size:>7} {slow / size * 1000:>17.4f} {fast / size * 1000:>13.4f} {slow / fast:>7.1f}x"
+            f" {names / size * 1000:>14.4f}"
+        )
+    reminders.configure_pool(0)
+
+
+if __name__ == "__main__":
+    main()
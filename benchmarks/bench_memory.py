@@ -0,0 +1,100 @@
+"""Memory held by a full-database listing: a dict per reminder vs Reminder records.
+
+Decodes synthetic get_reminders output for ``--items`` reminders spread over
+``--lists`` lists, once into the dicts listings used to return and once into
+Reminder records, and reports the memory each result keeps alive (traced
+with tracemalloc, so the strings both share are counted in both):
+
+    python benchmarks/bench_memory.py --items 100000 --lists 20
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from reminders_mcp import dates, reminders, wire
+from reminders_mcp.wire import RS, US
+
+
+def listing(items: int, lists: int) -> str:
+    """get_reminders output with the default fields."""
+    blocks = []
+    per_list = items // lists
+    for list_index in range(lists):
+        rows = [
+            (
+                f"x-apple-reminder://{list_index:04d}-{i:08d}",
+                f"Reminder {i}",
+                "false",
+                "2026-03-01T09:00:00" if i % 3 == 0 else "",
+                f"Note for reminder {i}" if i % 2 else "",
+            )
+            for i in range(per_list)
+        ]
+        columns = (US.join(column) for column in zip(*rows))
+        blocks.append(RS.join([f"List {list_index}", str(per_list), *columns]))
+    return RS.join(blocks)
+
+
+def as_dicts(output: str) -> list[dict]:
+    """What listings returned before Reminder records."""
+    rows, _ = wire.decode_page(output)
+    reminders.name_index.add_many((name, rlist, reminder_id) for rlist, reminder_id, name, *_ in rows)
+    return [
+        {
+            "id": reminder_id,
+            "list": rlist,
+            "name": name,
+            "completed": done == "true",
+            "due_date": dates.from_script(due),
+            "notes": note or None,
+        }
+        for rlist, reminder_id, name, done, due, note, _, _ in rows
+    ]
+
+
+def as_records(output: str) -> list:
+    items, _ = reminders._parse_page(output, ("bench",))
+    return items
+
+
+def measure(build, output: str, repeat: int = 3) -> tuple[int, float]:
+    """Bytes kept alive by ``build(output)`` and its best time untraced."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(output)
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    result = build(output)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) > 0
+    return size, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--lists", type=int, default=20)
+    args = parser.parse_args()
+
+    output = listing(args.items, args.lists)
+    items = args.items // args.lists * args.lists
+    print(f"{items} reminders in {args.lists} lists")
+    print(f"{'':>8} {'MiB':>8} {'bytes/item':>11} {'decode ms':>10}")
+    # Listings also feed the name index. Filling it beforehand keeps it out
+    # of the numbers.
+    as_records(output)
+    sizes = {}
+    for label, build in (("dicts", as_dicts), ("records", as_records)):
+        size, elapsed = measure(build, output)
+        sizes[label] = size
+        print(f"{label:>8} {size / 2**20:>8.1f} {size / items:>11.0f} {elapsed * 1000:>10.0f}")
+    print(f"records use {sizes['records'] / sizes['dicts']:.0%} of the memory of dicts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Cost of one page of list_reminders at different depths of lists of different sizes.
+
+A page should cost the same whether its list holds a hundred reminders or
+tens of thousands, and whether it is the first page or the last. For each
+``--sizes`` list size this reads a ``--limit`` page at the start, the middle
+and the end of one synthetic list, with and without a filter, in the fake
+osascript charging ``--event-ms`` per Apple event and ``--value-us`` per
+value transferred:
+
+    python benchmarks/bench_paging.py --sizes 500 5000 20000 --limit 50
+
+Unfiltered pages read element ranges and should stay flat. Filtered pages
+also receive the ids of every matching reminder, one value each, and read
+whole columns over the filter until reading the page by id is cheaper, so
+they grow with the number of matches but not with the depth of the page.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fake_osascript
+
+FAKE = Path(__file__).with_name("fake_osascript.py")
+
+
+def page_ms(reminders, include_completed: bool, limit: int, offset: int, rounds: int) -> float:
+    """Mean time to read the page of ``limit`` reminders starting at ``offset``."""
+    cursor = None
+    if offset > 1:
+        # A page ends where the next one starts, whatever its size.
+        _, cursor = reminders.get_reminders_page("Inbox", include_completed, offset - 1, None)
+    reminders.get_reminders_page("Inbox", include_completed, limit, cursor)  # compile
+    start = time.perf_counter()
+    for _ in range(rounds):
+        items, _ = reminders.get_reminders_page("Inbox", include_completed, limit, cursor)
+    assert len(items) == limit
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000, 20000], help="reminders in the list")
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--event-ms", type=float, default=0.2)
+    parser.add_argument("--value-us", type=float, default=2)
+    parser.add_argument("--rounds", type=int, default=5, help="timed reads per page")
+    args = parser.parse_args()
+
+    os.environ.update({
+        "FAKE_OSASCRIPT_EVENT_MS": str(args.event_ms),
+        "FAKE_OSASCRIPT_VALUE_US": str(args.value_us),
+        "FAKE_OSASCRIPT_EXEC_MS": "0",
+        "REMINDERS_MCP_SCRIPT_CACHE": "off",
+    })
+    from reminders_mcp import reminders
+
+    print(f"{'reminders':>9} {'query':<10} {'first ms':>9} {'middle ms':>10} {'last ms':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        fake_osascript.install(directory)
+        try:
+            for size in args.sizes:
+                # Workers read the list size from the environment when they start.
+                os.environ["FAKE_OSASCRIPT_ITEMS"] = str(size)
+                reminders.configure_pool(1, [sys.executable, str(FAKE), "--worker"])
+                for label, include_completed in (("unfiltered", True), ("filtered", False)):
+                    first, middle, last = (
+                        page_ms(reminders, include_completed, args.limit, offset, args.rounds)
+                        for offset in (1, size // 2, size - args.limit + 1)
+                    )
+                    print(f"{size:>9} {label:<10} {first:>9.1f} {middle:>10.1f} {last:>8.1f}")
+        finally:
+            reminders.configure_pool(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare per-call latency of one ``osascript`` process per call vs the worker pool.
+
+Runs against ``fake_osascript.py`` so it works on Linux:
+
+    python benchmarks/bench_pool.py --calls 200 --workers 4
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import fake_osascript
+from reminders_mcp import reminders
+
+FAKE = Path(__file__).with_name("fake_osascript.py")
+SCRIPT = 'tell application "Reminders" to return name of default list'
+
+
+def measure(calls: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies = []
+
+    def one(_):
+        start = time.perf_counter()
+        reminders._run_applescript(SCRIPT)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(one, range(calls)))
+    return time.perf_counter() - start, latencies
+
+
+def report(label: str, total: float, latencies: list[float]) -> None:
+    ms = sorted(latency * 1000 for latency in latencies)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(f"{label:<12} total {total:7.3f}s  mean {statistics.mean(ms):7.2f}ms  "
+          f"p50 {statistics.median(ms):7.2f}ms  p95 {p95:7.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fake_osascript.install(directory)
+
+        reminders.configure_pool(0)
+        total, latencies = measure(args.calls, args.workers)
+        report("subprocess", total, latencies)
+
+        reminders.configure_pool(args.workers, [sys.executable, str(FAKE), "--worker"])
+        measure(args.workers, args.workers)  # warm up every worker
+        total, latencies = measure(args.calls, args.workers)
+        report("pool", total, latencies)
+        reminders.configure_pool(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Throughput and latency of every tool, end to end against a synthetic database.
+
+Each tool is called ``--calls`` times, ``--concurrency`` at a time, through
+the MCP tool layer, so argument validation, the scheduler, caches and the
+wire decoder are all measured. AppleScript runs in the fake osascript, on
+PATH as one process per call or as ``--workers`` pool workers, against
+``--lists`` × ``--items`` synthetic reminders with ``--note-chars`` notes,
+charging ``--event-ms`` per Apple event and ``--spawn-ms`` per process:
+
+    python benchmarks/bench_tools.py --lists 5 --items 200 --event-ms 0.2 --spawn-ms 20
+
+The read cache is off unless ``--cache-ttl`` is given, so reads reach the
+fake app every time. ``--save`` writes the results as JSON. ``--baseline``
+compares against such a file and exits with status 1 if a tool's p95
+latency rose, or its throughput fell, by more than ``--max-regression``
+(default 0.25, i.e. 25%), or it failed more often, so a run can gate a merge:
+
+    python benchmarks/bench_tools.py --save baseline.json
+    python benchmarks/bench_tools.py --baseline baseline.json --max-regression 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fake_osascript
+
+FAKE = Path(__file__).with_name("fake_osascript.py")
+
+
+def scenarios(items: int, export_path: str) -> list[tuple[str, str, object]]:
+    """``(label, tool, arguments for call i)`` for every tool, reads first.
+
+    Mutations address reminders of the first synthetic list by name or id,
+    so every call hits an existing reminder.
+    """
+    name = lambda i: f"Reminder {i % items}"  # noqa: E731
+    reminder_id = lambda i: f"x-apple-reminder://{i % items:08d}"  # noqa: E731
+    batch = lambda i: [{"name": name(i * 10 + j), "list_name": "Inbox"} for j in range(10)]  # noqa: E731
+    return [
+        ("list_reminder_lists", "list_reminder_lists", lambda i: {}),
+        ("list_reminders", "list_reminders", lambda i: {}),
+        ("list_reminders[list]", "list_reminders", lambda i: {"list_name": "Inbox"}),
+        ("list_reminders[page]", "list_reminders", lambda i: {"limit": 50}),
+        ("list_reminders[names]", "list_reminders", lambda i: {"fields": []}),
+        ("search_reminders", "search_reminders", lambda i: {"query": f"reminder {i % 10}"}),
+        ("agenda", "agenda", lambda i: {}),
+        ("reminder_counts", "reminder_counts", lambda i: {}),
+        ("create_reminder", "create_reminder", lambda i: {"name": f"Bench {i}", "list_name": "Inbox"}),
+        ("update_reminder", "update_reminder", lambda i: {"reminder_id": reminder_id(i), "notes": f"n{i}"}),
+        ("complete_reminder", "complete_reminder", lambda i: {"name": name(i), "list_name": "Inbox"}),
+        ("delete_reminder", "delete_reminder", lambda i: {"reminder_id": reminder_id(i)}),
+        ("create_reminders[10]", "create_reminders", batch),
+        ("update_reminders[10]", "update_reminders", lambda i: [item | {"notes": "n"} for item in batch(i)]),
+        ("complete_reminders[10]", "complete_reminders", batch),
+        ("delete_reminders[10]", "delete_reminders", batch),
+        ("export_reminders", "export_reminders", lambda i: {"path": export_path}),
+        ("import_reminders", "import_reminders", lambda i: {"path": export_path}),
+    ]
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+async def run(server, tool: str, arguments, calls: int, concurrency: int) -> dict:
+    slots = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def call(i: int) -> None:
+        nonlocal errors
+        args = arguments(i)
+        args = {"items": args} if isinstance(args, list) else args
+        async with slots:
+            start = time.perf_counter()
+            try:
+                await server.mcp.call_tool(tool, args)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    # Warm up: start the workers and compile the tool's scripts on them.
+    await asyncio.gather(*(call(0) for _ in range(concurrency)))
+    latencies.clear()
+    errors = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(1, calls + 1)))
+    wall = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "calls": calls,
+        "errors": errors,
+        "throughput": calls / wall,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def regressions(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Describe every tool that got slower or less reliable than ``baseline``."""
+    found = []
+    for label, base in baseline["tools"].items():
+        result = results["tools"].get(label)
+        if result is None:
+            continue
+        if result["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            found.append(f"{label}: p95 {base['p95_ms']:.1f} -> {result['p95_ms']:.1f} ms")
+        if result["throughput"] < base["throughput"] / (1 + max_regression):
+            found.append(f"{label}: throughput {base['throughput']:.1f} -> {result['throughput']:.1f}/s")
+        if result["errors"] > base["errors"]:
+            found.append(f"{label}: errors {base['errors']} -> {result['errors']}")
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lists", type=int, default=5)
+    parser.add_argument("--items", type=int, default=200, help="reminders per list")
+    parser.add_argument("--note-chars", type=int, default=100)
+    parser.add_argument("--event-ms", type=float, default=0.1)
+    parser.add_argument("--spawn-ms", type=float, default=20)
+    parser.add_argument("--compile-ms", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=4, help="pool workers, 0 for one osascript per call")
+    parser.add_argument("--calls", type=int, default=50, help="measured calls per tool")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--cache-ttl", type=float, default=0)
+    parser.add_argument("--tools", nargs="+", help="only run these labels")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON file from --save to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    args = parser.parse_args()
+
+    settings = {
+        name: getattr(args, name)
+        for name in ("lists", "items", "note_chars", "event_ms", "spawn_ms", "compile_ms", "workers", "calls",
+                     "concurrency", "cache_ttl")
+    }
+    os.environ.update({
+        "FAKE_OSASCRIPT_LISTS": str(args.lists),
+        "FAKE_OSASCRIPT_ITEMS": str(args.items),
+        "FAKE_OSASCRIPT_NOTE_CHARS": str(args.note_chars),
+        "FAKE_OSASCRIPT_EVENT_MS": str(args.event_ms),
+        "FAKE_OSASCRIPT_SPAWN_MS": str(args.spawn_ms),
+        "FAKE_OSASCRIPT_COMPILE_MS": str(args.compile_ms),
+        "FAKE_OSASCRIPT_EXEC_MS": "0",
+        "REMINDERS_MCP_CACHE_TTL": str(args.cache_ttl),
+        "REMINDERS_MCP_SCRIPT_CACHE": "off",
+    })
+    # The server reads its settings from the environment on import.
+    from reminders_mcp import reminders, server
+
+    results = {"settings": settings, "tools": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        fake_osascript.install(directory)
+        reminders.configure_pool(args.workers, [sys.executable, str(FAKE), "--worker"] if args.workers else None)
+        export_path = str(Path(directory) / "export.ndjson")
+        print(f"{'tool':<24} {'calls/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+
+        async def run_all() -> None:
+            # One event loop for every tool: the server's locks bind to it.
+            for label, tool, arguments in scenarios(args.items, export_path):
+                if args.tools and label not in args.tools:
+                    continue
+                result = await run(server, tool, arguments, args.calls, args.concurrency)
+                results["tools"][label] = result
+                print(
+                    f"{label:<24} {result['throughput']:>8.1f} {result['p50_ms']:>8.1f} "
+                    f"{result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['errors']:>6}"
+                )
+
+        try:
+            asyncio.run(run_all())
+        finally:
+            reminders.configure_pool(0)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if baseline.get("settings") != settings:
+            print("warning: baseline was recorded with different settings", file=sys.stderr)
+        found = regressions(results, baseline, args.max_regression)
+        for line in found:
+            print(f"REGRESSION {line}")
+        if found:
+            sys.exit(1)
+        print(f"no regressions beyond {args.max_regression:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
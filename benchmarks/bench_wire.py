@@ -0,0 +1,124 @@
+"""Parser throughput: RS/US wire format vs the old pipe-delimited lines.
+
+Decodes synthetic get_reminders output in memory, so no osascript is involved.
+"decode" rows only split the output into records; "parse" rows also build
+the reminder dicts, and for RS/US that includes ids and name index upkeep:
+
+    python benchmarks/bench_wire.py --records 100000 --lists 20
+"""
+
+import argparse
+import gc
+import time
+
+from reminders_mcp import reminders, wire
+from reminders_mcp.wire import RS, US
+
+
+def synthetic_records(count: int, lists: int) -> list[tuple[str, ...]]:
+    return [
+        (
+            f"List {i % lists}",
+            f"x-apple-reminder://{i:08d}",
+            f"Reminder {i} | with a pipe",
+            "false" if i % 3 else "true",
+            "missing value" if i % 2 else "Monday, March 2, 2026 at 9:00:00 AM",
+            f"Note {i}\nsecond line" if i % 4 else "",
+        )
+        for i in range(count)
+    ]
+
+
+def wire_output(records: list[tuple[str, ...]]) -> str:
+    by_list: dict[str, list[tuple[str, ...]]] = {}
+    for record in records:
+        by_list.setdefault(record[0], []).append(record[1:])
+    fields = []
+    for list_name, rows in by_list.items():
+        fields += [list_name, str(len(rows)), *(US.join(column) for column in zip(*rows))]
+    return RS.join(fields) + "\n"
+
+
+def pipe_output(records: list[tuple[str, ...]]) -> str:
+    # The old handler dropped ids and replaced newlines in notes with "⏎".
+    return "\n".join(
+        "|".join([list_name, name.replace("|", "/"), done, due, notes.replace("\n", "⏎")])
+        for list_name, _, name, done, due, notes in records
+    )
+
+
+def decode_pipe(output: str) -> list[list[str]]:
+    return [line.split("|", 4) for line in output.splitlines()]
+
+
+def parse_pipe(output: str) -> list[dict]:
+    items = []
+    for line in output.splitlines():
+        parts = line.split("|", 4)
+        items.append({
+            "list": parts[0],
+            "name": parts[1],
+            "completed": parts[2] == "true",
+            "due_date": parts[3] if parts[3] != "missing value" else None,
+            "notes": parts[4].replace("⏎", "\n") or None,
+        })
+    return items
+
+
+def parse_wire(output: str) -> list[dict]:
+    return reminders._parse_page(output, ("",))[0]
+
+
+def parse_wire_streaming(output: str, chunk_size: int) -> list[dict]:
+    decoder = wire.PageDecoder()
+    rows = []
+    for start in range(0, len(output), chunk_size):
+        rows += decoder.feed(output[start:start + chunk_size])
+    rows += decoder.close()
+    return reminders._page_result(rows, decoder.next_position, ("",))[0]
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+            reminders.name_index.clear()
+    finally:
+        gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--lists", type=int, default=20)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records, args.lists)
+    encoded = wire_output(records)
+    legacy = pipe_output(records)
+    assert len(parse_wire(encoded)) == len(parse_wire_streaming(encoded, 1024)) == len(parse_pipe(legacy))
+    reminders.name_index.clear()
+
+    cases = [
+        ("decode pipe lines", lambda: decode_pipe(legacy)),
+        ("decode RS/US", lambda: wire.decode_page(encoded)),
+        ("parse pipe lines", lambda: parse_pipe(legacy)),
+        ("parse RS/US", lambda: parse_wire(encoded)),
+        (f"parse RS/US {args.chunk_kb} KiB chunks", lambda: parse_wire_streaming(encoded, args.chunk_kb * 1024)),
+    ]
+    print(f"{args.records} records in {args.lists} lists")
+    print(f"{'parser':>28} {'ms':>9} {'records/s':>12}")
+    for label, fn in cases:
+        seconds = timed(fn, args.repeat)
+        print(f"{label:>28} {seconds * 1000:>9.1f} {args.records / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
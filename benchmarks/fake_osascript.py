@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Stand-in for ``osascript`` so benchmarks can run on machines without macOS.
+
+One-shot mode mimics ``osascript -e <script> [-- args...]``: it sleeps for the
+simulated compile time and prints a result. ``--worker`` mode speaks the
+``reminders_mcp.pool`` line protocol and only pays the compile delay the first
+time it sees a given script.
+
+Reminder listings are answered from synthetic lists ("Inbox", "List 2", ...)
+and charged per Apple event and per value transferred. The page handler
+returns only the page's window and a "next:" marker when it stops early.
+Unfiltered it pays three events per list plus one per column over the
+window; filtered it also receives the ids of every reminder of the list,
+then one event per column over the whole list where the script's switch
+point says so, or one per reminder and column of the window otherwise. The
+mirror's bulk listing pays two events per list plus one per column over the
+whole list, while a per-item script (one containing "-- per-item listing")
+pays five per reminder. Every list a script visits also costs a fixed
+per-list delay.
+Reminders in the first list are named "Reminder <i>", in the others
+"<list> reminder <i>". The list-names handler returns the lists and name
+lookups return the ids of matching reminders. Counts and watch snapshots pay
+a few events per list. Batch mutation handlers answer "ok" for every
+operation, with the name and a new id for creates and the id for the rest,
+and pay two events each, plus the per-list delay of each list they search
+for a name, stopping at the first list holding it; other scripts pay two
+events and return "ok". Filters in whose clauses are ignored.
+
+Settings are read from the environment:
+
+    FAKE_OSASCRIPT_SPAWN_MS     simulated start-up time per process (default 0)
+    FAKE_OSASCRIPT_COMPILE_MS   simulated compile time per script (default 5)
+    FAKE_OSASCRIPT_EXEC_MS      simulated execution time per call (default 1)
+    FAKE_OSASCRIPT_EVENT_MS     simulated cost of one Apple event (default 0)
+    FAKE_OSASCRIPT_VALUE_US     simulated cost of one value transferred (default 0)
+    FAKE_OSASCRIPT_ITEMS        reminders in each synthetic list (default 100)
+    FAKE_OSASCRIPT_LISTS        number of synthetic lists (default 1)
+    FAKE_OSASCRIPT_LIST_MS      simulated latency per list visited (default 0)
+    FAKE_OSASCRIPT_NOTE_CHARS   length of every note (default: about 30)
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+SPAWN_S = float(os.environ.get("FAKE_OSASCRIPT_SPAWN_MS", "0")) / 1000
+COMPILE_S = float(os.environ.get("FAKE_OSASCRIPT_COMPILE_MS", "5")) / 1000
+EXEC_S = float(os.environ.get("FAKE_OSASCRIPT_EXEC_MS", "1")) / 1000
+EVENT_S = float(os.environ.get("FAKE_OSASCRIPT_EVENT_MS", "0")) / 1000
+VALUE_S = float(os.environ.get("FAKE_OSASCRIPT_VALUE_US", "0")) / 1_000_000
+ITEMS = int(os.environ.get("FAKE_OSASCRIPT_ITEMS", "100"))
+LIST_S = float(os.environ.get("FAKE_OSASCRIPT_LIST_MS", "0")) / 1000
+LISTS = ["Inbox", *(f"List {i}" for i in range(2, int(os.environ.get("FAKE_OSASCRIPT_LISTS", "1")) + 1))]
+
+RS, US = "\x1e", "\x1f"
+IDS = [f"x-apple-reminder://{i:08d}" for i in range(ITEMS)]
+NAMES = [f"Reminder {i}" for i in range(ITEMS)]
+NOTES = [f"Note for reminder {i}\nsecond line" for i in range(ITEMS)]
+if os.environ.get("FAKE_OSASCRIPT_NOTE_CHARS"):
+    NOTE_CHARS = int(os.environ["FAKE_OSASCRIPT_NOTE_CHARS"])
+    NOTES = [(note + " ") * (NOTE_CHARS // (len(note) + 1) + 1) for note in NOTES]
+    NOTES = [note[:NOTE_CHARS] for note in NOTES]
+
+
+def searched(name: str) -> int:
+    """Number of lists a name search visits, in list order."""
+    for index in range(len(LISTS)):
+        if name in list_names(index):
+            return index + 1
+    return len(LISTS)
+
+
+def bulk_listing(script: str, args: list[str]) -> str:
+    if args and args[0]:
+        return list_block(args[0], LISTS.index(args[0]), script)
+    return RS.join(list_block(list_name, index, script) for index, list_name in enumerate(LISTS))
+
+
+def list_ids(index: int) -> list[str]:
+    return [f"{reminder_id}-{index}" for reminder_id in IDS] if index else IDS
+
+
+def list_names(index: int) -> list[str]:
+    return [f"{LISTS[index]} reminder {i}" for i in range(ITEMS)] if index else NAMES
+
+
+def list_columns(index: int, script: str) -> list[list[str]]:
+    """The columns of list ``index`` that ``script`` fetches, ids and names first."""
+    columns = [list_ids(index), list_names(index)]
+    for marker, values in (
+        (("set rCompleted to", "set columns's completeds to"), ["false"] * ITEMS),
+        (("due date of",), [""] * ITEMS),
+        (("body of",), NOTES),
+        (("set rFlagged to", "set columns's flags to"), ["false"] * ITEMS),
+        (("set rPriority to", "set columns's priorities to"), ["0"] * ITEMS),
+    ):
+        if any(text in script for text in marker):
+            columns.append(values)
+    return columns
+
+
+def list_block(list_name: str, index: int, script: str) -> str:
+    columns = list_columns(index, script)
+    # lists, name of l, then one event per column
+    time.sleep(LIST_S + EVENT_S * (2 + len(columns)) + VALUE_S * ITEMS * len(columns))
+    return RS.join([list_name, str(ITEMS), *(US.join(column) for column in columns)])
+
+
+def page_listing(script: str, args: list[str]) -> str:
+    list_name, start_list, start_offset, page_size = args[0], int(args[1]), int(args[2]), int(args[3])
+    filtered = "set columns's matched to id of" in script
+    # The ratio past which the script reads the window by id instead.
+    bulk = re.search(r"\(lastIndex - firstIndex \+ 1\) \* (\d+) ≥ total", script)
+    indexes = [LISTS.index(list_name)] if list_name else range(len(LISTS))
+    output, taken, cost = [], 0, EVENT_S
+    for position, index in enumerate(indexes, start=1):
+        if position < start_list:
+            continue
+        # name of l, then the count or the ids of the matching reminders
+        cost += LIST_S + EVENT_S * 2 + (VALUE_S * ITEMS if filtered else 0)
+        first = start_offset if position == start_list else 1
+        last = ITEMS
+        if page_size > 0 and last - first + 1 > page_size - taken:
+            last = first + page_size - taken - 1
+        if first <= last:
+            columns = [column[first - 1:last] for column in list_columns(index, script)]
+            window = last - first + 1
+            if filtered and window * int(bulk[1]) < ITEMS:
+                # ids come from the matched list; each reminder is resolved, then read
+                cost += EVENT_S * window * len(columns)
+                cost += VALUE_S * window * (len(columns) - 1)
+            elif filtered:
+                cost += EVENT_S * (len(columns) - 1) + VALUE_S * ITEMS * (len(columns) - 1)
+            else:
+                cost += EVENT_S * len(columns) + VALUE_S * window * len(columns)
+            output.append(RS.join([LISTS[index], str(window), *(US.join(column) for column in columns)]))
+            taken += window
+        if page_size > 0 and taken >= page_size:
+            if last < ITEMS:
+                output.append(f"next:{position}:{last + 1}")
+            elif position < len(indexes):
+                output.append(f"next:{position + 1}:1")
+            break
+    time.sleep(cost)
+    return RS.join(output)
+
+
+def per_item_listing() -> str:
+    # lists and the reminders query, then name/completed/due/body/list name per item
+    time.sleep(EVENT_S * (2 + 5 * ITEMS))
+    notes = (note.replace("\n", "⏎") for note in NOTES)
+    return "\n".join(f"Inbox|{name}|false|missing value|{note}" for name, note in zip(NAMES, notes))
+
+
+def execute(script: str, args: list[str]) -> str:
+    time.sleep(EXEC_S)
+    if "-- per-item listing" in script:
+        return per_item_listing()
+    if "set columns's names to name of" in script:
+        return page_listing(script, args)
+    if "set rNames to name of" in script:
+        return bulk_listing(script, args)
+    if "set listNames to name of lists" in script:
+        time.sleep(EVENT_S * 2)
+        return RS.join(LISTS)
+    if "(count of reminders) as string" in script:
+        indexes = [LISTS.index(args[0])] if args and args[0] else range(len(LISTS))
+        # name of l, then the four counts
+        time.sleep(sum(LIST_S + EVENT_S * 5 for _ in indexes))
+        return RS.join(RS.join([LISTS[index], str(ITEMS), str(ITEMS), "0", "0"]) for index in indexes)
+    if "modification date of reminders" in script:
+        time.sleep(len(LISTS) * (LIST_S + EVENT_S * 3))
+        return RS.join(
+            RS.join([list_name, US.join(list_ids(index)), US.join(["Monday, 2 March 2026 at 09:00:00"] * ITEMS)])
+            for index, list_name in enumerate(LISTS)
+        )
+    if "repeat with reminderName in rest of argv" in script:
+        time.sleep(LIST_S + EVENT_S * len(args[1:]))
+        index = LISTS.index(args[0])
+        found = dict(zip(list_names(index), list_ids(index)))
+        return RS.join(found.get(name, "") for name in args[1:])
+    batch = re.search(r"repeat with i from 1 to \(count of argv\) by (\d+)", script)
+    if batch:
+        stride = int(batch.group(1))
+        operations = len(args) // stride
+        time.sleep(EVENT_S * 2 * operations)
+        if "set {reminderId, reminderName, listName" in script:
+            # Without an id, a name is searched in its list or in every list.
+            results = []
+            for i in range(0, len(args), stride):
+                reminder_id, name, list_name = args[i:i + 3]
+                if not reminder_id:
+                    time.sleep(LIST_S * (1 if list_name else searched(name)))
+                results.append(f"ok{US}{reminder_id or 'x-apple-reminder://found'}")
+            return RS.join(results)
+        if "make new reminder" in script:
+            return RS.join(
+                f"ok{US}{args[i]}{US}x-apple-reminder://new-{time.monotonic_ns()}-{i}" for i in range(0, len(args), stride)
+            )
+        return RS.join(["ok"] * operations)
+    time.sleep(EVENT_S * 2)
+    return "ok"
+
+
+def install(directory: str) -> None:
+    """Put an ``osascript`` shim running this file first on ``PATH``."""
+    shim = Path(directory) / "osascript"
+    shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{Path(__file__).resolve()}" "$@"\n')
+    shim.chmod(0o755)
+    os.environ["PATH"] = directory + os.pathsep + os.environ["PATH"]
+
+
+def one_shot(argv: list[str]) -> int:
+    script = argv[argv.index("-e") + 1]
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    time.sleep(SPAWN_S + COMPILE_S)
+    print(execute(script, args))
+    return 0
+
+
+def worker() -> int:
+    time.sleep(SPAWN_S)
+    compiled = set()
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["script"] not in compiled:
+            time.sleep(COMPILE_S)
+            compiled.add(request["script"])
+        result = execute(request["script"], request.get("args", []))
+        sys.stdout.write(json.dumps({"result": result}) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        sys.exit(worker())
+    sys.exit(one_shot(sys.argv[1:]))
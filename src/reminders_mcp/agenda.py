@@ -0,0 +1,84 @@
+"""Overdue, today and upcoming reminders, earliest first.
+
+An agenda is built from incomplete reminders due before the end of its
+window, which the Reminders app filters for in the same single read as any
+listing. One pass sorts each reminder into its bucket and keeps only the
+earliest ``limit`` per bucket in a bounded heap, so building it takes
+O(n log limit) time and the response size does not depend on how many
+reminders there are.
+"""
+
+import heapq
+from collections.abc import Iterable
+from datetime import datetime, time, timedelta
+
+# Fields an agenda needs besides id, list and name.
+FIELDS = ("due_date", "priority")
+BUCKETS = ("overdue", "today", "upcoming")
+
+
+def window(now: datetime, days: int) -> dict[str, str]:
+    """Return the ISO bounds of the buckets for ``now`` and ``days`` upcoming days.
+
+    ``today`` starts at ``now`` and ends at midnight; ``upcoming`` covers the
+    following ``days`` whole days and ends at ``end``.
+    """
+    midnight = datetime.combine(now.date(), time()) + timedelta(days=1)
+    return {
+        "now": now.replace(microsecond=0).isoformat(),
+        "tomorrow": midnight.isoformat(),
+        "end": (midnight + timedelta(days=max(days, 0))).isoformat(),
+    }
+
+
+def _key(item: dict) -> tuple:
+    """Earliest due first; at the same time high (1) before medium, low and none (0)."""
+    priority = item.get("priority") or 10
+    return item["due_date"], priority, item["name"], item["id"]
+
+
+class _Latest:
+    """Heap entry ordered backwards, so heap[0] is the latest entry kept."""
+
+    __slots__ = ("key", "item")
+
+    def __init__(self, key: tuple, item: dict):
+        self.key = key
+        self.item = item
+
+    def __lt__(self, other: "_Latest") -> bool:
+        return other.key < self.key
+
+
+def build(items: Iterable[dict], now: datetime, days: int = 7, limit: int = 10) -> dict:
+    """Bucket ``items`` (reminders with ISO ``due_date`` and ``priority``) into an agenda.
+
+    Each bucket holds its ``limit`` earliest reminders (0 = all), in order,
+    and ``counts`` the number of reminders that fell into it. Completed
+    reminders and those without a due date or outside the window are skipped.
+    """
+    bounds = window(now, days)
+    heaps: dict[str, list[_Latest]] = {bucket: [] for bucket in BUCKETS}
+    counts = dict.fromkeys(BUCKETS, 0)
+    for item in items:
+        due = item.get("due_date")
+        if not due or item.get("completed") or due >= bounds["end"]:
+            continue
+        if due < bounds["now"]:
+            bucket = "overdue"
+        elif due < bounds["tomorrow"]:
+            bucket = "today"
+        else:
+            bucket = "upcoming"
+        counts[bucket] += 1
+        heap = heaps[bucket]
+        entry = _Latest(_key(item), item)
+        if limit <= 0 or len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry.key < heap[0].key:
+            heapq.heapreplace(heap, entry)
+    agenda = {
+        bucket: [entry.item for entry in sorted(heap, key=lambda entry: entry.key)]
+        for bucket, heap in heaps.items()
+    }
+    return {**agenda, "counts": counts, "now": bounds["now"]}
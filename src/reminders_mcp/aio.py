@@ -0,0 +1,309 @@
+"""Asyncio counterparts of the reminders functions.
+
+Scripts run through ``asyncio.create_subprocess_exec`` (or the worker pool on
+a thread), so a slow Reminders call never blocks the event loop. Handler
+sources, arguments and output parsing are shared with ``reminders``; reminder
+listings are decoded while osascript output is still being read.
+"""
+
+import asyncio
+import codecs
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+from reminders_mcp import reminders, scheduler, scripts, wire
+from reminders_mcp.record import Reminder
+from reminders_mcp.stats import metrics
+from reminders_mcp.reminders import (
+    COMPLETE_REMINDERS_SCRIPT,
+    COUNT_REMINDERS_SCRIPT,
+    CREATE_REMINDERS_SCRIPT,
+    DELETE_REMINDERS_SCRIPT,
+    FIND_IDS_SCRIPT,
+    GET_LISTS_SCRIPT,
+    UPDATE_REMINDERS_SCRIPT,
+)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+async def run_applescript(script: str, *args: str) -> str:
+    pool = reminders._get_pool()
+    if pool is not None:
+        return await _run_on_pool(pool, script, args)
+    chunks = []
+    await _stream(script, args, chunks.append)
+    return "".join(chunks)
+
+
+async def _run_on_pool(pool, script: str, args) -> str:
+    with metrics.timer("applescript.execute") as sample:
+        output = await asyncio.to_thread(pool.run, script, args)
+        sample.nbytes = len(output.encode())
+    return output
+
+
+async def _stream(script: str, args: tuple[str, ...], on_chunk: Callable[[str], Any]) -> None:
+    """Run ``script`` in a subprocess, passing stdout to ``on_chunk`` as it arrives.
+
+    The newline osascript ends its output with is not passed on, so chunks
+    join up to exactly what the pool would have returned. Time spent in
+    ``on_chunk`` is left out of the execute timer, so callers can count it
+    as parsing.
+    """
+    if scripts.cache_dir() is not None:
+        # Compiling the first time shells out to osacompile.
+        await asyncio.to_thread(scripts.compiled_path, script)
+    with metrics.timer("applescript.spawn"):
+        proc = await asyncio.create_subprocess_exec(
+            *reminders._osascript_command(script, args),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    start = time.perf_counter()
+    in_callback = 0.0
+    nbytes = 0
+    # Drain stderr alongside stdout so a chatty script cannot fill its pipe.
+    stderr_read = asyncio.ensure_future(proc.stderr.read())
+    # A trailing newline is held back until more output follows it, so the
+    # last one can be dropped at the end.
+    held = ""
+    try:
+        while chunk := await proc.stdout.read(STREAM_CHUNK_SIZE):
+            nbytes += len(chunk)
+            text = held + decoder.decode(chunk)
+            held = "\n" if text.endswith("\n") else ""
+            callback_start = time.perf_counter()
+            on_chunk(text.removesuffix(held))
+            in_callback += time.perf_counter() - callback_start
+        on_chunk((held + decoder.decode(b"", final=True)).removesuffix("\n"))
+        stderr = await stderr_read
+        await proc.wait()
+    except BaseException:
+        stderr_read.cancel()
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        metrics.record("applescript.execute", time.perf_counter() - start - in_callback, nbytes, error=True)
+        raise
+    failed = proc.returncode != 0
+    metrics.record("applescript.execute", time.perf_counter() - start - in_callback, nbytes, error=failed)
+    if failed:
+        raise RuntimeError(f"AppleScript error: {stderr.decode().strip()}")
+
+
+async def get_lists() -> list[str]:
+    """Return all reminder list names."""
+    output = await run_applescript(GET_LISTS_SCRIPT)
+    with metrics.timer("applescript.parse"):
+        return reminders._parse_lists(output)
+
+
+async def _fan_out(func: Callable[[str], Awaitable[T]], list_names: list[str]) -> list[T]:
+    """Await ``func(name)`` for each list, at most reminders.FANOUT at once, in list order.
+
+    The caller reads lists in its own scheduler slot; each helper reading
+    alongside it first waits for a slot of its own, so a fan-out never runs
+    more scripts than the scheduler allows. Helpers still waiting when every
+    list has been taken are cancelled.
+    """
+    results: dict[int, T] = {}
+    pending = iter(enumerate(list_names))
+    helping: set[asyncio.Task] = set()
+
+    async def drain() -> None:
+        for index, name in pending:
+            results[index] = await func(name)
+
+    async def helper() -> None:
+        async with scheduler.slot():
+            helping.add(asyncio.current_task())
+            await drain()
+
+    # A failing list cancels the lookups of the others.
+    async with asyncio.TaskGroup() as group:
+        helpers = [group.create_task(helper()) for _ in range(min(reminders.FANOUT, len(list_names)) - 1)]
+        await drain()
+        for task in helpers:
+            if task not in helping:
+                task.cancel()
+    return [results[index] for index in range(len(list_names))]
+
+
+async def get_reminders_page(
+    list_name: str | None = None,
+    include_completed: bool = False,
+    limit: int = 0,
+    cursor: str | None = None,
+    *,
+    due_after: str | None = None,
+    due_before: str | None = None,
+    search: str | None = None,
+    flagged: bool | None = None,
+    priority: int | None = None,
+    fields: Iterable[str] | None = None,
+    notes_max_chars: int = 0,
+) -> tuple[list[Reminder], str | None]:
+    """Async version of reminders.get_reminders_page."""
+    if reminders._fans_out(list_name, limit, cursor):
+        list_names = await get_lists()
+        if reminders._distinct(list_names):
+            fields = reminders._projection(fields)
+
+            async def read(name: str) -> list[Reminder]:
+                items, _ = await get_reminders_page(
+                    name,
+                    include_completed,
+                    due_after=due_after,
+                    due_before=due_before,
+                    search=search,
+                    flagged=flagged,
+                    priority=priority,
+                    fields=fields,
+                    notes_max_chars=notes_max_chars,
+                )
+                return items
+
+            return [item for items in await _fan_out(read, list_names) for item in items], None
+    query, script, args, fields = reminders._page_request(
+        list_name,
+        include_completed,
+        limit,
+        cursor,
+        due_after,
+        due_before,
+        search,
+        flagged,
+        priority,
+        fields,
+        notes_max_chars,
+    )
+    pool = reminders._get_pool()
+    if pool is not None:
+        output = await _run_on_pool(pool, script, args)
+        with metrics.timer("applescript.parse"):
+            return reminders._parse_page(output, query, fields)
+    # Decode each list's block as soon as it has been read.
+    decoder = wire.PageDecoder(fields)
+    rows = []
+    decoding = 0.0
+
+    def feed(chunk: str) -> None:
+        nonlocal decoding
+        start = time.perf_counter()
+        rows.extend(decoder.feed(chunk))
+        decoding += time.perf_counter() - start
+
+    await _stream(script, tuple(args), feed)
+    start = time.perf_counter()
+    rows += decoder.close()
+    page = reminders._page_result(rows, decoder.next_position, query, fields)
+    metrics.record("applescript.parse", decoding + time.perf_counter() - start)
+    return page
+
+
+async def get_counts(list_name: str | None = None) -> dict:
+    """Async version of reminders.get_counts."""
+    output = await run_applescript(COUNT_REMINDERS_SCRIPT, list_name or "")
+    with metrics.timer("applescript.parse"):
+        return reminders._parse_counts(output)
+
+
+async def _run_batch(script: str, operations: list[list[str]]) -> list[list[str]]:
+    if not operations:
+        return []
+    output = await run_applescript(script, *(arg for operation in operations for arg in operation))
+    with metrics.timer("applescript.parse"):
+        return reminders._split_batch(output, len(operations))
+
+
+async def _locate(items: list[dict]) -> list[dict]:
+    """Async version of reminders._locate."""
+    names = reminders._unlocated_names(items)
+    if not names:
+        return items
+    list_names = await get_lists()
+    if not reminders._distinct(list_names):
+        return items
+
+    async def find(list_name: str) -> list[str]:
+        return reminders._parse_found(await run_applescript(FIND_IDS_SCRIPT, list_name, *names), len(names))
+
+    return reminders._located(items, names, list_names, await _fan_out(find, list_names))
+
+
+async def create_reminders(items: list[dict]) -> list[dict]:
+    """Async version of reminders.create_reminders."""
+    return reminders._created(items, await _run_batch(CREATE_REMINDERS_SCRIPT, reminders._create_operations(items)))
+
+
+async def complete_reminders(items: list[dict]) -> list[dict]:
+    """Async version of reminders.complete_reminders."""
+    items = await _locate(items)
+    operations = [reminders._target(item) for item in items]
+    return reminders._batch_results(items, await _run_batch(COMPLETE_REMINDERS_SCRIPT, operations))
+
+
+async def update_reminders(items: list[dict]) -> list[dict]:
+    """Async version of reminders.update_reminders."""
+    items = await _locate(items)
+    return reminders._updated(items, await _run_batch(UPDATE_REMINDERS_SCRIPT, reminders._update_operations(items)))
+
+
+async def delete_reminders(items: list[dict]) -> list[dict]:
+    """Async version of reminders.delete_reminders."""
+    items = await _locate(items)
+    operations = [reminders._target(item) for item in items]
+    return reminders._deleted(items, await _run_batch(DELETE_REMINDERS_SCRIPT, operations))
+
+
+async def create_reminder(
+    name: str, list_name: str | None = None, due_date: str | None = None, notes: str | None = None
+) -> str:
+    """Create a new reminder. Returns the reminder name."""
+    result = (await create_reminders([{"name": name, "list_name": list_name, "due_date": due_date, "notes": notes}]))[0]
+    reminders._single(result)
+    return result["name"]
+
+
+async def complete_reminder(
+    name: str | None = None, list_name: str | None = None, reminder_id: str | None = None
+) -> bool:
+    """Mark a reminder as completed. Returns True on success."""
+    items = [{"name": name, "list_name": list_name, "reminder_id": reminder_id}]
+    return reminders._single((await complete_reminders(items))[0])
+
+
+async def update_reminder(
+    name: str | None = None,
+    list_name: str | None = None,
+    new_name: str | None = None,
+    notes: str | None = None,
+    due_date: str | None = None,
+    reminder_id: str | None = None,
+) -> bool:
+    """Update properties of an existing reminder. Returns True on success."""
+    if new_name is None and notes is None and due_date is None:
+        return True
+
+    item = {
+        "name": name,
+        "list_name": list_name,
+        "new_name": new_name,
+        "notes": notes,
+        "due_date": due_date,
+        "reminder_id": reminder_id,
+    }
+    return reminders._single((await update_reminders([item]))[0])
+
+
+async def delete_reminder(
+    name: str | None = None, list_name: str | None = None, reminder_id: str | None = None
+) -> bool:
+    """Delete a reminder. Returns True on success."""
+    items = [{"name": name, "list_name": list_name, "reminder_id": reminder_id}]
+    return reminders._single((await delete_reminders(items))[0])
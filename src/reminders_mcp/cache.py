@@ -0,0 +1,191 @@
+"""In-process read-through cache for Reminders reads.
+
+Entries expire after a TTL and the least recently used entry is evicted once
+``max_entries`` is reached. Reminder pages are keyed by
+``(list_name, include_completed)`` plus any filters, the page window and the
+projection of fields returned; writes drop only the queries they can affect.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from reminders_mcp.record import Reminder
+
+LISTS_KEY = ("lists",)
+
+
+class ReminderCache:
+    """TTL + LRU cache of ``get_lists``/``get_reminders`` results."""
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 128, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._clock = clock
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        # Bumped on every invalidation so a read that started before a write
+        # never stores its (possibly stale) result afterwards.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get_lists(self, loader: Callable[[], list[str]]) -> list[str]:
+        return self._get(LISTS_KEY, loader)
+
+    def get_reminders(
+        self,
+        list_name: str | None,
+        include_completed: bool,
+        loader: Callable[[], tuple[list[Reminder], str | None]],
+        limit: int = 0,
+        cursor: str | None = None,
+        filters: tuple = (),
+        projection: tuple = (),
+    ) -> tuple[list[Reminder], str | None]:
+        """Return a cached ``(reminders, next_cursor)`` page, loading it on a miss.
+
+        ``filters`` holds the active filters as hashable ``(name, value)`` pairs
+        and ``projection`` anything else that shapes the returned items.
+        """
+        return self._get(("reminders", list_name, include_completed, filters, limit, cursor, projection), loader)
+
+    async def get_lists_async(self, loader: Callable[[], Awaitable[list[str]]]) -> list[str]:
+        return await self._get_async(LISTS_KEY, loader)
+
+    async def get_reminders_async(
+        self,
+        list_name: str | None,
+        include_completed: bool,
+        loader: Callable[[], Awaitable[tuple[list[Reminder], str | None]]],
+        limit: int = 0,
+        cursor: str | None = None,
+        filters: tuple = (),
+        projection: tuple = (),
+    ) -> tuple[list[Reminder], str | None]:
+        """Like get_reminders, for an async ``loader``."""
+        return await self._get_async(
+            ("reminders", list_name, include_completed, filters, limit, cursor, projection), loader
+        )
+
+    def _get(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return loader()
+        hit, value, generation = self._lookup(key)
+        if hit:
+            return value
+        return self._store(key, loader(), generation)
+
+    async def _get_async(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.enabled:
+            return await loader()
+        hit, value, generation = self._lookup(key)
+        if hit:
+            return value
+        return self._store(key, await loader(), generation)
+
+    def _lookup(self, key: tuple) -> tuple[bool, Any, int]:
+        """Return ``(hit, value, generation)``; pass the generation to _store on a miss."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1], self._generation
+            self.misses += 1
+            return False, None, self._generation
+
+    def _store(self, key: tuple, value: Any, generation: int) -> Any:
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def reminder_created(self, list_name: str | None) -> None:
+        """Drop listings that a new reminder in ``list_name`` would appear in.
+
+        ``None`` means the default list, whose name is unknown here, so every
+        reminder listing is dropped.
+        """
+        self._drop(lambda key, value: key[0] == "reminders" and (list_name is None or key[1] in (None, list_name)))
+
+    def reminder_changed(self, name: str | None, list_name: str | None, reminder_id: str | None = None) -> None:
+        """Drop queries with a page containing the reminder.
+
+        The reminder matches by ``reminder_id``, or by ``name`` (in
+        ``list_name``, if given).
+
+        Use for completions and deletions, which can only affect queries the
+        reminder already appears in. Every page of an affected query goes,
+        since removing an item shifts the pages after it.
+        """
+        with self._lock:
+            queries = {
+                key[1:4] for key, (_, value) in self._entries.items()
+                if key[0] == "reminders" and any(
+                    (reminder_id is not None and item.get("id") == reminder_id)
+                    or (item["name"] == name and (list_name is None or item["list"] == list_name))
+                    for item in value[0]
+                )
+            }
+        self._drop(lambda key, value: key[0] == "reminders" and key[1:4] in queries)
+
+    def reminder_updated(self, name: str | None, list_name: str | None, reminder_id: str | None = None) -> None:
+        """Like reminder_changed, but also drop filtered queries on affected lists.
+
+        A new name, notes or due date can make the reminder match a filter it
+        did not match before.
+        """
+        self.reminder_changed(name, list_name, reminder_id)
+        self._drop(
+            lambda key, value: key[0] == "reminders" and bool(key[3])
+            and (list_name is None or key[1] in (None, list_name))
+        )
+
+    def lists_changed(self, names: Iterable[str]) -> None:
+        """Drop the list names and every listing that covers one of ``names``.
+
+        Use when lists changed outside this server, so it is unknown which
+        reminders did.
+        """
+        names = set(names)
+        self._drop(
+            lambda key, value: key == LISTS_KEY
+            or (key[0] == "reminders" and (key[1] is None or key[1] in names))
+        )
+
+    def clear(self) -> None:
+        self._drop(lambda key, value: True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "ttl_seconds": self.ttl,
+                "max_entries": self.max_entries,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+    def _drop(self, predicate: Callable[[tuple, Any], bool]) -> None:
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
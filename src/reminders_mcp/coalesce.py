@@ -0,0 +1,52 @@
+"""Single-flight coalescing of identical concurrent reads.
+
+While a read for some key is in flight, further reads for the same key await
+its result instead of starting another osascript run. Writes call barrier()
+when they complete, which starts a new generation: reads arriving after that
+never join a call that began before the write, so no read returns data older
+than a completed write.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one execution among concurrent callers with the same key."""
+
+    def __init__(self):
+        self._calls: dict[tuple[int, Hashable], asyncio.Future] = {}
+        self._generation = 0
+        self.executed = 0
+        self.shared = 0
+
+    def barrier(self) -> None:
+        """Stop later callers from joining calls that are already in flight."""
+        self._generation += 1
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Await ``func(*args, **kwargs)``, or the identical call already in flight."""
+        flight = (self._generation, key)
+        future = self._calls.get(flight)
+        if future is not None:
+            self.shared += 1
+        else:
+            self.executed += 1
+            future = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[flight] = future
+            future.add_done_callback(lambda done: self._finish(flight, done))
+        # One caller giving up must not cancel the call for the others.
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict:
+        return {"executed": self.executed, "shared": self.shared, "in_flight": len(self._calls)}
+
+    def _finish(self, flight: tuple[int, Hashable], future: asyncio.Future) -> None:
+        if self._calls.get(flight) is future:
+            del self._calls[flight]
+        if not future.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled.
+            future.exception()
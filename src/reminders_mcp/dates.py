@@ -0,0 +1,58 @@
+"""Due dates as ISO 8601 text, independent of the Mac's locale.
+
+Handlers emit dates through AppleScript's ``«class isot»`` coercion, which
+yields local time as "2026-02-27T09:00:00" whatever the system language, and
+build dates from that same format with ``asDate`` instead of ``date "..."``.
+Local ISO text sorts chronologically, so listings can be ordered and
+range-filtered as plain strings.
+
+Caller input may be any ISO 8601 form Python understands ("2026-02-27",
+"2026-02-27T09:00", "2026-02-27T08:00:00Z", ...). It is normalised to the
+handlers' format, converting offsets to local time. Anything else is passed
+through for AppleScript to parse in the Mac's locale, as before.
+"""
+
+import functools
+from datetime import datetime
+
+# Handler appended to scripts that take dates. Values in the handlers' ISO
+# format are assembled field by field; the day is reset first so changing the
+# month can never overflow into the next one.
+AS_DATE_HANDLER = """
+on asDate(s)
+    if (length of s) is 19 and character 5 of s is "-" and character 11 of s is "T" then
+        set d to current date
+        set day of d to 1
+        set year of d to (text 1 thru 4 of s) as integer
+        set month of d to (text 6 thru 7 of s) as integer
+        set day of d to (text 9 thru 10 of s) as integer
+        set time of d to ((text 12 thru 13 of s) as integer) * 3600 + ((text 15 thru 16 of s) as integer) * 60 + ((text 18 thru 19 of s) as integer)
+        return d
+    end if
+    return date s
+end asDate
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_iso(value: str) -> str | None:
+    """Return ``value`` in the handlers' ISO format, or None if it is not ISO 8601."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.replace(microsecond=0).isoformat()
+
+
+def to_script(value: str | None) -> str:
+    """Return the handler argument for a caller-supplied date ("" for none)."""
+    if not value:
+        return ""
+    return parse_iso(value) or value
+
+
+def from_script(value: str) -> str | None:
+    """Return the due date in handler output as ISO text, or None if unset."""
+    return value if value and value != "missing value" else None
@@ -0,0 +1,312 @@
+"""Local SQLite mirror of all lists and reminders.
+
+A sync reads every list's reminder ids (one Apple event per list) plus the
+full properties of only those reminders modified since the previous sync's
+watermark. Reminders whose ids no longer appear are deleted, so after a sync
+the mirror matches the app and listings can be answered with a local query.
+"""
+
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+
+from reminders_mcp import dates, reminders, wire
+from reminders_mcp.record import Reminder
+from reminders_mcp.wire import US
+
+# Output: the time the sync started, then one block of ten fields per list:
+#
+#     list name, all ids, changed count, then the id, name, completed,
+#     due date, notes, flagged and priority columns of changed reminders
+#
+# Times and due dates are local ISO 8601 text, see dates.py.
+#
+# %(changed)s is ``reminders`` for a full sync, or the reminders modified at
+# or after the watermark passed as the only argument. The start time becomes
+# the next watermark, so edits made while a sync runs are fetched again.
+SYNC_TEMPLATE = """
+on run argv
+    set {watermark} to argv
+    set syncTime to (current date) as «class isot» as string
+    if watermark is not "" then set watermark to my asDate(watermark)
+    set RS to character id 30
+    set US to character id 31
+    script columns
+        property bodies : {}
+        property dues : {}
+    end script
+    set output to {syncTime}
+    tell application "Reminders"
+        repeat with l in lists
+            set rList to name of l
+            tell l
+                set allIds to id of reminders
+                set rIds to id of %(changed)s
+                set rNames to name of %(changed)s
+                set rCompleted to completed of %(changed)s
+                set columns's dues to due date of %(changed)s
+                set columns's bodies to body of %(changed)s
+                set rFlagged to flagged of %(changed)s
+                set rPriority to priority of %(changed)s
+            end tell
+            repeat with i from 1 to count of columns's bodies
+                if item i of columns's bodies is missing value then set item i of columns's bodies to ""
+                set d to item i of columns's dues
+                if d is missing value then
+                    set item i of columns's dues to ""
+                else
+                    set item i of columns's dues to (d as «class isot» as string)
+                end if
+            end repeat
+            set AppleScript's text item delimiters to US
+            set end of output to rList
+            set end of output to allIds as string
+            set end of output to (count of rIds) as string
+            set end of output to rIds as string
+            set end of output to rNames as string
+            set end of output to rCompleted as string
+            set end of output to (columns's dues) as string
+            set end of output to (columns's bodies) as string
+            set end of output to rFlagged as string
+            set end of output to rPriority as string
+            set AppleScript's text item delimiters to ""
+        end repeat
+    end tell
+    set AppleScript's text item delimiters to RS
+    set output to output as string
+    set AppleScript's text item delimiters to ""
+    return output
+end run
+""" + dates.AS_DATE_HANDLER
+
+FULL_SYNC_SCRIPT = SYNC_TEMPLATE % {"changed": "reminders"}
+DELTA_SYNC_SCRIPT = SYNC_TEMPLATE % {"changed": "(reminders whose modification date ≥ watermark)"}
+
+BLOCK_WIDTH = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS lists (position INTEGER PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS reminders (
+    id TEXT PRIMARY KEY,
+    list TEXT NOT NULL,
+    list_position INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    due_date TEXT,
+    notes TEXT,
+    flagged INTEGER NOT NULL,
+    priority INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reminders_order ON reminders (list_position, position);
+"""
+
+# Bumped when stored values change format. A mirror in another format is
+# emptied on open, so its next sync is a full one.
+FORMAT = "2"
+
+
+class Mirror:
+    """SQLite copy of the Reminders database, refreshed by delta syncs."""
+
+    def __init__(self, path: str | Path, clock: Callable[[], float] = time.monotonic):
+        self.path = str(path)
+        self._clock = clock
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        with self._db:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+            if row is None or row[0] != FORMAT:
+                self._db.executescript("DELETE FROM reminders; DELETE FROM lists; DELETE FROM meta;")
+                self._db.execute("INSERT INTO meta VALUES ('format', ?)", (FORMAT,))
+        self._lock = threading.Lock()
+        self._synced_at: float | None = None
+
+    def close(self) -> None:
+        self._db.close()
+
+    @property
+    def watermark(self) -> str | None:
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'watermark'").fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Whether this process synced within the last ``max_age`` seconds."""
+        return self._synced_at is not None and self._clock() - self._synced_at < max_age
+
+    def mark_stale(self) -> None:
+        """Force the next is_fresh() check to fail, e.g. after a write."""
+        self._synced_at = None
+
+    def sync_request(self) -> tuple[str, list[str]]:
+        """Return the handler source and arguments for the next sync."""
+        watermark = self.watermark
+        if watermark is None:
+            return FULL_SYNC_SCRIPT, [""]
+        return DELTA_SYNC_SCRIPT, [watermark]
+
+    def sync(self) -> dict:
+        """Run a sync through ``reminders`` and apply it."""
+        script, args = self.sync_request()
+        return self.apply(reminders._run_applescript(script, *args))
+
+    def apply(self, output: str) -> dict:
+        """Apply sync output; returns counts of changed and deleted reminders."""
+        fields = list(wire.iter_fields([output]))
+        if not fields:
+            raise RuntimeError("AppleScript error: empty sync output")
+        sync_time, fields = fields[0], fields[1:]
+        lists, positions, changed = [], {}, []
+        for list_position, start in enumerate(range(0, len(fields) - len(fields) % BLOCK_WIDTH, BLOCK_WIDTH)):
+            list_name, all_ids, count, *columns = fields[start:start + BLOCK_WIDTH]
+            if not count.isdigit():
+                raise RuntimeError(f"AppleScript error: malformed sync block for list {list_name!r}")
+            # An empty column is one empty value unless nothing changed.
+            columns = [column.split(US) if int(count) else [] for column in columns]
+            if any(len(column) != int(count) for column in columns):
+                raise RuntimeError(f"AppleScript error: malformed sync block for list {list_name!r}")
+            lists.append((list_position, list_name))
+            for position, reminder_id in enumerate(all_ids.split(US) if all_ids else []):
+                positions[reminder_id] = (list_name, list_position, position)
+            for reminder_id, name, done, due, notes, flagged, priority in zip(*columns):
+                # A reminder added between the two reads is placed at the end.
+                place = positions.setdefault(reminder_id, (list_name, list_position, len(positions)))
+                changed.append((
+                    reminder_id,
+                    *place,
+                    name,
+                    done == "true",
+                    dates.from_script(due),
+                    notes or None,
+                    flagged == "true",
+                    int(priority or 0),
+                ))
+        with self._lock, self._db:
+            db = self._db
+            known = {row[0]: row[1:] for row in db.execute("SELECT id, list, list_position, position FROM reminders")}
+            deleted = [(reminder_id,) for reminder_id in known.keys() - positions.keys()]
+            db.executemany("DELETE FROM reminders WHERE id = ?", deleted)
+            db.executemany(
+                "INSERT OR REPLACE INTO reminders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", changed
+            )
+            # Reminders that merely moved (or whose list was renamed) keep
+            # their properties and only get a new position.
+            fetched = {row[0] for row in changed}
+            moved = [
+                (*place, reminder_id)
+                for reminder_id, place in positions.items()
+                if reminder_id not in fetched and reminder_id in known and known[reminder_id] != place
+            ]
+            db.executemany("UPDATE reminders SET list = ?, list_position = ?, position = ? WHERE id = ?", moved)
+            db.execute("DELETE FROM lists")
+            db.executemany("INSERT INTO lists VALUES (?, ?)", lists)
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('watermark', ?)", (sync_time,))
+        reminders.name_index.add_many((row[4], row[1], row[0]) for row in changed)
+        self._synced_at = self._clock()
+        return {"changed": len(changed), "deleted": len(deleted), "lists": len(lists)}
+
+    def get_lists(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT name FROM lists ORDER BY position")]
+
+    def get_counts(self, list_name: str | None = None, now: str | None = None) -> dict:
+        """Like reminders.get_counts; reminders due before ``now`` (ISO) are overdue."""
+        now = now or datetime.now().replace(microsecond=0).isoformat()
+        sql = """
+            SELECT l.name, COUNT(r.id),
+                   COALESCE(SUM(NOT r.completed), 0),
+                   COALESCE(SUM(NOT r.completed AND r.due_date < ?), 0),
+                   COALESCE(SUM(NOT r.completed AND r.flagged), 0)
+            FROM lists l LEFT JOIN reminders r ON r.list_position = l.position
+            WHERE ? = '' OR l.name = ?
+            GROUP BY l.position ORDER BY l.position
+        """
+        with self._lock:
+            rows = self._db.execute(sql, (now, list_name or "", list_name or "")).fetchall()
+        return reminders._counts_result(rows)
+
+    def get_reminders_page(
+        self,
+        list_name: str | None = None,
+        include_completed: bool = False,
+        limit: int = 0,
+        cursor: str | None = None,
+        *,
+        due_after: str | None = None,
+        due_before: str | None = None,
+        search: str | None = None,
+        flagged: bool | None = None,
+        priority: int | None = None,
+        fields: Iterable[str] | None = None,
+        notes_max_chars: int = 0,
+    ) -> tuple[list[Reminder], str | None]:
+        """Like reminders.get_reminders_page, answered from the mirror.
+
+        Due dates must be ISO 8601 here; they are compared as local ISO text.
+        Cursors are offsets into this query and are not interchangeable with
+        cursors of live listings.
+        """
+        fields = reminders._projection(fields)
+        due_after, due_before = (_iso_bound(value) for value in (due_after, due_before))
+        query = ("mirror", list_name or "", include_completed, due_after, due_before, search, flagged, priority)
+        offset = reminders._decode_cursor(cursor, query)[1] if cursor else 0
+        sql = ["SELECT id, list, name, completed, due_date, notes, flagged, priority FROM reminders WHERE 1"]
+        params: list = []
+        if list_name:
+            sql.append("AND list = ?")
+            params.append(list_name)
+        if not include_completed:
+            sql.append("AND NOT completed")
+        if due_after:
+            sql.append("AND due_date >= ?")
+            params.append(due_after)
+        if due_before:
+            sql.append("AND due_date < ?")
+            params.append(due_before)
+        if search:
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            sql.append("AND (name LIKE ? ESCAPE '\\' OR notes LIKE ? ESCAPE '\\')")
+            params += [pattern, pattern]
+        if flagged is not None:
+            sql.append("AND flagged = ?")
+            params.append(flagged)
+        if priority is not None:
+            sql.append("AND priority = ?")
+            params.append(priority)
+        sql.append("ORDER BY list_position, position LIMIT ? OFFSET ?")
+        params += [limit + 1 if limit > 0 else -1, offset]
+        with self._lock:
+            rows = self._db.execute(" ".join(sql), params).fetchall()
+        next_cursor = None
+        if limit > 0 and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = reminders._encode_cursor(query, 0, offset + limit)
+        items = [
+            Reminder(
+                fields,
+                reminder_id,
+                sys.intern(rlist),
+                name,
+                bool(done),
+                due,
+                reminders._truncate(notes, notes_max_chars),
+                bool(is_flagged),
+                rpriority,
+            )
+            for reminder_id, rlist, name, done, due, notes, is_flagged, rpriority in rows
+        ]
+        return items, next_cursor
+
+
+def _iso_bound(value: str | None) -> str | None:
+    if not value:
+        return None
+    iso = dates.parse_iso(value)
+    if iso is None:
+        raise ValueError(f"Mirror queries need ISO 8601 dates, got {value!r}")
+    return iso
@@ -0,0 +1,131 @@
+"""Pool of long-lived AppleScript runner processes.
+
+Each worker is a persistent process (by default ``osascript`` running
+``runner.js``) that reads one JSON request per line on stdin and writes one
+JSON response per line on stdout:
+
+    -> {"script": "<AppleScript source>", "args": ["arg1", ...]}
+    <- {"result": "<text>"}  or  {"error": "<message>"}
+
+Workers keep compiled scripts for their whole lifetime, so a call costs one
+pipe round trip instead of a process spawn plus a compile.
+"""
+
+import json
+import os
+import queue
+import shlex
+import subprocess
+from importlib.resources import files
+
+from reminders_mcp.stats import metrics
+
+RUNNER_SCRIPT = files("reminders_mcp") / "runner.js"
+
+
+def default_command() -> list[str]:
+    """Return the worker command, honouring ``REMINDERS_MCP_RUNNER``."""
+    override = os.environ.get("REMINDERS_MCP_RUNNER")
+    if override:
+        return shlex.split(override)
+    return ["osascript", "-l", "JavaScript", str(RUNNER_SCRIPT)]
+
+
+class WorkerCrashed(RuntimeError):
+    """The runner process exited or closed its pipes.
+
+    ``sent`` tells whether the request may already have reached the worker.
+    """
+
+    def __init__(self, message: str, sent: bool):
+        super().__init__(message)
+        self.sent = sent
+
+
+class Worker:
+    """A single runner process, started lazily and restarted after a crash."""
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self._proc: subprocess.Popen | None = None
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            with metrics.timer("applescript.spawn"):
+                self._proc = subprocess.Popen(
+                    self.command,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding="utf-8",
+                )
+        return self._proc
+
+    def call(self, request: dict) -> dict:
+        """Send one request and wait for its response."""
+        proc = self._ensure_started()
+        line = json.dumps(request) + "\n"
+        try:
+            proc.stdin.write(line)
+            proc.stdin.flush()
+        except (BrokenPipeError, OSError) as exc:
+            self.close()
+            raise WorkerCrashed("AppleScript runner exited before accepting the request", sent=False) from exc
+        response = proc.stdout.readline()
+        if not response:
+            self.close()
+            raise WorkerCrashed("AppleScript runner exited while running the request", sent=True)
+        return json.loads(response)
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        for stream in (proc.stdin, proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+class WorkerPool:
+    """Fixed-size pool of runner workers shared by all threads."""
+
+    def __init__(self, size: int, command: list[str] | None = None):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.size = size
+        self._workers = [Worker(command or default_command()) for _ in range(size)]
+        self._idle: queue.Queue[Worker] = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def run(self, script: str, args: list[str] | tuple[str, ...] = ()) -> str:
+        """Run ``script`` with ``args`` on an idle worker and return its output."""
+        request = {"script": script, "args": list(args)}
+        worker = self._idle.get()
+        try:
+            try:
+                response = worker.call(request)
+            except WorkerCrashed as crash:
+                # Only retry when the request never reached the old process;
+                # otherwise a mutation could be applied twice.
+                if crash.sent:
+                    raise RuntimeError(f"AppleScript error: {crash}") from crash
+                response = worker.call(request)
+        finally:
+            self._idle.put(worker)
+        if "error" in response:
+            raise RuntimeError(f"AppleScript error: {response['error']}")
+        return response.get("result", "")
+
+    def close(self) -> None:
+        """Stop all worker processes. Workers restart on the next call."""
+        for worker in self._workers:
+            worker.close()
@@ -0,0 +1,67 @@
+"""Compact record type for reminders read from the app or the mirror.
+
+Listings of the whole database hold tens of thousands of reminders, in flight
+and in the cache. A dict per reminder spends most of its memory on its hash
+table; a Reminder keeps its values in slots and shares one tuple of field
+names with the rest of its page. List names are interned when decoded, so
+all reminders of a list refer to one string.
+
+Reminders are read-only mappings of the fields that were read, so code
+written against dicts keeps working and they compare equal to the dicts
+they stand for. Tools turn them into plain dicts with to_dict() when they
+hand their results to MCP.
+"""
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+# Every field a Reminder can hold, in output order.
+FIELDS = ("id", "list", "name", "completed", "due_date", "notes", "flagged", "priority")
+
+
+class Reminder(Mapping):
+    """One reminder; ``fields`` names the values that were read, in FIELDS order."""
+
+    __slots__ = ("fields", *FIELDS)
+
+    def __init__(
+        self,
+        fields: tuple[str, ...],
+        reminder_id: str,
+        list_name: str,
+        name: str,
+        completed: bool = False,
+        due_date: str | None = None,
+        notes: str | None = None,
+        flagged: bool = False,
+        priority: int = 0,
+    ):
+        self.fields = fields
+        self.id = reminder_id
+        self.list = list_name
+        self.name = name
+        self.completed = completed
+        self.due_date = due_date
+        self.notes = notes
+        self.flagged = flagged
+        self.priority = priority
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __repr__(self) -> str:
+        return f"Reminder({self.to_dict()!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in self.fields}
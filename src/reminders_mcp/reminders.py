@@ -1,220 +1,1047 @@
 """macOS Reminders interface via AppleScript."""
 
+import base64
+import hashlib
+import json
+import os
 import subprocess
-from datetime import datetime
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
+from reminders_mcp import dates, scripts, wire
+from reminders_mcp.pool import WorkerPool
+from reminders_mcp.record import FIELDS as REMINDER_FIELDS
+from reminders_mcp.record import Reminder
+from reminders_mcp.stats import metrics
+from reminders_mcp.wire import RS, US
 
-def _run_applescript(script: str) -> str:
-    result = subprocess.run(
-        ["osascript", "-e", script],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"AppleScript error: {result.stderr.strip()}")
-    return result.stdout.strip()
+_pool: WorkerPool | None = None
+_pool_configured = False
+_pool_lock = threading.RLock()
 
+T = TypeVar("T")
 
-def get_lists() -> list[str]:
-    """Return all reminder list names."""
-    script = """
-        tell application "Reminders"
-            set listNames to {}
-            repeat with l in lists
-                set end of listNames to name of l
-            end repeat
-            return listNames
-        end tell
-    """
-    output = _run_applescript(script)
-    if not output:
-        return []
-    return [name.strip() for name in output.split(",")]
+# Reads of all lists and name lookups across lists can instead run one script
+# per list, at most FANOUT at a time, so their wall time follows the slowest
+# list rather than the sum over all lists. 0 or 1 keeps one sequential script.
+FANOUT = int(os.environ.get("REMINDERS_MCP_FANOUT") or 0)
 
 
-def get_reminders(list_name: str | None = None, include_completed: bool = False) -> list[dict]:
-    """Return reminders, optionally filtered by list."""
-    if list_name:
-        target = f'list "{list_name}"'
-    else:
-        target = "lists"
+def configure_pool(size: int, command: list[str] | None = None) -> None:
+    """Route AppleScript calls through ``size`` persistent workers (0 disables)."""
+    global _pool, _pool_configured
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = WorkerPool(size, command) if size > 0 else None
+        _pool_configured = True
+
+
+def _get_pool() -> WorkerPool | None:
+    if not _pool_configured:
+        with _pool_lock:
+            if not _pool_configured:
+                configure_pool(int(os.environ.get("REMINDERS_MCP_WORKERS") or 0))
+    return _pool
+
+
+def _osascript_command(script: str, args: tuple[str, ...]) -> list[str]:
+    compiled = scripts.compiled_path(script)
+    if compiled is not None:
+        return ["osascript", str(compiled), *args]
+    command = ["osascript", "-e", script]
+    if args:
+        command += ["--", *args]
+    return command
 
-    completed_filter = "" if include_completed else "whose completed is false"
 
-    script = f"""
-        tell application "Reminders"
-            set output to ""
-            if "{list_name or ""}" is not "" then
-                set theList to {{list "{list_name or ""}"}}
-            else
-                set theList to lists
+def _run_applescript(script: str, *args: str) -> str:
+    pool = _get_pool()
+    command = None if pool is not None else _osascript_command(script, args)
+    with metrics.timer("applescript.execute") as sample:
+        if pool is not None:
+            output = pool.run(script, args)
+        else:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"AppleScript error: {result.stderr.strip()}")
+            # Drop only the one newline osascript appends: a note may end in
+            # newlines of its own, and RS/US count as whitespace for strip().
+            output = result.stdout.removesuffix("\n")
+        sample.nbytes = len(output.encode())
+    return output
+
+
+# Handlers are fixed ``on run argv`` scripts: user input only ever arrives as
+# arguments, so the script text is identical across calls and compiles once.
+
+# Output formats are described in wire.py.
+
+GET_LISTS_SCRIPT = """
+    tell application "Reminders" to set listNames to name of lists
+    set AppleScript's text item delimiters to character id 30
+    set output to listNames as string
+    set AppleScript's text item delimiters to ""
+    return output
+"""
+
+# Output is a flat sequence of fields separated by RS (character id 30). Each
+# list in the window contributes a block of fields:
+#
+#     list name, item count, ids, names, then the completed flags, due dates
+#     (ISO 8601, see dates.py), notes, flagged flags and priorities columns
+#     of the requested fields
+#
+# where the columns hold ``count`` values separated by US (character id 31).
+# When a page stops early a final "next:<list>:<offset>" field tells where the
+# following page starts.
+#
+# Each list's share of the page is worked out before any property is read,
+# so a page costs the same wherever it falls in a list of any size:
+#
+# - Without filters the list is counted, then each column of just the page
+#   is fetched with one Apple event over an element range ("name of
+#   reminders 101 thru 150").
+# - With filters Reminders evaluates the ``whose`` clause and returns only
+#   the ids of the matching reminders. Unless they far outnumber the page
+#   (see _BULK_RATIO) each column is fetched with one event over the filter
+#   and cut to the page; otherwise only the reminders of the page are read,
+#   by id.
+#   Either way a page costs at most a few events per reminder it holds.
+#
+# %(count)s, %(fetch)s, %(prepare)s and %(emit)s are filled in by
+# _page_script() for the filter and the requested fields. Filter values
+# arrive as arguments; each distinct combination of filters and fields
+# compiles once.
+GET_REMINDERS_TEMPLATE = """
+on run argv
+    set {listName, startList, startOffset, pageSize, dueAfter, dueBefore, searchText, wantPriority, notesMax} to argv
+    if dueAfter is not "" then set dueAfter to my asDate(dueAfter)
+    if dueBefore is not "" then set dueBefore to my asDate(dueBefore)
+    if wantPriority is not "" then set wantPriority to wantPriority as integer
+    set startList to startList as integer
+    set startOffset to startOffset as integer
+    set pageSize to pageSize as integer
+    set notesMax to notesMax as integer
+    set RS to character id 30
+    set US to character id 31
+    -- Lists held in script properties give constant-time item access.
+    script columns
+        property matched : {}
+        property ids : {}
+        property names : {}
+        property completeds : {}
+        property dues : {}
+        property dueValues : {}
+        property bodies : {}
+        property noteValues : {}
+        property flags : {}
+        property priorities : {}
+    end script
+    set output to {}
+    set taken to 0
+    tell application "Reminders"
+        if listName is "" then
+            set theLists to lists
+        else
+            set theLists to {list listName}
+        end if
+        set listCount to count of theLists
+        repeat with listIndex from startList to listCount
+            set l to item listIndex of theLists
+            set rList to name of l
+            tell l
+%(count)s
+            end tell
+            set firstIndex to 1
+            if listIndex = startList then set firstIndex to startOffset
+            set lastIndex to total
+            if pageSize > 0 and lastIndex - firstIndex + 1 > pageSize - taken then
+                set lastIndex to firstIndex + pageSize - taken - 1
             end if
-            repeat with l in theList
-                repeat with r in (reminders of l {completed_filter})
-                    set rName to name of r
-                    set rCompleted to completed of r as string
-                    set rDue to ""
+            if firstIndex ≤ lastIndex then
+                tell l
+%(fetch)s
+                end tell
+%(prepare)s
+                set AppleScript's text item delimiters to US
+                set end of output to rList
+                set end of output to (lastIndex - firstIndex + 1) as string
+                set end of output to (columns's ids) as string
+                set end of output to (columns's names) as string
+%(emit)s
+                set AppleScript's text item delimiters to ""
+                set taken to taken + (lastIndex - firstIndex + 1)
+            end if
+            if pageSize > 0 and taken ≥ pageSize then
+                if lastIndex < total then
+                    set end of output to "next:" & listIndex & ":" & (lastIndex + 1)
+                else if listIndex < listCount then
+                    set end of output to "next:" & (listIndex + 1) & ":1"
+                end if
+                exit repeat
+            end if
+        end repeat
+    end tell
+    set AppleScript's text item delimiters to RS
+    set output to output as string
+    set AppleScript's text item delimiters to ""
+    return output
+end run
+""" + dates.AS_DATE_HANDLER
+
+# Per field: the reminder property read, the ``columns`` property holding the
+# page's values of it, the loop turning those into text (if needed) and the
+# property emitted.
+_PAGE_COLUMNS = {
+    "id": ("id", "ids", "", "ids"),
+    "name": ("name", "names", "", "names"),
+    "completed": ("completed", "completeds", "", "completeds"),
+    "due_date": (
+        "due date",
+        "dues",
+        # Due dates leave as local ISO 8601 text, see dates.py.
+        """                set columns's dueValues to {}
+                repeat with i from 1 to count of columns's dues
+                    set d to item i of columns's dues
+                    if d is missing value then
+                        set end of columns's dueValues to ""
+                    else
+                        set end of columns's dueValues to (d as «class isot» as string)
+                    end if
+                end repeat""",
+        "dueValues",
+    ),
+    "notes": (
+        "body",
+        "bodies",
+        # Missing notes become empty strings, and with notesMax > 0 longer
+        # notes are cut before they are written to the output.
+        """                set columns's noteValues to {}
+                repeat with i from 1 to count of columns's bodies
+                    set n to item i of columns's bodies
+                    if n is missing value then set n to ""
+                    if notesMax > 0 and (length of n) > notesMax then set n to (text 1 thru notesMax of n) & "…"
+                    set end of columns's noteValues to n
+                end repeat""",
+        "noteValues",
+    ),
+    "flagged": ("flagged", "flags", "", "flags"),
+    "priority": ("priority", "priorities", "", "priorities"),
+}
+
+_INDENT = " " * 20
+# Rough cost of one Apple event and of one value carried in a reply. A
+# filtered page of n matches read by id takes a few events per reminder; read
+# over the filter, each column takes one event but carries every match. Whole
+# columns are cheaper while the matches number fewer than n times
+# _BULK_RATIO, the values one event costs as much as.
+_EVENT_MS = 0.2
+_VALUE_MS = 0.002
+_BULK_RATIO = round(_EVENT_MS / _VALUE_MS)
+
+
+def _fetch_columns(columns: list[str], source: str, indent: str = _INDENT) -> str:
+    """Statements reading each column of ``source`` with one Apple event."""
+    return "\n".join(
+        f"{indent}set columns's {_PAGE_COLUMNS[field][1]} to {_PAGE_COLUMNS[field][0]} of {source}"
+        for field in columns
+    )
+
+
+def _page_script(whose: str, fields: tuple[str, ...]) -> str:
+    """Return the get_reminders handler fetching ``fields`` of the reminders in ``whose``."""
+    optional = [field for field in wire.OPTIONAL_FIELDS if field in fields]
+    if whose == "reminders":
+        count = "                set total to count of reminders"
+        fetch = _fetch_columns(["id", "name", *optional], "reminders firstIndex thru lastIndex")
+    else:
+        count = f"""\
+                set columns's matched to id of {whose}
+                set total to count of columns's matched"""
+        inner = _INDENT + "    "
+        fetch = "\n".join([
+            f"{_INDENT}set columns's ids to items firstIndex thru lastIndex of columns's matched",
+            f"{_INDENT}if (lastIndex - firstIndex + 1) * {_BULK_RATIO} ≥ total then",
+            _fetch_columns(["name", *optional], whose, inner),
+            *(
+                f"{inner}set columns's {_PAGE_COLUMNS[field][1]} to "
+                f"items firstIndex thru lastIndex of columns's {_PAGE_COLUMNS[field][1]}"
+                for field in ["name", *optional]
+            ),
+            f"{_INDENT}else",
+            *(f"{inner}set columns's {_PAGE_COLUMNS[field][1]} to {{}}" for field in ["name", *optional]),
+            f"{inner}repeat with reminderId in columns's ids",
+            f"{inner}    set r to reminder id (contents of reminderId)",
+            *(
+                f"{inner}    set end of columns's {_PAGE_COLUMNS[field][1]} to {_PAGE_COLUMNS[field][0]} of r"
+                for field in ["name", *optional]
+            ),
+            f"{inner}end repeat",
+            f"{_INDENT}end if",
+        ])
+    return GET_REMINDERS_TEMPLATE % {
+        "count": count,
+        "fetch": fetch,
+        "prepare": "\n".join(_PAGE_COLUMNS[field][2] for field in optional if _PAGE_COLUMNS[field][2]),
+        "emit": "\n".join(
+            f"                set end of output to (columns's {_PAGE_COLUMNS[field][3]}) as string" for field in optional
+        ),
+    }
+
+
+# Output: five RS-separated fields per list, all but the first counted by
+# Reminders itself so no reminder data is transferred:
+#
+#     list name, total, open, open and overdue, open and flagged
+COUNT_REMINDERS_SCRIPT = """
+on run argv
+    set {listName} to argv
+    set rightNow to current date
+    set output to {}
+    tell application "Reminders"
+        if listName is "" then
+            set theLists to lists
+        else
+            set theLists to {list listName}
+        end if
+        repeat with l in theLists
+            set end of output to name of l
+            tell l
+                set end of output to (count of reminders) as string
+                set end of output to (count of (reminders whose completed is false)) as string
+                set end of output to (count of (reminders whose completed is false and due date < rightNow)) as string
+                set end of output to (count of (reminders whose completed is false and flagged is true)) as string
+            end tell
+        end repeat
+    end tell
+    set AppleScript's text item delimiters to character id 30
+    set output to output as string
+    set AppleScript's text item delimiters to ""
+    return output
+end run
+"""
+
+COUNT_WIDTH = 5
+
+# Mutation handlers take a flat argv of fixed-width operations and apply all of
+# them in one script run; the single-item functions are one-item batches. Each
+# operation yields one RS-separated result whose US-separated fields are
+# "ok" followed by details, "not found", or "error" and a message.
+#
+# Reminders are located by ``reminder id`` when an id is known, which costs a
+# single lookup. Ids the caller gives are used as is. Ids found by name, by a
+# lookup or the name index, are passed with the name and only trusted while
+# the reminder still has it; otherwise, or without an id, the lists are
+# searched with a "whose name is" query per list.
+
+_BATCH_TEMPLATE = """
+on run argv
+    set RS to character id 30
+    set US to character id 31
+    set results to {}
+    tell application "Reminders"
+        set allLists to lists
+        repeat with i from 1 to (count of argv) by %(stride)d
+            set {%(fields)s} to items i thru (i + %(last)d) of argv
+            try
+%(body)s
+            on error errorMessage
+                set outcome to "error" & US & errorMessage
+            end try
+            set end of results to outcome
+        end repeat
+    end tell
+    set AppleScript's text item delimiters to RS
+    set output to results as string
+    set AppleScript's text item delimiters to ""
+    return output
+end run
+""" + dates.AS_DATE_HANDLER
+
+_FIND_BODY = """\
+                set found to false
+                if reminderId is not "" then
                     try
-                        set rDue to due date of r as string
+                        set r to reminder id reminderId
+                        set found to (reminderName is "" or name of r is reminderName)
                     end try
-                    set rNotes to ""
-                    try
-                        set rNotes to body of r
-                        if rNotes is missing value then
-                            set rNotes to ""
-                        else
-                            set AppleScript's text item delimiters to (ASCII character 10)
-                            set noteItems to text items of rNotes
-                            set AppleScript's text item delimiters to "⏎"
-                            set rNotes to noteItems as string
-                            set AppleScript's text item delimiters to ""
+                end if
+                if not found and reminderName is not "" then
+                    if listName is "" then
+                        set theLists to allLists
+                    else
+                        set theLists to {list listName}
+                    end if
+                    repeat with l in theLists
+                        set matches to (reminders of l whose name is reminderName)
+                        if length of matches > 0 then
+                            set r to item 1 of matches
+                            set found to true
+                            exit repeat
                         end if
-                    end try
-                    set rList to name of l
-                    set output to output & rList & "|" & rName & "|" & rCompleted & "|" & rDue & "|" & rNotes & "\\n"
-                end repeat
+                    end repeat
+                end if
+                if found then
+                    set rId to id of r
+%s
+                    set outcome to "ok" & US & rId
+                else
+                    set outcome to "not found"
+                end if"""
+
+
+def _batch_script(fields: list[str], body: str) -> str:
+    return _BATCH_TEMPLATE % {
+        "stride": len(fields),
+        "last": len(fields) - 1,
+        "fields": ", ".join(fields),
+        "body": body,
+    }
+
+
+CREATE_REMINDERS_SCRIPT = _batch_script(
+    ["reminderName", "listName", "dueDate", "reminderNotes"],
+    """\
+                if listName is "" then
+                    set targetList to default list
+                else
+                    set targetList to list listName
+                end if
+                set props to {name:reminderName}
+                if dueDate is not "" then set props to props & {due date:(my asDate(dueDate))}
+                if reminderNotes is not "" then set props to props & {body:reminderNotes}
+                set newReminder to make new reminder at end of targetList with properties props
+                set outcome to "ok" & US & (name of newReminder) & US & (id of newReminder)""",
+)
+
+COMPLETE_REMINDERS_SCRIPT = _batch_script(
+    ["reminderId", "reminderName", "listName"],
+    _FIND_BODY % "                    set completed of r to true",
+)
+
+UPDATE_REMINDERS_SCRIPT = _batch_script(
+    ["reminderId", "reminderName", "listName", "setName", "newName", "setNotes", "newNotes", "setDue", "newDue"],
+    _FIND_BODY % """\
+                    if setName is "1" then set name of r to newName
+                    if setNotes is "1" then set body of r to newNotes
+                    if setDue is "1" then set due date of r to (my asDate(newDue))""",
+)
+
+DELETE_REMINDERS_SCRIPT = _batch_script(
+    ["reminderId", "reminderName", "listName"],
+    _FIND_BODY % "                    delete r",
+)
+
+# Fan-out lookup of names in one list: argv is the list name followed by the
+# names. Output is one RS-separated field per name, holding the id of the
+# first reminder with that name in the list or "" if there is none.
+FIND_IDS_SCRIPT = """
+on run argv
+    set listName to item 1 of argv
+    set found to {}
+    tell application "Reminders"
+        tell list listName
+            repeat with reminderName in rest of argv
+                set matches to id of (reminders whose name is (contents of reminderName))
+                if (count of matches) is 0 then
+                    set end of found to ""
+                else
+                    set end of found to item 1 of matches
+                end if
             end repeat
-            return output
         end tell
+    end tell
+    set AppleScript's text item delimiters to character id 30
+    set output to found as string
+    set AppleScript's text item delimiters to ""
+    return output
+end run
+"""
+
+
+class _NameIndex:
+    """Maps reminder names to ids, learned from listings and writes.
+
+    Lets name-based mutations jump straight to ``reminder id`` instead of
+    searching every list. Names seen more than once in a list are ambiguous
+    and never resolved through the index.
     """
-    output = _run_applescript(script)
-    reminders = []
-    for line in output.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split("|", 4)
-        if len(parts) >= 3:
-            reminders.append({
-                "list": parts[0],
-                "name": parts[1],
-                "completed": parts[2].lower() == "true",
-                "due_date": parts[3] if len(parts) > 3 and parts[3] and parts[3] != "missing value" else None,
-                "notes": parts[4].replace("⏎", "\n") if len(parts) > 4 and parts[4] else None,
-            })
+
+    def __init__(self):
+        self._ids: dict[str, dict[str, str | None]] = {}
+        # Where each resolvable id is in _ids, so it is forgotten in O(1).
+        self._where: dict[str, tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, list_name: str, reminder_id: str) -> None:
+        self.add_many([(name, list_name, reminder_id)])
+
+    def add_many(self, entries: Iterable[tuple[str, str, str]]) -> None:
+        """Add ``(name, list_name, reminder_id)`` entries under one lock.
+
+        An id seen under a new name or list has been renamed or moved, so its
+        old entry is dropped.
+        """
+        with self._lock:
+            ids, where = self._ids, self._where
+            for name, list_name, reminder_id in entries:
+                previous = where.get(reminder_id)
+                if previous is not None and previous != (name, list_name):
+                    self._remove(reminder_id, *previous)
+                by_list = ids.setdefault(name, {})
+                known = by_list.get(list_name, reminder_id)
+                if known != reminder_id:
+                    by_list[list_name] = None
+                    if known is not None:
+                        del where[known]
+                    continue
+                by_list[list_name] = reminder_id
+                where[reminder_id] = (name, list_name)
+
+    def lookup(self, name: str, list_name: str | None) -> str | None:
+        with self._lock:
+            by_list = self._ids.get(name, {})
+            if list_name:
+                return by_list.get(list_name)
+            ids = list(by_list.values())
+            return ids[0] if len(ids) == 1 else None
+
+    def discard(self, reminder_id: str) -> str | None:
+        """Forget ``reminder_id`` and return the list it was in, if known."""
+        with self._lock:
+            location = self._where.get(reminder_id)
+            if location is None:
+                return None
+            self._remove(reminder_id, *location)
+            return location[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._where.clear()
+
+    def _remove(self, reminder_id: str, name: str, list_name: str) -> None:
+        del self._where[reminder_id]
+        by_list = self._ids[name]
+        del by_list[list_name]
+        if not by_list:
+            del self._ids[name]
+
+
+name_index = _NameIndex()
+
+
+def _flag(value) -> str:
+    return "1" if value is not None else "0"
+
+
+def get_lists() -> list[str]:
+    """Return all reminder list names."""
+    output = _run_applescript(GET_LISTS_SCRIPT)
+    with metrics.timer("applescript.parse"):
+        return _parse_lists(output)
+
+
+def _parse_lists(output: str) -> list[str]:
+    return list(wire.iter_fields([output]))
+
+
+def _fans_out(list_name: str | None, limit: int, cursor: str | None) -> bool:
+    """Whether a listing is read list by list: fan-out is on and it spans all lists, unpaged.
+
+    Paged reads keep the single script, which stops as soon as a page is full.
+    """
+    return FANOUT > 1 and not list_name and limit <= 0 and not cursor
+
+
+def _distinct(list_names: list[str]) -> bool:
+    """Lists can only be addressed one by one if no two share a name."""
+    return len(set(list_names)) == len(list_names)
+
+
+def _fan_out(func: Callable[[str], T], list_names: list[str]) -> list[T]:
+    """Return ``func(name)`` for each list, run on up to FANOUT threads, in list order."""
+    with ThreadPoolExecutor(max_workers=max(1, min(FANOUT, len(list_names)))) as executor:
+        return list(executor.map(func, list_names))
+
+
+def _whose_clause(
+    include_completed: bool,
+    due_after: str | None,
+    due_before: str | None,
+    search: str | None,
+    flagged: bool | None,
+    priority: int | None,
+) -> str:
+    """Return the AppleScript reminder set for the active filters."""
+    tests = []
+    if not include_completed:
+        tests.append("completed is false")
+    if due_after:
+        tests.append("due date ≥ dueAfter")
+    if due_before:
+        tests.append("due date < dueBefore")
+    if search:
+        tests.append("(name contains searchText or body contains searchText)")
+    if flagged is not None:
+        tests.append(f"flagged is {'true' if flagged else 'false'}")
+    if priority is not None:
+        tests.append("priority is wantPriority")
+    return f"(reminders whose {' and '.join(tests)})" if tests else "reminders"
+
+
+def _query_id(query: tuple) -> str:
+    return hashlib.sha256(json.dumps(query).encode()).hexdigest()[:16]
+
+
+def _encode_cursor(query: tuple, list_index: int, offset: int) -> str:
+    payload = json.dumps([_query_id(query), list_index, offset])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str, query: tuple) -> tuple[int, int]:
+    try:
+        query_id, list_index, offset = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor") from None
+    if query_id != _query_id(query):
+        raise ValueError("Cursor belongs to a different query")
+    return int(list_index), int(offset)
+
+
+DEFAULT_FIELDS = ("id", "list", "name", "completed", "due_date", "notes")
+# Always returned: they identify the reminder and feed the name index.
+_KEY_FIELDS = ("id", "list", "name")
+
+
+def _projection(fields: Iterable[str] | None) -> tuple[str, ...]:
+    """Return the fields to read, in REMINDER_FIELDS order; None means DEFAULT_FIELDS."""
+    if fields is None:
+        return DEFAULT_FIELDS
+    fields = set(fields)
+    unknown = fields.difference(REMINDER_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown reminder fields: {', '.join(sorted(unknown))}")
+    return tuple(field for field in REMINDER_FIELDS if field in _KEY_FIELDS or field in fields)
+
+
+def _truncate(notes: str | None, max_chars: int) -> str | None:
+    """Cut ``notes`` to ``max_chars`` characters plus an ellipsis (0 = no limit)."""
+    if notes and max_chars > 0 and len(notes) > max_chars:
+        return notes[:max_chars] + "…"
+    return notes
+
+
+def get_reminders_page(
+    list_name: str | None = None,
+    include_completed: bool = False,
+    limit: int = 0,
+    cursor: str | None = None,
+    *,
+    due_after: str | None = None,
+    due_before: str | None = None,
+    search: str | None = None,
+    flagged: bool | None = None,
+    priority: int | None = None,
+    fields: Iterable[str] | None = None,
+    notes_max_chars: int = 0,
+) -> tuple[list[Reminder], str | None]:
+    """Return up to ``limit`` reminders (0 = all) starting at ``cursor``.
+
+    Only the requested window of reminders matching the filters is read from
+    the Reminders app. ``due_after`` is inclusive and ``due_before`` exclusive;
+    like the due dates returned they are ISO 8601 (see dates.py). ``search``
+    matches a substring of the name or notes. ``fields`` limits the
+    properties read to a subset of REMINDER_FIELDS (id, list and name are
+    always included), and notes longer than ``notes_max_chars`` are cut short.
+    Returns the reminders and the cursor of the next page, or None on the
+    last page. Cursors are positional, so reminders added or completed
+    between pages can shift items across page boundaries.
+
+    With fan-out on (see FANOUT), unpaged reads of all lists query each list
+    concurrently and return the reminders in list order, as one script would.
+    """
+    if _fans_out(list_name, limit, cursor):
+        list_names = get_lists()
+        if _distinct(list_names):
+            fields = _projection(fields)
+
+            def read(name: str) -> list[Reminder]:
+                items, _ = get_reminders_page(
+                    name,
+                    include_completed,
+                    due_after=due_after,
+                    due_before=due_before,
+                    search=search,
+                    flagged=flagged,
+                    priority=priority,
+                    fields=fields,
+                    notes_max_chars=notes_max_chars,
+                )
+                return items
+
+            return [item for items in _fan_out(read, list_names) for item in items], None
+    query, script, args, fields = _page_request(
+        list_name,
+        include_completed,
+        limit,
+        cursor,
+        due_after,
+        due_before,
+        search,
+        flagged,
+        priority,
+        fields,
+        notes_max_chars,
+    )
+    output = _run_applescript(script, *args)
+    with metrics.timer("applescript.parse"):
+        return _parse_page(output, query, fields)
+
+
+def _page_request(
+    list_name: str | None,
+    include_completed: bool,
+    limit: int,
+    cursor: str | None,
+    due_after: str | None,
+    due_before: str | None,
+    search: str | None,
+    flagged: bool | None,
+    priority: int | None,
+    fields: Iterable[str] | None = None,
+    notes_max_chars: int = 0,
+) -> tuple[tuple, str, list[str], tuple[str, ...]]:
+    """Return the query key, handler source, arguments and fields for a page read.
+
+    The fields do not change which reminders a page holds, so they are not
+    part of the query key and cursors carry over between projections.
+    """
+    fields = _projection(fields)
+    due_after = dates.to_script(due_after) or None
+    due_before = dates.to_script(due_before) or None
+    query = (list_name or "", include_completed, due_after, due_before, search, flagged, priority)
+    list_index, offset = _decode_cursor(cursor, query) if cursor else (1, 1)
+    whose = _whose_clause(include_completed, due_after, due_before, search, flagged, priority)
+    args = [
+        list_name or "",
+        str(list_index),
+        str(offset),
+        str(max(limit, 0)),
+        due_after or "",
+        due_before or "",
+        search or "",
+        "" if priority is None else str(priority),
+        str(max(notes_max_chars, 0)),
+    ]
+    return query, _page_script(whose, fields), args, fields
+
+
+def _parse_page(
+    output: str, query: tuple, fields: tuple[str, ...] = DEFAULT_FIELDS
+) -> tuple[list[Reminder], str | None]:
+    rows, next_position = wire.decode_page(output, fields)
+    return _page_result(rows, next_position, query, fields)
+
+
+def _page_result(
+    rows: list[tuple[str, ...]],
+    next_position: tuple[int, int] | None,
+    query: tuple,
+    fields: tuple[str, ...] = DEFAULT_FIELDS,
+) -> tuple[list[Reminder], str | None]:
+    name_index.add_many((name, rlist, reminder_id) for rlist, reminder_id, name, *_ in rows)
+    # Fields that were not fetched are empty strings and stay hidden.
+    reminders = [
+        Reminder(
+            fields,
+            reminder_id,
+            rlist,
+            name,
+            done == "true",
+            dates.from_script(due),
+            note or None,
+            flagged == "true",
+            int(priority or 0),
+        )
+        for rlist, reminder_id, name, done, due, note, flagged, priority in rows
+    ]
+    next_cursor = _encode_cursor(query, *next_position) if next_position else None
+    return reminders, next_cursor
+
+
+def get_reminders(list_name: str | None = None, include_completed: bool = False, **filters) -> list[Reminder]:
+    """Return reminders, optionally filtered by list and the filters of get_reminders_page."""
+    reminders, _ = get_reminders_page(list_name, include_completed, **filters)
     return reminders
 
 
-def create_reminder(name: str, list_name: str | None = None, due_date: str | None = None, notes: str | None = None) -> str:
-    """Create a new reminder. Returns the reminder name."""
-    props = [f'name:"{name}"']
-    if due_date:
-        props.append(f'due date:date "{due_date}"')
-    if notes:
-        props.append(f'body:"{notes}"')
-    props_str = ", ".join(props)
-
-    if list_name:
-        target = f'list "{list_name}"'
-    else:
-        target = "default list"
+def get_counts(list_name: str | None = None) -> dict:
+    """Count reminders per list without reading any of them.
 
-    script = f"""
-        tell application "Reminders"
-            set newReminder to make new reminder at end of {target} with properties {{{props_str}}}
-            return name of newReminder
-        end tell
+    Returns ``{"lists": [...], "total": {...}}`` where each entry has the
+    ``total``, ``open``, ``completed``, ``overdue`` and ``flagged`` counts;
+    overdue and flagged count open reminders only.
     """
-    return _run_applescript(script)
+    output = _run_applescript(COUNT_REMINDERS_SCRIPT, list_name or "")
+    with metrics.timer("applescript.parse"):
+        return _parse_counts(output)
 
 
-def complete_reminder(name: str, list_name: str | None = None) -> bool:
-    """Mark a reminder as completed. Returns True on success."""
-    if list_name:
-        target = f'list "{list_name}"'
-    else:
-        target = "lists"
-
-    script = f"""
-        tell application "Reminders"
-            if "{list_name or ""}" is not "" then
-                set theList to {{list "{list_name or ""}"}}
-            else
-                set theList to lists
-            end if
-            repeat with l in theList
-                repeat with r in reminders of l
-                    if name of r is "{name}" then
-                        set completed of r to true
-                        return "ok"
-                    end if
-                end repeat
-            end repeat
-            return "not found"
-        end tell
+def _parse_counts(output: str) -> dict:
+    fields = list(wire.iter_fields([output]))
+    if len(fields) % COUNT_WIDTH:
+        raise RuntimeError("AppleScript error: malformed counts output")
+    rows = []
+    for start in range(0, len(fields), COUNT_WIDTH):
+        list_name, *counts = fields[start:start + COUNT_WIDTH]
+        if not all(count.isdigit() for count in counts):
+            raise RuntimeError(f"AppleScript error: malformed counts for list {list_name!r}")
+        rows.append((list_name, *map(int, counts)))
+    return _counts_result(rows)
+
+
+def _counts_result(rows: Iterable[tuple[str, int, int, int, int]]) -> dict:
+    """Build get_counts' result from ``(list, total, open, overdue, flagged)`` rows."""
+    lists = [
+        {
+            "list": list_name,
+            "total": total,
+            "open": open_,
+            "completed": total - open_,
+            "overdue": overdue,
+            "flagged": flagged,
+        }
+        for list_name, total, open_, overdue, flagged in rows
+    ]
+    keys = ("total", "open", "completed", "overdue", "flagged")
+    return {"lists": lists, "total": {key: sum(entry[key] for entry in lists) for key in keys}}
+
+
+def _target(item: dict) -> list[str]:
+    """Return the ``reminderId, reminderName, listName`` arguments for an item."""
+    name = item.get("name") or ""
+    list_name = item.get("list_name") or ""
+    if item.get("reminder_id"):
+        # An id from the caller is used as is. Ids found by name, through a
+        # lookup or the index, are only trusted while the name still matches.
+        return [item["reminder_id"], "", list_name]
+    reminder_id = item.get("found_id") or (name_index.lookup(name, list_name) if name else None)
+    if not reminder_id and not name:
+        raise ValueError("Either name or reminder_id is required")
+    return [reminder_id or "", name, list_name]
+
+
+def _unlocated_names(items: list[dict]) -> list[str]:
+    """Names to look up across lists before a batch, if fan-out is on.
+
+    These are items with only a name, which neither a list nor the name index
+    narrows down, so the batch handler would search every list in turn.
     """
-    result = _run_applescript(script)
-    return result == "ok"
+    if FANOUT <= 1:
+        return []
+    names = (
+        item["name"] for item in items
+        if item.get("name") and not item.get("reminder_id") and not item.get("list_name")
+        and name_index.lookup(item["name"], None) is None
+    )
+    return list(dict.fromkeys(names))
+
+
+def _parse_found(output: str, count: int) -> list[str]:
+    found = output.split(RS)
+    if len(found) != count:
+        raise RuntimeError(f"AppleScript error: expected {count} lookup results, got {len(found)}")
+    return found
+
+
+def _located(items: list[dict], names: list[str], list_names: list[str], found: list[list[str]]) -> list[dict]:
+    """Give name-only items the list of the first list holding their name and the id found there."""
+    first: dict[str, tuple[str, str]] = {}
+    for list_name, ids in zip(list_names, found):
+        for name, reminder_id in zip(names, ids):
+            if reminder_id:
+                first.setdefault(name, (reminder_id, list_name))
+    located = []
+    for item in items:
+        match = None if item.get("reminder_id") or item.get("list_name") else first.get(item.get("name"))
+        located.append({**item, "found_id": match[0], "list_name": match[1]} if match else item)
+    return located
+
+
+def _locate(items: list[dict]) -> list[dict]:
+    """Resolve name-only items with one concurrent lookup per list (see FANOUT)."""
+    names = _unlocated_names(items)
+    if not names:
+        return items
+    list_names = get_lists()
+    if not _distinct(list_names):
+        return items
+
+    def find(list_name: str) -> list[str]:
+        return _parse_found(_run_applescript(FIND_IDS_SCRIPT, list_name, *names), len(names))
+
+    return _located(items, names, list_names, _fan_out(find, list_names))
+
+
+def _run_batch(script: str, operations: list[list[str]]) -> list[list[str]]:
+    """Run a batch handler and return the result fields of each operation."""
+    if not operations:
+        return []
+    output = _run_applescript(script, *(arg for operation in operations for arg in operation))
+    with metrics.timer("applescript.parse"):
+        return _split_batch(output, len(operations))
+
+
+def _split_batch(output: str, count: int) -> list[list[str]]:
+    results = [field.split(US) for field in output.split(RS)]
+    if len(results) != count:
+        raise RuntimeError(f"AppleScript error: expected {count} batch results, got {len(results)}")
+    return results
+
+
+def _batch_results(items: list[dict], results: list[list[str]]) -> list[dict]:
+    """Turn ``ok, id`` / ``not found`` / ``error, message`` fields into result dicts."""
+    return [
+        {
+            "name": item.get("name"),
+            "id": (
+                fields[1] if fields[0] == "ok" and len(fields) > 1 else item.get("reminder_id") or item.get("found_id")
+            ),
+            "success": fields[0] == "ok",
+            "error": None if fields[0] == "ok" else (fields[1] if len(fields) > 1 else fields[0]),
+        }
+        for item, fields in zip(items, results)
+    ]
+
+
+def _single(result: dict) -> bool:
+    if result["error"] and result["error"] != "not found":
+        raise RuntimeError(f"AppleScript error: {result['error']}")
+    return result["success"]
+
+
+def create_reminder(name: str, list_name: str | None = None, due_date: str | None = None, notes: str | None = None) -> str:
+    """Create a new reminder. Returns the reminder name."""
+    result = create_reminders([{"name": name, "list_name": list_name, "due_date": due_date, "notes": notes}])[0]
+    _single(result)
+    return result["name"]
+
+
+def complete_reminder(name: str | None = None, list_name: str | None = None, reminder_id: str | None = None) -> bool:
+    """Mark a reminder as completed. Returns True on success."""
+    return _single(complete_reminders([{"name": name, "list_name": list_name, "reminder_id": reminder_id}])[0])
 
 
 def update_reminder(
-    name: str,
+    name: str | None = None,
     list_name: str | None = None,
     new_name: str | None = None,
     notes: str | None = None,
     due_date: str | None = None,
+    reminder_id: str | None = None,
 ) -> bool:
     """Update properties of an existing reminder. Returns True on success."""
-    updates = []
-    if new_name is not None:
-        updates.append(f'set name of r to "{new_name}"')
-    if notes is not None:
-        updates.append(f'set body of r to "{notes}"')
-    if due_date is not None:
-        updates.append(f'set due date of r to date "{due_date}"')
-
-    if not updates:
+    if new_name is None and notes is None and due_date is None:
         return True
 
-    updates_script = "\n                        ".join(updates)
+    item = {
+        "name": name,
+        "list_name": list_name,
+        "new_name": new_name,
+        "notes": notes,
+        "due_date": due_date,
+        "reminder_id": reminder_id,
+    }
+    return _single(update_reminders([item])[0])
 
-    script = f"""
-        tell application "Reminders"
-            if "{list_name or ""}" is not "" then
-                set theList to {{list "{list_name or ""}"}}
-            else
-                set theList to lists
-            end if
-            repeat with l in theList
-                repeat with r in reminders of l
-                    if name of r is "{name}" then
-                        {updates_script}
-                        return "ok"
-                    end if
-                end repeat
-            end repeat
-            return "not found"
-        end tell
+
+def delete_reminder(name: str | None = None, list_name: str | None = None, reminder_id: str | None = None) -> bool:
+    """Delete a reminder. Returns True on success."""
+    return _single(delete_reminders([{"name": name, "list_name": list_name, "reminder_id": reminder_id}])[0])
+
+
+def create_reminders(items: list[dict]) -> list[dict]:
+    """Create many reminders in one script run.
+
+    Each item takes the keyword arguments of create_reminder. Returns one
+    ``{"name", "id", "success", "error"}`` dict per item, in order.
     """
-    result = _run_applescript(script)
-    return result == "ok"
+    return _created(items, _run_batch(CREATE_REMINDERS_SCRIPT, _create_operations(items)))
 
 
-def delete_reminder(name: str, list_name: str | None = None) -> bool:
-    """Delete a reminder. Returns True on success."""
-    if list_name:
-        script = f"""
-            tell application "Reminders"
-                set matches to (reminders of list "{list_name}" whose name is "{name}")
-                if length of matches > 0 then
-                    delete item 1 of matches
-                    return "ok"
-                end if
-                return "not found"
-            end tell
-        """
-    else:
-        script = f"""
-            tell application "Reminders"
-                repeat with l in lists
-                    set matches to (reminders of l whose name is "{name}")
-                    if length of matches > 0 then
-                        delete item 1 of matches
-                        return "ok"
-                    end if
-                end repeat
-                return "not found"
-            end tell
-        """
-    result = _run_applescript(script)
-    return result == "ok"
+def complete_reminders(items: list[dict]) -> list[dict]:
+    """Complete many reminders, each given by ``reminder_id`` or ``name`` and optional ``list_name``."""
+    items = _locate(items)
+    operations = [_target(item) for item in items]
+    return _batch_results(items, _run_batch(COMPLETE_REMINDERS_SCRIPT, operations))
+
+
+def update_reminders(items: list[dict]) -> list[dict]:
+    """Update many reminders; each item takes the keyword arguments of update_reminder."""
+    items = _locate(items)
+    return _updated(items, _run_batch(UPDATE_REMINDERS_SCRIPT, _update_operations(items)))
+
+
+def delete_reminders(items: list[dict]) -> list[dict]:
+    """Delete many reminders, each given by ``reminder_id`` or ``name`` and optional ``list_name``."""
+    items = _locate(items)
+    operations = [_target(item) for item in items]
+    return _deleted(items, _run_batch(DELETE_REMINDERS_SCRIPT, operations))
+
+
+def _create_operations(items: list[dict]) -> list[list[str]]:
+    return [
+        [item["name"], item.get("list_name") or "", dates.to_script(item.get("due_date")), item.get("notes") or ""]
+        for item in items
+    ]
+
+
+def _created(items: list[dict], batch: list[list[str]]) -> list[dict]:
+    results = []
+    for item, fields in zip(items, batch):
+        if fields[0] == "ok" and len(fields) == 3:
+            _, name, reminder_id = fields
+            if item.get("list_name"):
+                name_index.add(name, item["list_name"], reminder_id)
+            results.append({"name": name, "id": reminder_id, "success": True, "error": None})
+        else:
+            results.extend(_batch_results([item], [fields]))
+    return results
+
+
+def _update_operations(items: list[dict]) -> list[list[str]]:
+    return [
+        [
+            *_target(item),
+            _flag(item.get("new_name")), item.get("new_name") or "",
+            _flag(item.get("notes")), item.get("notes") or "",
+            _flag(item.get("due_date")), dates.to_script(item.get("due_date")),
+        ]
+        for item in items
+    ]
+
+
+def _updated(items: list[dict], batch: list[list[str]]) -> list[dict]:
+    results = _batch_results(items, batch)
+    for item, result in zip(items, results):
+        if result["success"] and item.get("new_name") is not None:
+            list_name = name_index.discard(result["id"]) or item.get("list_name")
+            if list_name:
+                name_index.add(item["new_name"], list_name, result["id"])
+    return results
+
+
+def _deleted(items: list[dict], batch: list[list[str]]) -> list[dict]:
+    results = _batch_results(items, batch)
+    for result in results:
+        if result["success"]:
+            name_index.discard(result["id"])
+    return results
@@ -0,0 +1,90 @@
+// Long-lived AppleScript runner for reminders_mcp.pool.
+//
+// Reads one JSON request per line from stdin ({"script": ..., "args": [...]}),
+// runs the script and writes one JSON response per line to stdout
+// ({"result": ...} or {"error": ...}). Compiled scripts are kept for the life
+// of the process, so every distinct source is compiled once.
+
+ObjC.import("Foundation");
+ObjC.import("OSAKit");
+
+const TYPE_LIST = 0x6c697374; // 'list'
+const compiled = {};
+
+function errorMessage(info) {
+    const error = ObjC.deepUnwrap(info) || {};
+    return error.OSAScriptErrorMessageKey || error.OSAScriptErrorMessage || error.NSLocalizedDescription || "unknown error";
+}
+
+function compile(source) {
+    if (!(source in compiled)) {
+        const language = $.OSALanguage.languageForName("AppleScript");
+        const script = $.OSAScript.alloc.initWithSourceLanguage(source, language);
+        const error = Ref();
+        if (!script.compileAndReturnError(error)) {
+            throw new Error(errorMessage(error[0]));
+        }
+        compiled[source] = script;
+    }
+    return compiled[source];
+}
+
+// Render a result the way `osascript` prints it: lists become "a, b, c".
+function render(descriptor) {
+    if (!descriptor || descriptor.isNil()) {
+        return "";
+    }
+    if (descriptor.descriptorType === TYPE_LIST) {
+        const items = [];
+        for (let i = 1; i <= descriptor.numberOfItems; i++) {
+            items.push(render(descriptor.descriptorAtIndex(i)));
+        }
+        return items.join(", ");
+    }
+    const text = descriptor.stringValue;
+    return text.isNil() ? "" : text.js;
+}
+
+function execute(request) {
+    const script = compile(request.script);
+    const error = Ref();
+    const args = request.args || [];
+    const result = args.length
+        ? script.executeHandlerWithNameArgumentsError("run", $([$(args)]), error)
+        : script.executeAndReturnError(error);
+    if (result.isNil()) {
+        throw new Error(errorMessage(error[0]));
+    }
+    return render(result);
+}
+
+function respond(response) {
+    const line = $(JSON.stringify(response) + "\n");
+    $.NSFileHandle.fileHandleWithStandardOutput.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function run() {
+    const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+    // Requests are ASCII-only JSON, so chunks never split a character.
+    let pending = "";
+    for (;;) {
+        const data = stdin.availableData;
+        if (data.length === 0) {
+            return;
+        }
+        pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+        let newline;
+        while ((newline = pending.indexOf("\n")) >= 0) {
+            const line = pending.slice(0, newline);
+            pending = pending.slice(newline + 1);
+            if (!line) {
+                continue;
+            }
+            try {
+                respond({ result: execute(JSON.parse(line)) });
+            } catch (e) {
+                respond({ error: String(e.message || e) });
+            }
+        }
+    }
+}
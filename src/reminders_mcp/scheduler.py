@@ -0,0 +1,105 @@
+"""Bounded concurrency for Reminders calls made from async tools.
+
+Every call takes one of ``max_concurrent`` slots, so a burst of requests
+cannot start an unbounded number of ``osascript`` processes. A call that
+fans out over lists runs the extra scripts in slots of their own, taken
+through ``slot()``, so the cap holds for scripts rather than calls. Reads
+only need a slot and run in parallel. Mutations also hold a lock per reminder key and
+take those locks before a slot, so writes to the same reminder run in the
+order they arrived while writes to other reminders proceed alongside them.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from reminders_mcp import reminders
+
+T = TypeVar("T")
+
+# The scheduler whose slot the running call holds; tasks it starts inherit it.
+_current: ContextVar["Scheduler | None"] = ContextVar("scheduler", default=None)
+
+
+def reminder_keys(item: dict) -> set[str]:
+    """Return the ordering keys of a mutation ``item``.
+
+    A reminder is known by its id and by its name, so both are used: an
+    update by name then a delete by id of the same reminder still serialise
+    whenever the name index knows the id. Renames also lock the new name.
+    """
+    keys = set()
+    name = item.get("name")
+    reminder_id = item.get("reminder_id") or (name and reminders.name_index.lookup(name, item.get("list_name")))
+    if reminder_id:
+        keys.add(f"id:{reminder_id}")
+    for key in (name, item.get("new_name")):
+        if key:
+            keys.add(f"name:{key}")
+    return keys
+
+
+class Scheduler:
+    """Caps concurrent Reminders calls and orders mutations per reminder."""
+
+    def __init__(self, max_concurrent: int = 4):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._waiters: dict[str, int] = {}
+
+    async def read(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Await ``func(*args, **kwargs)`` once a slot is free."""
+        async with self._slots:
+            token = _current.set(self)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _current.reset(token)
+
+    async def write(self, keys: Iterable[str], func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Like read, but after every earlier write sharing one of ``keys``."""
+        # A fixed acquisition order keeps writes with overlapping keys from
+        # deadlocking.
+        waiting, held = [], []
+        try:
+            for key in sorted(set(keys)):
+                lock = self._lock(key)
+                waiting.append(key)
+                await lock.acquire()
+                held.append(key)
+            return await self.read(func, *args, **kwargs)
+        finally:
+            for key in waiting:
+                self._release(key, held=key in held)
+
+    def _lock(self, key: str) -> asyncio.Lock:
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def _release(self, key: str, held: bool) -> None:
+        if held:
+            self._locks[key].release()
+        self._waiters[key] -= 1
+        if not self._waiters[key]:
+            del self._waiters[key]
+            del self._locks[key]
+
+
+@asynccontextmanager
+async def slot() -> AsyncIterator[None]:
+    """Hold another slot of the scheduler running the current call, if any.
+
+    For work a call runs alongside its own, such as reading several lists at
+    once. Outside a scheduler there is nothing to wait for.
+    """
+    scheduler = _current.get()
+    if scheduler is None:
+        yield
+        return
+    async with scheduler._slots:
+        yield
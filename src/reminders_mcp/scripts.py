@@ -0,0 +1,94 @@
+"""On-disk cache of compiled AppleScript handlers.
+
+Handler sources are fixed ``on run argv`` scripts, so each one only needs to
+be compiled once. Compiled ``.scpt`` files live under
+``<cache dir>/compiled/<package version>/<sha256 of source>.scpt``; directories
+left behind by other package versions are removed the first time the cache
+is used. Only the ``compiled`` directory belongs to this package, so anything
+else in the cache dir is left alone.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from reminders_mcp.stats import metrics
+
+DEFAULT_CACHE_DIR = Path.home() / "Library" / "Caches" / "reminders-mcp"
+COMPILED_DIR = "compiled"
+
+_compiled: dict[str, Path] = {}
+_pruned = False
+_lock = threading.Lock()
+
+
+def package_version() -> str:
+    try:
+        return version("reminders-mcp")
+    except PackageNotFoundError:
+        return "0+unknown"
+
+
+def cache_dir() -> Path | None:
+    """Return the cache root, or None when ``REMINDERS_MCP_SCRIPT_CACHE=off``."""
+    setting = os.environ.get("REMINDERS_MCP_SCRIPT_CACHE")
+    if setting == "off":
+        return None
+    return Path(setting) if setting else DEFAULT_CACHE_DIR
+
+
+def compiled_path(source: str) -> Path | None:
+    """Return the compiled script for ``source``, compiling it on first use.
+
+    Returns None when caching is disabled or ``osacompile`` is unavailable, in
+    which case callers should run the source text directly.
+    """
+    path = _compiled.get(source)
+    if path is not None and path.exists():
+        return path
+    root = cache_dir()
+    if root is None or shutil.which("osacompile") is None:
+        return None
+    versions = root / COMPILED_DIR
+    directory = versions / package_version()
+    path = directory / f"{hashlib.sha256(source.encode()).hexdigest()}.scpt"
+    with _lock:
+        _prune_stale_versions(versions, directory)
+        if not path.exists():
+            directory.mkdir(parents=True, exist_ok=True)
+            with metrics.timer("applescript.compile"):
+                _compile(source, path)
+        _compiled[source] = path
+    return path
+
+
+def _prune_stale_versions(versions: Path, current: Path) -> None:
+    global _pruned
+    if _pruned or not versions.is_dir():
+        return
+    for entry in versions.iterdir():
+        if entry.is_dir() and entry != current:
+            shutil.rmtree(entry, ignore_errors=True)
+    _pruned = True
+
+
+def _compile(source: str, path: Path) -> None:
+    # Compile next to the target and rename, so concurrent servers never see
+    # a half-written file.
+    with tempfile.TemporaryDirectory(dir=path.parent) as tmp:
+        source_file = Path(tmp) / "handler.applescript"
+        source_file.write_text(source, encoding="utf-8")
+        output = Path(tmp) / path.name
+        result = subprocess.run(
+            ["osacompile", "-o", str(output), str(source_file)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"AppleScript compile error: {result.stderr.strip()}")
+        os.replace(output, path)
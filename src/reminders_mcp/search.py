@@ -0,0 +1,258 @@
+"""In-process inverted index over reminder names and notes.
+
+Terms are case-folded word tokens. A query matches reminders containing every
+query token, either as a whole term or as a prefix of one, and results are
+ranked with BM25. Name terms count double, and prefix expansions count half
+as much as exact matches. A token's rarity is measured across all the terms
+it matches.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from reminders_mcp import dates
+from reminders_mcp.record import Reminder
+
+_TOKEN = re.compile(r"\w+")
+
+NAME_WEIGHT = 2.0
+PREFIX_WEIGHT = 0.5
+K1 = 1.2
+B = 0.75
+
+# What the index keeps of each reminder and returns with its score.
+DOC_FIELDS = ("id", "list", "name", "completed", "due_date", "notes")
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _TOKEN.findall(text.casefold()) if text else []
+
+
+def _rank(entry: tuple[float, str]) -> tuple[float, str]:
+    """Best score first, ties broken by id so results are stable."""
+    score, reminder_id = entry
+    return -score, reminder_id
+
+
+class SearchIndex:
+    """Ranked full-text search over reminders, updated item by item."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._docs: dict[str, Reminder] = {}
+        self._lengths: dict[str, float] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._terms: list[str] = []
+        self._total_length = 0.0
+        self._lock = threading.Lock()
+        self.loaded_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def is_fresh(self, max_age: float) -> bool:
+        return self.loaded_at is not None and self._clock() - self.loaded_at < max_age
+
+    def mark_stale(self) -> None:
+        """Make the next is_fresh() check fail so the index is rebuilt."""
+        self.loaded_at = None
+
+    def rebuild(self, items: Iterable[Mapping[str, Any]]) -> None:
+        """Replace the whole index with ``items`` (reminders with an id)."""
+        with self._lock:
+            self._docs.clear()
+            self._lengths.clear()
+            self._postings.clear()
+            self._terms.clear()
+            self._total_length = 0.0
+            for item in items:
+                self._add(item, keep_sorted=False)
+            # One sort of the vocabulary, not an insertion per new term.
+            self._terms = sorted(self._postings)
+            self.loaded_at = self._clock()
+
+    def add(self, item: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._remove(item["id"])
+            self._add(item)
+
+    def update(self, reminder_id: str, **changes) -> bool:
+        """Change fields of an indexed reminder; returns False if it is unknown."""
+        with self._lock:
+            item = self._docs.get(reminder_id)
+            if item is None:
+                return False
+            self._remove(reminder_id)
+            self._add({**item, **changes})
+            return True
+
+    def remove(self, reminder_id: str) -> None:
+        with self._lock:
+            self._remove(reminder_id)
+
+    def find_id(self, name: str, list_name: str | None = None) -> str | None:
+        """Return the id of the only indexed reminder called ``name``, if any."""
+        with self._lock:
+            matches = [
+                reminder_id for reminder_id, item in self._docs.items()
+                if item["name"] == name and (not list_name or item["list"] == list_name)
+            ]
+        return matches[0] if len(matches) == 1 else None
+
+    # Hooks for the server's own writes. ``item`` holds the tool arguments
+    # (name, list_name, new_name, notes, due_date); ``reminder_id`` is the id
+    # the write reported, if any. Anything the index cannot apply exactly,
+    # including due dates in the Mac's locale format, marks it stale instead.
+
+    def reminder_created(self, item: dict, reminder_id: str | None) -> None:
+        if self.loaded_at is None:
+            return
+        due_date = item.get("due_date")
+        if reminder_id is None or not item.get("list_name") or (due_date and not dates.parse_iso(due_date)):
+            self.mark_stale()
+            return
+        self.add({
+            "id": reminder_id,
+            "list": item["list_name"],
+            "name": item.get("name"),
+            "notes": item.get("notes"),
+            "due_date": dates.parse_iso(due_date) if due_date else None,
+            "completed": False,
+        })
+
+    def reminder_updated(self, item: dict, reminder_id: str | None) -> None:
+        due_date = item.get("due_date")
+        if due_date and not dates.parse_iso(due_date):
+            self.mark_stale()
+            return
+        changes = {
+            "name": item.get("new_name"),
+            "notes": item.get("notes"),
+            "due_date": dates.parse_iso(due_date) if due_date else None,
+        }
+        self._change(item, reminder_id, **{key: value for key, value in changes.items() if value is not None})
+
+    def reminder_completed(self, item: dict, reminder_id: str | None) -> None:
+        self._change(item, reminder_id, completed=True)
+
+    def reminder_deleted(self, item: dict, reminder_id: str | None) -> None:
+        if self.loaded_at is None:
+            return
+        reminder_id = self._resolve(item, reminder_id)
+        if reminder_id is None:
+            self.mark_stale()
+        else:
+            self.remove(reminder_id)
+
+    def _change(self, item: dict, reminder_id: str | None, **changes) -> None:
+        if self.loaded_at is None:
+            return
+        reminder_id = self._resolve(item, reminder_id)
+        if reminder_id is None or not self.update(reminder_id, **changes):
+            self.mark_stale()
+
+    def _resolve(self, item: dict, reminder_id: str | None) -> str | None:
+        if reminder_id:
+            return reminder_id
+        return self.find_id(item["name"], item.get("list_name")) if item.get("name") else None
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        list_name: str | None = None,
+        include_completed: bool = False,
+    ) -> list[dict]:
+        """Return up to ``limit`` matching reminders, best first, each with a ``score``."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        with self._lock:
+            count = len(self._docs)
+            if not count:
+                return []
+            average = self._total_length / count
+            scores: dict[str, float] | None = None
+            for token in tokens:
+                token_scores: dict[str, float] = {}
+                for term in self._expand(token):
+                    weight = 1.0 if term == token else PREFIX_WEIGHT
+                    for reminder_id, tf in self._postings[term].items():
+                        norm = tf * (K1 + 1) / (tf + K1 * (1 - B + B * self._lengths[reminder_id] / average))
+                        token_scores[reminder_id] = max(token_scores.get(reminder_id, 0.0), weight * norm)
+                # Rarity is judged per query token, so a prefix's expansions
+                # compete on term frequency rather than on how rare each is.
+                matched = len(token_scores)
+                idf = math.log(1 + (count - matched + 0.5) / (matched + 0.5))
+                token_scores = {key: value * idf for key, value in token_scores.items()}
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {key: value + token_scores[key] for key, value in scores.items() if key in token_scores}
+                if not scores:
+                    return []
+            candidates = (
+                (score, reminder_id) for reminder_id, score in scores.items()
+                if (include_completed or not self._docs[reminder_id].completed)
+                and (not list_name or self._docs[reminder_id].list == list_name)
+            )
+            if limit > 0:
+                ranked = heapq.nsmallest(limit, candidates, key=_rank)
+            else:
+                ranked = sorted(candidates, key=_rank)
+            return [{**self._docs[reminder_id], "score": round(score, 4)} for score, reminder_id in ranked]
+
+    def _expand(self, token: str) -> list[str]:
+        start = bisect.bisect_left(self._terms, token)
+        end = start
+        while end < len(self._terms) and self._terms[end].startswith(token):
+            end += 1
+        return self._terms[start:end]
+
+    def _add(self, item: Mapping[str, Any], keep_sorted: bool = True) -> None:
+        reminder_id = item["id"]
+        weights: Counter[str] = Counter()
+        for term in tokenize(item.get("name")):
+            weights[term] += NAME_WEIGHT
+        for term in tokenize(item.get("notes")):
+            weights[term] += 1.0
+        list_name = item.get("list")
+        self._docs[reminder_id] = Reminder(
+            DOC_FIELDS,
+            reminder_id,
+            sys.intern(list_name) if list_name else list_name,
+            item.get("name") or "",
+            bool(item.get("completed")),
+            item.get("due_date"),
+            item.get("notes"),
+        )
+        length = sum(weights.values())
+        self._lengths[reminder_id] = length
+        self._total_length += length
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if keep_sorted:
+                    bisect.insort(self._terms, term)
+            postings[reminder_id] = weight
+
+    def _remove(self, reminder_id: str) -> None:
+        item = self._docs.pop(reminder_id, None)
+        if item is None:
+            return
+        self._total_length -= self._lengths.pop(reminder_id)
+        for term in set(tokenize(item["name"])) | set(tokenize(item["notes"])):
+            postings = self._postings[term]
+            postings.pop(reminder_id, None)
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect.bisect_left(self._terms, term)]
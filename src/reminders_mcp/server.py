@@ -1,121 +1,899 @@
 """MCP server exposing macOS Reminders as tools."""
 
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from urllib.parse import unquote
+
 from mcp.server.fastmcp import FastMCP
-from reminders_mcp import reminders
+from pydantic import AnyUrl
+from typing_extensions import NotRequired, TypedDict
+
+from reminders_mcp import agenda as agenda_view
+from reminders_mcp import aio, dates
+from reminders_mcp.cache import ReminderCache
+from reminders_mcp.coalesce import SingleFlight
+from reminders_mcp.mirror import Mirror
+from reminders_mcp.record import Reminder
+from reminders_mcp import reminders, transfer
+from reminders_mcp.scheduler import Scheduler, reminder_keys
+from reminders_mcp.search import SearchIndex
+from reminders_mcp.stats import Reporter, metrics
+from reminders_mcp.watch import SNAPSHOT_SCRIPT, Watcher
+from reminders_mcp.writeback import WriteQueue, batches
 
+logger = logging.getLogger(__name__)
 mcp = FastMCP("reminders")
+cache = ReminderCache(
+    ttl=float(os.environ.get("REMINDERS_MCP_CACHE_TTL") or 30),
+    max_entries=int(os.environ.get("REMINDERS_MCP_CACHE_SIZE") or 128),
+)
+scheduler = Scheduler(int(os.environ.get("REMINDERS_MCP_CONCURRENCY") or 4))
+flights = SingleFlight()
+mirror = Mirror(os.environ["REMINDERS_MCP_MIRROR"]) if os.environ.get("REMINDERS_MCP_MIRROR") else None
+mirror_max_age = float(os.environ.get("REMINDERS_MCP_MIRROR_MAX_AGE") or 30)
+_mirror_sync = asyncio.Lock()
+search_index = SearchIndex()
+search_max_age = float(os.environ.get("REMINDERS_MCP_SEARCH_TTL") or 300)
+_search_load = asyncio.Lock()
+write_queue = WriteQueue(
+    delay=float(os.environ.get("REMINDERS_MCP_WRITE_BEHIND") or 0),
+    max_pending=int(os.environ.get("REMINDERS_MCP_WRITE_BEHIND_SIZE") or 20),
+    journal=os.environ.get("REMINDERS_MCP_WRITE_BEHIND_JOURNAL"),
+)
+_flush_lock = asyncio.Lock()
+_flush_timer: asyncio.TimerHandle | None = None
+_flush_task: asyncio.Task | None = None
+
+
+def _lists_changed(names: list[str]) -> None:
+    """Forget what was read from lists that changed, before subscribers re-read them."""
+    flights.barrier()
+    cache.lists_changed(names)
+    search_index.mark_stale()
+    if mirror is not None:
+        mirror.mark_stale()
+
+
+watcher = Watcher(
+    lambda: scheduler.read(aio.run_applescript, SNAPSHOT_SCRIPT),
+    interval=float(os.environ.get("REMINDERS_MCP_WATCH_INTERVAL") or 10),
+    on_change=_lists_changed,
+)
+
+
+def _timed(func):
+    """Record a tool's latency under ``tool.<name>``."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with metrics.timer(f"tool.{func.__name__}"):
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+def _plain(items: list[Reminder]) -> list[dict]:
+    """Reminder records as the dicts tools return over MCP."""
+    return [item.to_dict() for item in items]
+
+
+async def _write(keys, func, *args, **kwargs):
+    """Run a mutation through the scheduler; later reads see its effect."""
+    try:
+        return await scheduler.write(keys, func, *args, **kwargs)
+    finally:
+        flights.barrier()
+        if mirror is not None:
+            mirror.mark_stale()
+
+
+async def _refresh_mirror() -> None:
+    """Delta-sync the mirror unless it synced within ``mirror_max_age``."""
+    async with _mirror_sync:
+        if mirror.is_fresh(mirror_max_age):
+            return
+        script, args = mirror.sync_request()
+        output = await scheduler.read(aio.run_applescript, script, *args)
+        await asyncio.to_thread(mirror.apply, output)
+
+
+@mcp.resource("reminders://cache/stats")
+def cache_stats() -> dict:
+    """Hit/miss counters and settings of the reminder read cache."""
+    return cache.stats()
+
+
+@mcp.resource("reminders://stats")
+def server_stats() -> dict:
+    """Latency percentiles and output sizes per tool and AppleScript phase, plus cache, coalescing, watch and write-behind counters."""
+    return {
+        **metrics.snapshot(),
+        "cache": cache.stats(),
+        "coalescing": flights.stats(),
+        "watch": watcher.stats(),
+        "write_behind": write_queue.stats(),
+    }
+
+
+@mcp.resource("reminders://list/{name}")
+async def list_resource(name: str) -> dict:
+    """Open reminders of one list (name URL-encoded). Subscribe to be notified when the list changes."""
+    list_name = unquote(name)
+    items, _ = await _reminders_page(list_name, False, 0, None, reminders.DEFAULT_FIELDS)
+    return {"list": list_name, "reminders": _plain(items)}
+
+
+# FastMCP has no subscription hooks, so they go on the low-level server,
+# which would otherwise advertise resources as not subscribable.
+_server = mcp._mcp_server
+_capabilities = _server.get_capabilities
+
+
+def _get_capabilities(*args, **kwargs):
+    capabilities = _capabilities(*args, **kwargs)
+    if capabilities.resources is not None:
+        capabilities.resources.subscribe = True
+    return capabilities
+
+
+_server.get_capabilities = _get_capabilities
+
+
+@_server.subscribe_resource()
+async def _subscribe(uri: AnyUrl) -> None:
+    session = _server.request_context.session
+    # A client may disconnect without unsubscribing; its subscriptions end
+    # with the session, so the watcher stops polling for it. Sessions have no
+    # public close hook: without the private exit stack, a subscription
+    # lasts until a notification to it fails.
+    exit_stack = getattr(session, "_exit_stack", None)
+    if exit_stack is not None and not watcher.is_subscribed(session):
+        exit_stack.callback(watcher.forget, session)
+    watcher.subscribe(str(uri), session)
+
+
+@_server.unsubscribe_resource()
+async def _unsubscribe(uri: AnyUrl) -> None:
+    watcher.unsubscribe(str(uri), _server.request_context.session)
 
 
 @mcp.tool()
-def list_reminder_lists() -> list[str]:
+@_timed
+async def list_reminder_lists() -> list[str]:
     """List all reminder lists available in the macOS Reminders app."""
-    return reminders.get_lists()
+    return await cache.get_lists_async(lambda: flights.do(("lists",), scheduler.read, aio.get_lists))
 
 
 @mcp.tool()
-def list_reminders(list_name: str = "", include_completed: bool = False) -> list[dict]:
+@_timed
+async def list_reminders(
+    list_name: str = "",
+    include_completed: bool = False,
+    limit: int = 100,
+    cursor: str = "",
+    due_after: str = "",
+    due_before: str = "",
+    search: str = "",
+    flagged: bool | None = None,
+    priority: int | None = None,
+    fields: list[str] | None = None,
+    notes_max_chars: int = 0,
+) -> dict:
     """
-    List reminders from the macOS Reminders app.
+    List reminders from the macOS Reminders app, one page at a time.
+
+    Filters are applied by the Reminders app, so only matching reminders are returned.
+    Ask only for the fields you need: notes in particular are slow to read and large.
 
     Args:
         list_name: Optional name of a specific list to filter by. Leave empty for all lists.
         include_completed: Whether to include completed reminders (default: False).
+        limit: Maximum number of reminders to return (default: 100, 0 for no limit).
+        cursor: The next_cursor value from a previous call to fetch the following page.
+        due_after: Only reminders due at or after this date, in ISO 8601, e.g. "2026-03-02" or "2026-03-02T09:00".
+        due_before: Only reminders due before this date, in ISO 8601.
+        search: Only reminders whose name or notes contain this text.
+        flagged: Only flagged (true) or unflagged (false) reminders.
+        priority: Only reminders with this priority (0 none, 1 high, 5 medium, 9 low).
+        fields: Fields to return, from "completed", "due_date", "notes", "flagged" and "priority"
+            (default: completed, due_date and notes). "id", "list" and "name" are always returned.
+        notes_max_chars: Cut notes longer than this many characters (default: 0, no limit).
+
+    Returns:
+        A dict with "reminders" and "next_cursor" (null on the last page).
+        Due dates are local ISO 8601 times, e.g. "2026-02-27T09:00:00".
     """
-    return reminders.get_reminders(
-        list_name=list_name or None,
+    items, next_cursor = await _reminders_page(
+        list_name or None,
+        include_completed,
+        limit,
+        cursor or None,
+        reminders._projection(fields),
+        max(notes_max_chars, 0),
+        due_after=due_after or None,
+        due_before=due_before or None,
+        search=search or None,
+        flagged=flagged,
+        priority=priority,
+    )
+    return {"reminders": _plain(items), "next_cursor": next_cursor}
+
+
+async def _reminders_page(
+    list_name: str | None,
+    include_completed: bool,
+    limit: int,
+    cursor: str | None,
+    fields: tuple[str, ...],
+    notes_max_chars: int = 0,
+    **filters,
+) -> tuple[list[Reminder], str | None]:
+    """Answer a listing from the mirror if possible, else from the app through the cache."""
+    await _settle()
+    due_dates = [filters[name] for name in ("due_after", "due_before") if filters.get(name)]
+    # Dates in the Mac's locale format can only be parsed by the app.
+    if mirror is not None and all(dates.parse_iso(value) for value in due_dates):
+        await _refresh_mirror()
+        return mirror.get_reminders_page(
+            list_name, include_completed, limit, cursor, fields=fields, notes_max_chars=notes_max_chars, **filters
+        )
+    projection = {"fields": fields, "notes_max_chars": notes_max_chars}
+    return await cache.get_reminders_async(
+        list_name,
+        include_completed,
+        lambda: _read_page(list_name, include_completed, limit, cursor, **filters, **projection),
+        limit=limit,
+        cursor=cursor,
+        filters=tuple((name, value) for name, value in filters.items() if value is not None),
+        projection=tuple(projection.values()),
+    )
+
+
+async def _all_reminders() -> list[Reminder]:
+    """Every reminder, completed or not, from the mirror when there is one."""
+    if mirror is not None:
+        await _refresh_mirror()
+        return mirror.get_reminders_page(include_completed=True)[0]
+    items, _ = await _read_page(None, True)
+    return items
+
+
+async def _read_page(
+    list_name: str | None, include_completed: bool, limit: int = 0, cursor: str | None = None, **filters
+) -> tuple[list[Reminder], str | None]:
+    """Read a page from the app, sharing an identical read already in flight."""
+    key = ("reminders", list_name, include_completed, limit, cursor, tuple(sorted(filters.items())))
+    return await flights.do(
+        key,
+        scheduler.read,
+        aio.get_reminders_page,
+        list_name=list_name,
         include_completed=include_completed,
+        limit=limit,
+        cursor=cursor,
+        **filters,
     )
 
 
 @mcp.tool()
-def create_reminder(
+@_timed
+async def search_reminders(
+    query: str,
+    list_name: str = "",
+    include_completed: bool = False,
+    limit: int = 20,
+) -> list[dict]:
+    """
+    Find reminders by words in their name or notes, best matches first.
+
+    Every word must match, either whole or as the start of a word, so "dent"
+    finds "Dentist appointment". Matches in the name rank above matches in notes.
+
+    Args:
+        query: Words to search for.
+        list_name: Optional list to search in. Leave empty for all lists.
+        include_completed: Whether to include completed reminders (default: False).
+        limit: Maximum number of results (default: 20, 0 for no limit).
+
+    Returns:
+        Matching reminders, each with a relevance "score".
+    """
+    await _settle()
+    async with _search_load:
+        if not search_index.is_fresh(search_max_age):
+            items = await _all_reminders()
+            await asyncio.to_thread(search_index.rebuild, items)
+    return search_index.search(query, limit, list_name or None, include_completed)
+
+
+@mcp.tool()
+@_timed
+async def agenda(list_name: str = "", days: int = 7, limit: int = 10) -> dict:
+    """
+    Show what is overdue, due today and coming up, earliest first.
+
+    Only incomplete reminders with a due date are read, in a single query, and
+    each section is capped at limit, so the answer stays small on any database.
+
+    Args:
+        list_name: Optional list to look in. Leave empty for all lists.
+        days: How many days after today count as upcoming (default: 7).
+        limit: Maximum reminders per section (default: 10, 0 for no limit).
+
+    Returns:
+        A dict with "overdue", "today" and "upcoming" reminders, "counts" of
+        all reminders in each section, and the "now" they were computed for.
+        Reminders at the same time are ordered by priority, high first.
+    """
+    now = datetime.now()
+    bounds = agenda_view.window(now, days)
+    # The end of the window only moves at midnight, so the query stays
+    # cacheable all day.
+    items, _ = await _reminders_page(
+        list_name or None,
+        False,
+        0,
+        None,
+        reminders._projection(agenda_view.FIELDS),
+        due_before=bounds["end"],
+    )
+    result = agenda_view.build(items, now, days, limit)
+    return {**result, **{bucket: _plain(result[bucket]) for bucket in agenda_view.BUCKETS}}
+
+
+@mcp.tool()
+@_timed
+async def reminder_counts(list_name: str = "") -> dict:
+    """
+    Count reminders per list: total, open, completed, overdue and flagged.
+
+    The counting is done by the Reminders app, so no reminders are read. Use this
+    instead of listing reminders to answer "how many" questions.
+
+    Args:
+        list_name: Optional list to count. Leave empty for all lists.
+
+    Returns:
+        A dict with one entry per list under "lists" and their sums under "total".
+        Overdue and flagged only count open reminders.
+    """
+    await _settle()
+    if mirror is not None:
+        await _refresh_mirror()
+        return mirror.get_counts(list_name or None)
+    return await flights.do(("counts", list_name or None), scheduler.read, aio.get_counts, list_name or None)
+
+
+@mcp.tool()
+@_timed
+async def create_reminder(
     name: str,
     list_name: str = "",
     due_date: str = "",
     notes: str = "",
-) -> str:
+) -> str | dict:
     """
     Create a new reminder in the macOS Reminders app.
 
     Args:
         name: The title of the reminder.
         list_name: The list to add the reminder to. Uses the default list if empty.
-        due_date: Optional due date, e.g. "February 28, 2026 at 9:00 AM".
+        due_date: Optional due date in ISO 8601, e.g. "2026-02-28T09:00".
         notes: Optional notes/body for the reminder.
 
     Returns:
-        The name of the created reminder.
+        The name of the created reminder, or a receipt if write-behind is on (see flush).
     """
-    return reminders.create_reminder(
-        name=name,
-        list_name=list_name or None,
-        due_date=due_date or None,
-        notes=notes or None,
-    )
+    item = _without_empty({"name": name, "list_name": list_name, "due_date": due_date, "notes": notes})
+    if write_queue.enabled:
+        return await _enqueue("create", item)
+    # A one-item batch, so the search index gets the id the script returned.
+    result = (await _create_many([item]))[0]
+    reminders._single(result)
+    return result["name"]
 
 
 @mcp.tool()
-def update_reminder(
-    name: str,
+@_timed
+async def update_reminder(
+    name: str = "",
     list_name: str = "",
     new_name: str = "",
     notes: str = "",
     due_date: str = "",
-) -> bool:
+    reminder_id: str = "",
+) -> bool | dict:
     """
     Update properties of an existing reminder.
 
     Args:
-        name: The exact current name of the reminder to update.
+        name: The exact current name of the reminder to update. Not needed if reminder_id is given.
         list_name: Optional list name to narrow the search.
         new_name: New title for the reminder. Leave empty to keep unchanged.
         notes: New notes/description. Leave empty to keep unchanged.
-        due_date: New due date, e.g. "February 28, 2026 at 9:00 AM". Leave empty to keep unchanged.
+        due_date: New due date in ISO 8601, e.g. "2026-02-28T09:00". Leave empty to keep unchanged.
+        reminder_id: The reminder's id from list_reminders. Preferred over name: faster and unambiguous.
 
     Returns:
-        True if the reminder was found and updated, False otherwise.
+        True if the reminder was found and updated, False otherwise, or a receipt if
+        write-behind is on (see flush).
     """
-    return reminders.update_reminder(
-        name=name,
+    target = {"name": name, "list_name": list_name, "reminder_id": reminder_id, "new_name": new_name}
+    if write_queue.enabled:
+        return await _enqueue("update", _without_empty(target | {"notes": notes, "due_date": due_date}))
+    updated = await _write(
+        reminder_keys(target),
+        aio.update_reminder,
+        name=name or None,
         list_name=list_name or None,
         new_name=new_name or None,
         notes=notes or None,
         due_date=due_date or None,
+        reminder_id=reminder_id or None,
     )
+    if updated:
+        cache.reminder_updated(name or None, list_name or None, reminder_id or None)
+        search_index.reminder_updated(_without_empty(target | {"notes": notes, "due_date": due_date}), reminder_id or None)
+    return updated
 
 
 @mcp.tool()
-def complete_reminder(name: str, list_name: str = "") -> bool:
+@_timed
+async def complete_reminder(name: str = "", list_name: str = "", reminder_id: str = "") -> bool | dict:
     """
     Mark a reminder as completed.
 
     Args:
-        name: The exact name of the reminder to complete.
+        name: The exact name of the reminder to complete. Not needed if reminder_id is given.
         list_name: Optional list name to narrow the search.
+        reminder_id: The reminder's id from list_reminders. Preferred over name: faster and unambiguous.
 
     Returns:
-        True if the reminder was found and completed, False otherwise.
+        True if the reminder was found and completed, False otherwise, or a receipt if
+        write-behind is on (see flush).
     """
-    return reminders.complete_reminder(name=name, list_name=list_name or None)
+    target = {"name": name, "list_name": list_name, "reminder_id": reminder_id}
+    if write_queue.enabled:
+        return await _enqueue("complete", _without_empty(target))
+    completed = await _write(
+        reminder_keys(target),
+        aio.complete_reminder,
+        name=name or None,
+        list_name=list_name or None,
+        reminder_id=reminder_id or None,
+    )
+    if completed:
+        cache.reminder_changed(name or None, list_name or None, reminder_id or None)
+        search_index.reminder_completed(_without_empty(target), reminder_id or None)
+    return completed
 
 
 @mcp.tool()
-def delete_reminder(name: str, list_name: str = "") -> bool:
+@_timed
+async def delete_reminder(name: str = "", list_name: str = "", reminder_id: str = "") -> bool | dict:
     """
     Delete a reminder permanently.
 
     Args:
-        name: The exact name of the reminder to delete.
+        name: The exact name of the reminder to delete. Not needed if reminder_id is given.
         list_name: Optional list name to narrow the search.
+        reminder_id: The reminder's id from list_reminders. Preferred over name: faster and unambiguous.
+
+    Returns:
+        True if the reminder was found and deleted, False otherwise, or a receipt if
+        write-behind is on (see flush).
+    """
+    target = {"name": name, "list_name": list_name, "reminder_id": reminder_id}
+    if write_queue.enabled:
+        return await _enqueue("delete", _without_empty(target))
+    deleted = await _write(
+        reminder_keys(target),
+        aio.delete_reminder,
+        name=name or None,
+        list_name=list_name or None,
+        reminder_id=reminder_id or None,
+    )
+    if deleted:
+        cache.reminder_changed(name or None, list_name or None, reminder_id or None)
+        search_index.reminder_deleted(_without_empty(target), reminder_id or None)
+    return deleted
+
+
+class ReminderTarget(TypedDict):
+    name: NotRequired[str]
+    list_name: NotRequired[str]
+    reminder_id: NotRequired[str]
+
+
+class NewReminder(TypedDict):
+    name: str
+    list_name: NotRequired[str]
+    due_date: NotRequired[str]
+    notes: NotRequired[str]
+
+
+class ReminderUpdate(TypedDict):
+    name: NotRequired[str]
+    list_name: NotRequired[str]
+    reminder_id: NotRequired[str]
+    new_name: NotRequired[str]
+    notes: NotRequired[str]
+    due_date: NotRequired[str]
+
+
+def _without_empty(item: dict) -> dict:
+    """Drop empty strings, which tools treat as "not given"."""
+    return {key: value for key, value in item.items() if value != ""}
+
+
+@mcp.tool()
+@_timed
+async def create_reminders(items: list[NewReminder]) -> list[dict]:
+    """
+    Create many reminders in one call.
+
+    Args:
+        items: Reminders to create, each with a name and optional list_name, due_date and notes.
+
+    Returns:
+        One {"name", "id", "success", "error"} result per reminder, in order.
+    """
+    await _settle()
+    return await _create_many([_without_empty(item) for item in items])
+
+
+async def _create_many(items: list[dict]) -> list[dict]:
+    results = await _write(
+        (key for item in items for key in reminder_keys(item)), aio.create_reminders, items
+    )
+    for item, result in zip(items, results):
+        if result["success"]:
+            cache.reminder_created(item.get("list_name"))
+            search_index.reminder_created(item, result["id"])
+    return results
+
+
+@mcp.tool()
+@_timed
+async def update_reminders(items: list[ReminderUpdate]) -> list[dict]:
+    """
+    Update many reminders in one call.
+
+    Args:
+        items: Changes to apply, each with a reminder_id or the reminder's current name and optional
+            list_name, plus any of new_name, notes and due_date to change.
 
     Returns:
-        True if the reminder was found and deleted, False otherwise.
+        One {"name", "id", "success", "error"} result per update, in order.
     """
-    return reminders.delete_reminder(name=name, list_name=list_name or None)
+    await _settle()
+    return await _update_many([_without_empty(item) for item in items])
+
+
+async def _update_many(items: list[dict]) -> list[dict]:
+    results = await _write(
+        (key for item in items for key in reminder_keys(item)), aio.update_reminders, items
+    )
+    for item, result in zip(items, results):
+        if result["success"]:
+            cache.reminder_updated(item.get("name"), item.get("list_name"), result["id"])
+            search_index.reminder_updated(item, result["id"])
+    return results
+
+
+@mcp.tool()
+@_timed
+async def complete_reminders(items: list[ReminderTarget]) -> list[dict]:
+    """
+    Mark many reminders as completed in one call.
+
+    Args:
+        items: Reminders to complete, each with a reminder_id or a name and optional list_name.
+
+    Returns:
+        One {"name", "id", "success", "error"} result per reminder, in order.
+    """
+    await _settle()
+    return await _complete_many([_without_empty(item) for item in items])
+
+
+async def _complete_many(items: list[dict]) -> list[dict]:
+    results = await _write(
+        (key for item in items for key in reminder_keys(item)), aio.complete_reminders, items
+    )
+    for item, result in zip(items, results):
+        if result["success"]:
+            cache.reminder_changed(item.get("name"), item.get("list_name"), result["id"])
+            search_index.reminder_completed(item, result["id"])
+    return results
+
+
+@mcp.tool()
+@_timed
+async def delete_reminders(items: list[ReminderTarget]) -> list[dict]:
+    """
+    Delete many reminders permanently in one call.
+
+    Args:
+        items: Reminders to delete, each with a reminder_id or a name and optional list_name.
+
+    Returns:
+        One {"name", "id", "success", "error"} result per reminder, in order.
+    """
+    await _settle()
+    return await _delete_many([_without_empty(item) for item in items])
+
+
+async def _delete_many(items: list[dict]) -> list[dict]:
+    results = await _write(
+        (key for item in items for key in reminder_keys(item)), aio.delete_reminders, items
+    )
+    for item, result in zip(items, results):
+        if result["success"]:
+            cache.reminder_changed(item.get("name"), item.get("list_name"), result["id"])
+            search_index.reminder_deleted(item, result["id"])
+    return results
+
+
+_APPLY = {"create": _create_many, "update": _update_many, "complete": _complete_many, "delete": _delete_many}
+
+
+async def _enqueue(kind: str, item: dict) -> dict:
+    """Queue a single-reminder write and acknowledge it with a receipt."""
+    if kind != "create" and not item.get("name") and not item.get("reminder_id"):
+        raise ValueError("Either name or reminder_id is required")
+    receipt = write_queue.add(kind, item)
+    if write_queue.full():
+        try:
+            await _flush_writes()
+        except RuntimeError:
+            # The writes stay queued and are retried by the timer.
+            pass
+    _schedule_flush()
+    return receipt
+
+
+def _schedule_flush() -> None:
+    global _flush_timer
+    if _flush_timer is None and len(write_queue):
+        _flush_timer = asyncio.get_running_loop().call_later(write_queue.delay, _flush_later)
+
+
+def _flush_later() -> None:
+    global _flush_timer, _flush_task
+    _flush_timer = None
+    _flush_task = asyncio.ensure_future(_background_flush())
+
+
+async def _background_flush() -> None:
+    try:
+        await _flush_writes()
+    except Exception:
+        # Nobody awaits this task: log the error and retry later, since the
+        # writes are back in the queue.
+        logger.exception("Write-behind flush failed; retrying in %s s", write_queue.delay)
+        _schedule_flush()
+
+
+async def _settle() -> None:
+    """Apply queued writes before a read, so reads see every acknowledged write."""
+    if len(write_queue):
+        await _flush_writes()
+
+
+async def _flush_writes() -> None:
+    """Apply queued writes in order, each run of one kind as one batch.
+
+    If a batch fails as a whole, it and everything after it go back in the
+    queue and the error is raised.
+    """
+    global _flush_timer
+    async with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        runs = batches(write_queue.take())
+        try:
+            while runs:
+                results = await _APPLY[runs[0][0].kind]([write.item for write in runs[0]])
+                write_queue.settle(runs.pop(0), results)
+        finally:
+            write_queue.restore([write for run in runs for write in run])
+            write_queue.commit()
+
+
+def _drain_writes() -> None:
+    """Apply writes still queued at shutdown; a journal keeps any that fail."""
+    runs = batches(write_queue.take())
+    try:
+        while runs:
+            apply = getattr(reminders, f"{runs[0][0].kind}_reminders")
+            results = apply([write.item for write in runs[0]])
+            write_queue.settle(runs.pop(0), results)
+    except RuntimeError:
+        pass
+    finally:
+        write_queue.restore([write for run in runs for write in run])
+        write_queue.commit()
+
+
+@mcp.tool()
+@_timed
+async def flush(tickets: list[int] | None = None) -> list[dict]:
+    """
+    Apply queued writes now and report what became of the given tickets.
+
+    Only needed when write-behind is on: create_reminder, update_reminder,
+    complete_reminder and delete_reminder then return a receipt with a "ticket"
+    instead of their result, and queued writes are applied in batches after a
+    short delay, when the queue fills up, or before any read. Writes to the same
+    reminder are merged, so several tickets can share one outcome.
+
+    Args:
+        tickets: Tickets from your receipts. Each outcome is reported once, to
+            whoever asks for its ticket; without tickets the queue is only applied.
+
+    Returns:
+        One {"tickets", "action", "name", "id", "success", "error"} outcome per write,
+        in ticket order. "action" is "cancel" for a create that a delete undid before
+        it was applied, and "unknown" for a ticket that was already reported.
+    """
+    await _flush_writes()
+    return write_queue.outcomes(tickets or ())
+
+
+@mcp.tool()
+@_timed
+async def export_reminders(path: str, include_completed: bool = True) -> dict:
+    """
+    Back up every reminder to an NDJSON file, one JSON object per line.
+
+    Lists are read one page at a time and written as they arrive, so memory
+    use stays small on any database.
+
+    Args:
+        path: Absolute path of the file to write. Only an earlier export may be replaced, once the
+            export succeeds.
+        include_completed: Whether to export completed reminders too (default: True).
+
+    Returns:
+        The "path" written, the number of reminders per list under "lists", and the "reminders" total.
+    """
+    target = transfer.export_target(path)
+    await _settle()
+    return await scheduler.read(asyncio.to_thread, transfer.export_file, target, include_completed)
+
+
+@mcp.tool()
+@_timed
+async def import_reminders(path: str, chunk_size: int = transfer.CHUNK_SIZE) -> dict:
+    """
+    Create the reminders in an NDJSON file written by export_reminders.
+
+    Reminders are created chunk_size at a time with one script per chunk, and
+    missing lists are created. Progress is saved to path + ".progress" after
+    every chunk, so calling this again after an interruption resumes the import.
+
+    Args:
+        path: Absolute path of a file written by export_reminders. A path + ".progress" file that is
+            not an import checkpoint is never overwritten.
+        chunk_size: Reminders to create per script (default: 100).
+
+    Returns:
+        Counts of reminders "created", "completed" and "failed", the first "errors",
+        the line the import "resumed_at_line", and the "lists" written to.
+    """
+    source = transfer.import_source(path)
+    await _settle()
+    try:
+        result = await scheduler.write((), asyncio.to_thread, transfer.import_reminders, source, chunk_size)
+    finally:
+        # Even a partial import leaves reminders behind.
+        _lists_changed([])
+        cache.clear()
+    return result
+
+
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="reminders-mcp", description="MCP server for macOS Reminders.")
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "http", "sse"),
+        default=os.environ.get("REMINDERS_MCP_TRANSPORT") or "stdio",
+        help="stdio for a single client (default), or http (streamable HTTP) / sse to serve many",
+    )
+    parser.add_argument("--host", default=os.environ.get("REMINDERS_MCP_HOST") or "127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("REMINDERS_MCP_PORT") or 8000))
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=int(os.environ.get("REMINDERS_MCP_MAX_CONNECTIONS") or 0),
+        help="concurrent connections before new ones get HTTP 503 (default: 0, unlimited)",
+    )
+    parser.add_argument(
+        "--shutdown-timeout",
+        type=float,
+        default=float(os.environ.get("REMINDERS_MCP_SHUTDOWN_TIMEOUT") or 10),
+        help="seconds to let open requests finish after SIGINT/SIGTERM (default: 10)",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="{export,import}")
+    export = commands.add_parser("export", help="write every reminder to an NDJSON file and exit")
+    export.add_argument("path", help='file to write, or "-" for stdout')
+    export.add_argument("--open-only", action="store_true", help="leave out completed reminders")
+    imports = commands.add_parser("import", help="create the reminders in an NDJSON export and exit")
+    imports.add_argument("path")
+    imports.add_argument("--chunk-size", type=int, default=transfer.CHUNK_SIZE, help="reminders per script")
+    imports.add_argument("--checkpoint", help='progress file to resume from (default: PATH + ".progress")')
+    return parser.parse_args(argv)
+
+
+def _transfer(args: argparse.Namespace) -> None:
+    """Run an export or import subcommand; its summary goes to stderr."""
+    try:
+        if args.command == "export":
+            result = transfer.export_file(args.path, not args.open_only)
+        else:
+            result = transfer.import_reminders(args.path, args.chunk_size, args.checkpoint)
+    finally:
+        reminders.configure_pool(0)
+    print(json.dumps(result, indent=2, ensure_ascii=False), file=sys.stderr)
+
+
+def _serve_http(args: argparse.Namespace) -> None:
+    """Serve every client from this process, sharing its cache, scheduler and workers."""
+    import uvicorn
+
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    if args.host not in LOOPBACK_HOSTS:
+        # FastMCP only knows which Host headers to allow on loopback.
+        mcp.settings.transport_security = None
+    app = mcp.streamable_http_app() if args.transport == "http" else mcp.sse_app()
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        limit_concurrency=args.max_connections or None,
+        timeout_graceful_shutdown=args.shutdown_timeout,
+        log_level=mcp.settings.log_level.lower(),
+    )
+    try:
+        uvicorn.Server(config).run()
+    except KeyboardInterrupt:
+        # uvicorn re-raises SIGINT once open requests have drained.
+        pass
+    finally:
+        _drain_writes()
+        reminders.configure_pool(0)
+        if mirror is not None:
+            mirror.close()
 
 
-def main():
-    mcp.run()
+def main(argv: list[str] | None = None):
+    args = _parse_args(argv)
+    if args.command:
+        _transfer(args)
+        return
+    interval = float(os.environ.get("REMINDERS_MCP_STATS_INTERVAL") or 0)
+    if interval > 0:
+        log_path = os.environ.get("REMINDERS_MCP_STATS_LOG")
+        # stdout carries the MCP protocol, so stats go to stderr by default.
+        stream = open(log_path, "a", encoding="utf-8") if log_path else None
+        Reporter(interval, stream).start()
+    if args.transport == "stdio":
+        try:
+            mcp.run()
+        finally:
+            _drain_writes()
+    else:
+        _serve_http(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+"""Latency and size counters for tools and AppleScript calls.
+
+Timers are named ``tool.<name>`` for MCP tools and ``applescript.<phase>``
+for the stages of a script call:
+
+    spawn     starting an osascript process or pool worker
+    compile   compiling a handler with osacompile
+    execute   running the script until its output is read (for one-shot
+              sync calls this includes starting the process)
+    parse     decoding the output into Python values
+
+Each timer keeps a log-bucketed histogram, so p50/p95/p99 cost constant
+memory however many calls are recorded.
+"""
+
+import json
+import math
+import sys
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from typing import TextIO
+
+# Bucket ``i`` holds durations up to MIN_SECONDS * GROWTH ** i, so reported
+# percentiles overstate the true value by at most ~9%.
+MIN_SECONDS = 1e-5
+GROWTH = 2 ** (1 / 8)
+
+
+class Histogram:
+    """Log-bucketed histogram of durations in seconds."""
+
+    def __init__(self):
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        index = 0 if seconds <= MIN_SECONDS else math.ceil(math.log(seconds / MIN_SECONDS, GROWTH))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket holding the given fraction of samples."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(MIN_SECONDS * GROWTH ** index, self.max)
+        return self.max
+
+
+class Sample:
+    """Extra data for the measurement in progress."""
+
+    __slots__ = ("nbytes",)
+
+    def __init__(self):
+        self.nbytes: int | None = None
+
+
+class Metrics:
+    """Named timers with byte and error counts, safe to share between threads."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._histograms: dict[str, Histogram] = {}
+        self._bytes: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._started = time.time()
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, nbytes: int | None = None, error: bool = False) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.add(seconds)
+            if nbytes is not None:
+                self._bytes[name] = self._bytes.get(name, 0) + nbytes
+            if error:
+                self._errors[name] = self._errors.get(name, 0) + 1
+
+    @contextmanager
+    def timer(self, name: str):
+        """Time the block under ``name``, counting it as an error if it raises.
+
+        Yields a Sample whose ``nbytes`` the block may set.
+        """
+        sample = Sample()
+        start = self._clock()
+        try:
+            yield sample
+        except BaseException:
+            self.record(name, self._clock() - start, sample.nbytes, error=True)
+            raise
+        self.record(name, self._clock() - start, sample.nbytes)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            timers = {
+                name: {
+                    "count": histogram.count,
+                    "errors": self._errors.get(name, 0),
+                    "mean_ms": histogram.total / histogram.count * 1000,
+                    "p50_ms": histogram.percentile(0.50) * 1000,
+                    "p95_ms": histogram.percentile(0.95) * 1000,
+                    "p99_ms": histogram.percentile(0.99) * 1000,
+                    "max_ms": histogram.max * 1000,
+                    "bytes": self._bytes.get(name, 0),
+                }
+                for name, histogram in sorted(self._histograms.items())
+            }
+        return {"uptime_seconds": time.time() - self._started, "timers": timers}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._bytes.clear()
+            self._errors.clear()
+
+
+metrics = Metrics()
+
+
+class Reporter:
+    """Writes a JSON snapshot of ``metrics`` as one line every ``interval`` seconds."""
+
+    def __init__(self, interval: float, stream: TextIO | None = None, source: Metrics = metrics):
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.source = source
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def emit(self) -> None:
+        line = json.dumps({"timestamp": time.time(), **self.source.snapshot()})
+        self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="reminders-mcp-stats", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.emit()
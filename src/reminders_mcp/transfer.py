@@ -0,0 +1,215 @@
+"""Export of the whole database to NDJSON, and bulk import from it.
+
+Exports are written one JSON object per reminder, list by list and a page at
+a time, so memory stays bounded by the page size whatever the size of the
+database. Imports read the file a chunk at a time and create each chunk with
+one batch script, completing the reminders that were completed in the
+export with a second. After each chunk the number of lines consumed is saved
+to a checkpoint file, so an interrupted import resumes where it stopped; at
+most the chunk in progress when it stopped is created twice.
+
+Flags and priorities are exported but cannot be set by the create script,
+so imported reminders start unflagged with no priority.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+
+from reminders_mcp import reminders
+from reminders_mcp.record import FIELDS
+
+PAGE_SIZE = 500
+CHUNK_SIZE = 100
+
+# Creates each list named in argv that does not exist yet.
+ENSURE_LISTS_SCRIPT = """
+on run argv
+    tell application "Reminders"
+        repeat with listName in argv
+            if not (exists list (listName as string)) then
+                make new list with properties {name:(listName as string)}
+            end if
+        end repeat
+    end tell
+    return ""
+end run
+"""
+
+
+def export_reminders(out: TextIO, include_completed: bool = True, page_size: int = PAGE_SIZE) -> dict:
+    """Write every reminder to ``out`` as NDJSON; returns how many were written per list."""
+    counts = {}
+    for list_name in dict.fromkeys(reminders.get_lists()):
+        counts[list_name] = 0
+        cursor = None
+        while True:
+            items, cursor = reminders.get_reminders_page(
+                list_name, include_completed, page_size, cursor, fields=FIELDS
+            )
+            out.writelines(json.dumps(item.to_dict(), ensure_ascii=False) + "\n" for item in items)
+            counts[list_name] += len(items)
+            if cursor is None:
+                break
+    return {"lists": counts, "reminders": sum(counts.values())}
+
+
+def export_file(path: str | Path, include_completed: bool = True) -> dict:
+    """Export to ``path``, or to stdout if it is "-"."""
+    if str(path) == "-":
+        return export_reminders(sys.stdout, include_completed)
+    path = Path(path).expanduser()
+    # A failed export leaves any earlier one at ``path`` untouched.
+    with _replacing(path) as out:
+        result = export_reminders(out, include_completed)
+    return {"path": str(path), **result}
+
+
+def export_target(path: str) -> Path:
+    """Check a path a client asked to export to, for the export_reminders tool.
+
+    Clients may only name an absolute path, never stdout (under the stdio
+    transport that is the protocol stream), and may only replace a file that
+    holds an earlier export.
+    """
+    if path == "-" or not Path(path).expanduser().is_absolute():
+        raise ValueError(f"Export path must be absolute: {path!r}")
+    target = Path(path).expanduser()
+    if target.exists() and not _is_export(target):
+        raise ValueError(f"Refusing to overwrite {path}, which is not an earlier export")
+    return target
+
+
+def import_source(path: str) -> Path:
+    """Check a path a client asked to import from, for the import_reminders tool.
+
+    As with export_target, only absolute paths are accepted, and only files
+    an export wrote: the import keeps its progress next to them.
+    """
+    if path == "-" or not Path(path).expanduser().is_absolute():
+        raise ValueError(f"Import path must be absolute: {path!r}")
+    source = Path(path).expanduser()
+    if not _is_export(source):
+        raise ValueError(f"Refusing to import {path}, which is not an export")
+    return source
+
+
+def _is_export(path: Path) -> bool:
+    """Whether ``path`` is a file written by an export: empty, or NDJSON reminders."""
+    if not path.is_file():
+        return False
+    with path.open(encoding="utf-8", errors="replace") as source:
+        first = source.readline()
+    if not first:
+        return True
+    try:
+        record = json.loads(first)
+    except ValueError:
+        return False
+    return isinstance(record, dict) and {"id", "list", "name"} <= record.keys()
+
+
+@contextmanager
+def _replacing(path: Path) -> Iterator[TextIO]:
+    """Write a temporary file next to ``path`` that replaces it on success."""
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            yield out
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _new_item(record: dict) -> dict:
+    """create_reminders arguments for an exported reminder."""
+    if not record.get("name"):
+        raise ValueError(f"Exported reminder without a name: {record!r}")
+    item = {"name": record["name"]}
+    for field, key in (("list", "list_name"), ("due_date", "due_date"), ("notes", "notes")):
+        if record.get(field):
+            item[key] = record[field]
+    return item
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterable[list[str]]:
+    lines = iter(lines)
+    while chunk := list(islice(lines, size)):
+        yield chunk
+
+
+def _load_checkpoint(checkpoint: Path) -> int:
+    """Return the lines already imported according to ``checkpoint``, 0 if there is none.
+
+    Anything but a checkpoint an import wrote is refused rather than taken
+    over, since the import overwrites and finally removes it.
+    """
+    if not checkpoint.exists():
+        return 0
+    try:
+        lines = json.loads(checkpoint.read_text(encoding="utf-8"))["lines"]
+    except (OSError, ValueError, TypeError, KeyError):
+        lines = None
+    if not isinstance(lines, int) or isinstance(lines, bool) or lines < 0:
+        raise ValueError(f"Refusing to resume from {checkpoint}, which is not an import checkpoint")
+    return lines
+
+
+def _save_checkpoint(checkpoint: Path, lines: int) -> None:
+    with _replacing(checkpoint) as out:
+        out.write(json.dumps({"lines": lines}))
+
+
+def import_reminders(
+    path: str | Path, chunk_size: int = CHUNK_SIZE, checkpoint: str | Path | None = None
+) -> dict:
+    """Create the reminders exported to ``path``, resuming from ``checkpoint`` if it exists.
+
+    The checkpoint defaults to ``path`` with ".progress" appended and is
+    removed once the whole file has been imported. Lists that do not exist
+    are created. Returns counts of reminders created, completed and failed,
+    the first errors, and the lists that were written to.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    path = Path(path).expanduser()
+    checkpoint = Path(checkpoint).expanduser() if checkpoint else path.with_name(path.name + ".progress")
+    start = _load_checkpoint(checkpoint)
+    result = {"created": 0, "completed": 0, "failed": 0, "errors": [], "resumed_at_line": start, "lists": []}
+    known_lists = set(reminders.get_lists())
+    consumed = start
+    with path.open(encoding="utf-8") as source:
+        for chunk in _chunks(islice(source, start, None), chunk_size):
+            records = [json.loads(line) for line in chunk if line.strip()]
+            missing = list(dict.fromkeys(
+                record["list"] for record in records if record.get("list") and record["list"] not in known_lists
+            ))
+            if missing:
+                reminders._run_applescript(ENSURE_LISTS_SCRIPT, *missing)
+                known_lists.update(missing)
+            touched = {record["list"] for record in records if record.get("list")}
+            result["lists"].extend(sorted(touched - set(result["lists"])))
+            created = reminders.create_reminders([_new_item(record) for record in records]) if records else []
+            done = [
+                {"reminder_id": outcome["id"]}
+                for record, outcome in zip(records, created)
+                if outcome["success"] and record.get("completed")
+            ]
+            completed = reminders.complete_reminders(done) if done else []
+            for outcome in created + completed:
+                if not outcome["success"] and len(result["errors"]) < 10:
+                    result["errors"].append({"name": outcome["name"], "error": outcome["error"]})
+            result["created"] += sum(outcome["success"] for outcome in created)
+            result["failed"] += sum(not outcome["success"] for outcome in created)
+            result["completed"] += sum(outcome["success"] for outcome in completed)
+            consumed += len(chunk)
+            _save_checkpoint(checkpoint, consumed)
+    checkpoint.unlink(missing_ok=True)
+    return result
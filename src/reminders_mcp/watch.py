@@ -0,0 +1,183 @@
+"""Change notifications for subscribed reminder lists.
+
+A snapshot fingerprints each list by its reminder ids and their modification
+dates, read with two Apple events per list and without any other reminder
+properties. The watcher polls for a snapshot while anyone is subscribed,
+compares it with the previous one, and notifies only the sessions subscribed
+to lists that changed.
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+from urllib.parse import quote, unquote
+
+from pydantic import AnyUrl
+
+from reminders_mcp import wire
+
+# Output: one block of three fields per list: the list name, then its
+# reminder ids and their modification dates, each separated by US. Dates are
+# only compared, so their locale format does not matter.
+SNAPSHOT_SCRIPT = """
+on run
+    set RS to character id 30
+    set US to character id 31
+    set output to {}
+    tell application "Reminders"
+        repeat with l in lists
+            set end of output to name of l
+            tell l
+                set rIds to id of reminders
+                set rModified to modification date of reminders
+            end tell
+            set AppleScript's text item delimiters to US
+            set end of output to rIds as string
+            set end of output to rModified as string
+            set AppleScript's text item delimiters to ""
+        end repeat
+    end tell
+    set AppleScript's text item delimiters to RS
+    set output to output as string
+    set AppleScript's text item delimiters to ""
+    return output
+end run
+"""
+
+SNAPSHOT_WIDTH = 3
+URI_PREFIX = "reminders://list/"
+
+
+def list_uri(name: str) -> str:
+    """Return the resource URI of the list called ``name``."""
+    return URI_PREFIX + quote(name, safe="")
+
+
+def list_name(uri: str) -> str | None:
+    """Return the list a resource URI refers to, or None for other resources."""
+    uri = str(uri)
+    if not uri.startswith(URI_PREFIX) or len(uri) == len(URI_PREFIX):
+        return None
+    return unquote(uri[len(URI_PREFIX):])
+
+
+def parse_snapshot(output: str) -> dict[str, str]:
+    """Map each list name to a fingerprint of its reminder ids and modification dates."""
+    fields = list(wire.iter_fields([output]))
+    if len(fields) % SNAPSHOT_WIDTH:
+        raise RuntimeError("AppleScript error: malformed snapshot output")
+    hashes: dict[str, Any] = {}
+    for start in range(0, len(fields), SNAPSHOT_WIDTH):
+        name, ids, modified = fields[start:start + SNAPSHOT_WIDTH]
+        # Lists sharing a name share a resource, so they share a fingerprint.
+        digest = hashes.setdefault(name, hashlib.sha1())
+        digest.update(f"{ids}\x1e{modified}\x1e".encode())
+    return {name: digest.hexdigest() for name, digest in hashes.items()}
+
+
+def diff(old: dict[str, str], new: dict[str, str]) -> list[str]:
+    """Return the lists added, changed or removed between two snapshots."""
+    changed = [name for name, fingerprint in new.items() if old.get(name) != fingerprint]
+    return changed + [name for name in old if name not in new]
+
+
+class Watcher:
+    """Polls for snapshots while lists are subscribed and notifies their sessions.
+
+    ``read`` returns SNAPSHOT_SCRIPT output; ``on_change`` is called with the
+    names of changed lists before any session is notified, so they re-read
+    fresh data. Sessions only need an async ``send_resource_updated(uri)``.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[], Awaitable[str]],
+        interval: float = 10.0,
+        on_change: Callable[[list[str]], None] | None = None,
+    ):
+        self.interval = interval
+        self._read = read
+        self._on_change = on_change
+        self._sessions: dict[str, set] = {}
+        self._snapshot: dict[str, str] | None = None
+        self._task: asyncio.Task | None = None
+        self.polls = 0
+        self.changes = 0
+        self.notifications = 0
+
+    def subscribe(self, uri: str, session: Any) -> None:
+        """Notify ``session`` when the list at ``uri`` changes; starts polling if needed."""
+        name = list_name(uri)
+        if name is None:
+            raise ValueError(f"Only reminder lists can be subscribed to, not {uri}")
+        self._sessions.setdefault(list_uri(name), set()).add(session)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        name = list_name(uri)
+        key = list_uri(name) if name is not None else str(uri)
+        sessions = self._sessions.get(key)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._sessions[key]
+
+    def forget(self, session: Any) -> None:
+        """Drop every subscription of ``session``, for clients that went away without unsubscribing."""
+        for key, sessions in list(self._sessions.items()):
+            sessions.discard(session)
+            if not sessions:
+                del self._sessions[key]
+
+    def is_subscribed(self, session: Any) -> bool:
+        return any(session in sessions for sessions in self._sessions.values())
+
+    def stats(self) -> dict:
+        return {
+            "subscriptions": sum(len(sessions) for sessions in self._sessions.values()),
+            "polls": self.polls,
+            "changes": self.changes,
+            "notifications": self.notifications,
+        }
+
+    async def poll(self) -> list[str]:
+        """Take a snapshot; returns the lists changed since the previous one."""
+        snapshot = parse_snapshot(await self._read())
+        self.polls += 1
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None:
+            return []
+        changed = diff(previous, snapshot)
+        if changed:
+            self.changes += len(changed)
+            if self._on_change is not None:
+                self._on_change(changed)
+            await self._notify(changed)
+        return changed
+
+    async def _notify(self, names: Iterable[str]) -> None:
+        for name in names:
+            uri = list_uri(name)
+            for session in list(self._sessions.get(uri, ())):
+                try:
+                    await session.send_resource_updated(AnyUrl(uri))
+                    self.notifications += 1
+                except Exception:
+                    # The client has gone away; whatever the transport raised,
+                    # stop notifying it.
+                    self.unsubscribe(uri, session)
+
+    async def _run(self) -> None:
+        try:
+            while self._sessions:
+                try:
+                    await self.poll()
+                except RuntimeError:
+                    # A failed snapshot is retried at the next interval.
+                    pass
+                await asyncio.sleep(self.interval)
+        finally:
+            # The next subscription starts from a fresh baseline.
+            self._snapshot = None
@@ -0,0 +1,125 @@
+"""Decoding of the record-separated output of the AppleScript handlers.
+
+Handlers return fields separated by RS (character id 30); a field holding a
+column of values separates them with US (character id 31). Neither control
+character can be typed into Reminders, so names and notes containing ``|``,
+commas or newlines need no escaping. A field is complete as soon as the next
+RS arrives, which lets output be decoded while it is still being read.
+"""
+
+import sys
+from collections.abc import Iterable, Iterator
+from itertools import repeat
+
+RS = "\x1e"
+US = "\x1f"
+
+# get_reminders emits one block per list: list name, item count, then the
+# id and name columns and one column per requested optional field, in this
+# order. Listings ask for DEFAULT_FIELDS unless told otherwise.
+OPTIONAL_FIELDS = ("completed", "due_date", "notes", "flagged", "priority")
+DEFAULT_FIELDS = ("completed", "due_date", "notes")
+NEXT_MARKER = "next:"
+
+
+class FieldReader:
+    """Split RS-separated text into fields as it arrives in chunks."""
+
+    def __init__(self):
+        self._pending: list[str] = []
+        self._seen_input = False
+
+    def feed(self, chunk: str) -> list[str]:
+        """Return the fields completed by ``chunk``."""
+        if not chunk:
+            return []
+        self._seen_input = True
+        parts = chunk.split(RS)
+        if len(parts) == 1:
+            self._pending.append(chunk)
+            return []
+        parts[0] = "".join(self._pending) + parts[0]
+        self._pending = [parts.pop()]
+        return parts
+
+    def close(self) -> list[str]:
+        """Return the final field. Empty input has no fields at all."""
+        if not self._seen_input:
+            return []
+        last = "".join(self._pending)
+        self._pending = []
+        self._seen_input = False
+        return [last]
+
+
+def iter_fields(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield the RS-separated fields of text split across ``chunks``."""
+    reader = FieldReader()
+    for chunk in chunks:
+        yield from reader.feed(chunk)
+    yield from reader.close()
+
+
+class PageDecoder:
+    """Incrementally decode get_reminders output into reminder rows.
+
+    Rows are ``(list, id, name, completed, due, notes, flagged, priority)``
+    tuples of raw strings; a list's rows become available once its whole block has arrived.
+    ``fields`` are the fields the script was asked for; optional fields not
+    among them are empty strings in every row. A block whose columns disagree with
+    its count, or one cut short, raises RuntimeError. After close(), ``next_position`` holds the
+    ``(list index, offset)`` of the following page, or None on the last page.
+    """
+
+    def __init__(self, fields: tuple[str, ...] = DEFAULT_FIELDS):
+        self._reader = FieldReader()
+        self._block: list[str] = []
+        self._fields = tuple(field for field in OPTIONAL_FIELDS if field in fields)
+        self._width = 4 + len(self._fields)
+        self.next_position: tuple[int, int] | None = None
+
+    def feed(self, chunk: str) -> list[tuple[str, ...]]:
+        return self._decode(self._reader.feed(chunk))
+
+    def close(self) -> list[tuple[str, ...]]:
+        rows = self._decode(self._reader.close())
+        # The marker is a lone trailing field; anything else left over is an
+        # incomplete block.
+        block, self._block = self._block, []
+        if len(block) == 1 and block[0].startswith(NEXT_MARKER):
+            _, list_index, offset = block[0].split(":")
+            self.next_position = int(list_index), int(offset)
+        elif block:
+            raise RuntimeError(f"AppleScript error: malformed block for list {block[0]!r}: output ends mid-block")
+        return rows
+
+    def _decode(self, fields: list[str]) -> list[tuple[str, ...]]:
+        rows = []
+        for field in fields:
+            self._block.append(field)
+            if len(self._block) == self._width:
+                rows.extend(_block_rows(self._block, self._fields))
+                self._block = []
+        return rows
+
+
+def _block_rows(block: list[str], fields: tuple[str, ...] = DEFAULT_FIELDS) -> list[tuple[str, ...]]:
+    list_name, count, *fetched = block
+    columns = [column.split(US) for column in fetched]
+    if not count.isdigit() or any(len(column) != int(count) for column in columns):
+        raise RuntimeError(f"AppleScript error: malformed block for list {list_name!r}")
+    ids, names, *optional = columns
+    present = dict(zip(fields, optional))
+    blank = repeat("")
+    # One string per list name, however many pages and reads refer to it.
+    return list(zip(repeat(sys.intern(list_name)), ids, names, *(present.get(field, blank) for field in OPTIONAL_FIELDS)))
+
+
+def decode_page(
+    output: str, fields: tuple[str, ...] = DEFAULT_FIELDS
+) -> tuple[list[tuple[str, ...]], tuple[int, int] | None]:
+    """Decode complete get_reminders output into rows and the next position."""
+    decoder = PageDecoder(fields)
+    rows = decoder.feed(output)
+    rows += decoder.close()
+    return rows, decoder.next_position
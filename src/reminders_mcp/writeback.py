@@ -0,0 +1,233 @@
+"""Write-behind queue for single-reminder mutations.
+
+Queued writes are acknowledged with a ticket instead of an outcome, since
+nothing has reached Reminders yet. A write that only refines a queued one is
+merged into it:
+
+    create + update    one create with the updated fields
+    create + delete    nothing at all
+    update + update    one update with both sets of changes
+    update + delete    one delete of the original reminder
+    complete twice     one complete
+
+Writes are matched by ``reminder_id``, or by the name and list they address
+after the queued write (a rename moves the name). A flush applies the queue
+in order, consecutive writes of one kind in one batched script, and records
+the outcome of every ticket until it is asked for, so each caller finds out
+what its own writes did. Failures are kept until reported; of the successes
+only the latest ``max_outcomes`` are.
+
+With a journal file, every acknowledged write is appended (and synced) to it
+before the ticket is handed out, and the queue is read back from it on start,
+so acknowledged writes survive a crash or restart.
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+KINDS = ("create", "update", "complete", "delete")
+# Fields of an update that change the reminder, as opposed to finding it.
+CHANGES = ("new_name", "notes", "due_date")
+TARGET = ("name", "list_name", "reminder_id")
+
+
+def _key(item: dict) -> tuple:
+    """How a write addresses its reminder."""
+    if item.get("reminder_id"):
+        return ("id", item["reminder_id"])
+    return ("name", item.get("name") or "", item.get("list_name") or "")
+
+
+class Write:
+    """A queued write and the tickets it answers for."""
+
+    __slots__ = ("kind", "item", "tickets")
+
+    def __init__(self, kind: str, item: dict, tickets: list[int]):
+        self.kind = kind
+        self.item = item
+        self.tickets = tickets
+
+    @property
+    def key_after(self) -> tuple | None:
+        """How later writes address the reminder once this one is applied."""
+        if self.kind == "delete":
+            return None
+        if self.kind == "update" and self.item.get("new_name") and not self.item.get("reminder_id"):
+            return ("name", self.item["new_name"], self.item.get("list_name") or "")
+        return _key(self.item)
+
+    def to_json(self) -> dict:
+        return {"kind": self.kind, "item": self.item, "tickets": self.tickets}
+
+
+def batches(writes: list[Write]) -> list[list[Write]]:
+    """Split ``writes`` into runs of one kind, keeping their order."""
+    runs: list[list[Write]] = []
+    for write in writes:
+        if runs and runs[-1][0].kind == write.kind:
+            runs[-1].append(write)
+        else:
+            runs.append([write])
+    return runs
+
+
+class WriteQueue:
+    """Pending writes, merged as they arrive, plus the outcomes of flushed ones."""
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        max_pending: int = 20,
+        journal: str | Path | None = None,
+        max_outcomes: int = 1000,
+    ):
+        self.delay = delay
+        self.max_pending = max_pending
+        self.journal = Path(journal) if journal else None
+        self.max_outcomes = max_outcomes
+        self._pending: list[Write] = []
+        # Unreported outcomes by ticket; merged tickets share one outcome.
+        self._succeeded: dict[int, dict] = {}
+        self._failed: dict[int, dict] = {}
+        self._next_ticket = 1
+        self.queued = 0
+        self.merged = 0
+        self.flushed = 0
+        if self.journal is not None and self.journal.exists():
+            for line in self.journal.read_text(encoding="utf-8").splitlines():
+                entry = json.loads(line)
+                self._merge(entry["kind"], entry["item"], entry["tickets"])
+                self._next_ticket = max(self._next_ticket, *entry["tickets"]) + 1
+
+    @property
+    def enabled(self) -> bool:
+        """Write-behind is on when a flush delay is configured."""
+        return self.delay > 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, kind: str, item: dict) -> dict:
+        """Queue a write and return its receipt."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown write kind: {kind}")
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        if self.journal is not None:
+            with self.journal.open("a", encoding="utf-8") as journal:
+                journal.write(json.dumps({"kind": kind, "item": item, "tickets": [ticket]}) + "\n")
+                journal.flush()
+                os.fsync(journal.fileno())
+        self.queued += 1
+        self._merge(kind, item, [ticket])
+        return {"queued": True, "ticket": ticket, "pending": len(self._pending)}
+
+    def full(self) -> bool:
+        return len(self._pending) >= self.max_pending
+
+    def take(self) -> list[Write]:
+        """Remove and return every pending write, oldest first."""
+        writes, self._pending = self._pending, []
+        return writes
+
+    def restore(self, writes: list[Write]) -> None:
+        """Put writes that could not be applied back in front of the queue."""
+        self._pending[:0] = writes
+
+    def settle(self, writes: Iterable[Write], results: Iterable[dict]) -> None:
+        """Record the outcome of applied writes, one result dict per write."""
+        for write, result in zip(writes, results):
+            self.flushed += 1
+            self._record({"tickets": write.tickets, "action": write.kind, **result})
+
+    def commit(self) -> None:
+        """Rewrite the journal to hold only what is still pending."""
+        if self.journal is None:
+            return
+        temporary = self.journal.with_name(self.journal.name + ".tmp")
+        with temporary.open("w", encoding="utf-8") as journal:
+            for write in self._pending:
+                journal.write(json.dumps(write.to_json()) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(temporary, self.journal)
+
+    def outcomes(self, tickets: Iterable[int]) -> list[dict]:
+        """Return and forget the outcomes of ``tickets``, one per write, in ticket order.
+
+        A ticket with nothing to report gets an outcome with action "pending"
+        if its write is still queued, or "unknown" if it was already reported,
+        never issued, or a success older than the latest ``max_outcomes``.
+        """
+        outcomes: dict[int, dict] = {}
+        for ticket in tickets:
+            outcome = self._succeeded.pop(ticket, None) or self._failed.pop(ticket, None)
+            if outcome is None:
+                action = "pending" if any(ticket in write.tickets for write in self._pending) else "unknown"
+                outcome = {"tickets": [ticket], "action": action, "name": None, "id": None, "success": None, "error": None}
+            outcomes.setdefault(id(outcome), outcome)
+        return list(outcomes.values())
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "pending": len(self._pending),
+            "queued": self.queued,
+            "merged": self.merged,
+            "flushed": self.flushed,
+            "unreported_failures": len(self._failed),
+        }
+
+    def _record(self, outcome: dict) -> None:
+        outcomes = self._succeeded if outcome["success"] else self._failed
+        for ticket in outcome["tickets"]:
+            outcomes[ticket] = outcome
+        while len(self._succeeded) > self.max_outcomes:
+            del self._succeeded[next(iter(self._succeeded))]
+
+    def _merge(self, kind: str, item: dict, tickets: list[int]) -> None:
+        key = _key(item)
+        index = len(self._pending) - 1
+        # Only the latest write involving the key may absorb this one; one
+        # that renamed another reminder to this name stops the search.
+        while index >= 0:
+            write = self._pending[index]
+            if write.key_after == key or _key(write.item) == key:
+                break
+            index -= 1
+        if index < 0 or self._pending[index].key_after != key or not self._absorb(index, kind, item, tickets):
+            self._pending.append(Write(kind, item, list(tickets)))
+            return
+        self.merged += len(tickets)
+
+    def _absorb(self, index: int, kind: str, item: dict, tickets: list[int]) -> bool:
+        write = self._pending[index]
+        changes = {field: item[field] for field in CHANGES if item.get(field) is not None}
+        if write.kind == "create" and kind == "update":
+            created = {**write.item, **changes}
+            if "new_name" in created:
+                created["name"] = created.pop("new_name")
+            write.item = created
+        elif write.kind == "create" and kind == "delete":
+            del self._pending[index]
+            self._record({
+                "tickets": write.tickets + tickets,
+                "action": "cancel",
+                "name": write.item.get("name"),
+                "id": None,
+                "success": True,
+                "error": None,
+            })
+            return True
+        elif write.kind == "update" and kind == "update":
+            write.item = {**write.item, **changes}
+        elif write.kind == "update" and kind == "delete":
+            write.kind = "delete"
+            write.item = {field: write.item[field] for field in TARGET if field in write.item}
+        elif not (write.kind == kind == "complete"):
+            return False
+        write.tickets.extend(tickets)
+        return True
@@ -0,0 +1,31 @@
+import pytest
+
+from reminders_mcp import reminders
+
+
+class FakeClock:
+    """A monotonic clock that only moves when a test sets ``now``."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def _run_scripts_uncompiled(monkeypatch):
+    """Keep tests independent of osacompile and the on-disk script cache."""
+    monkeypatch.setenv("REMINDERS_MCP_SCRIPT_CACHE", "off")
+
+
+@pytest.fixture(autouse=True)
+def _empty_name_index():
+    reminders.name_index.clear()
+    yield
+    reminders.name_index.clear()
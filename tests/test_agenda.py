@@ -0,0 +1,65 @@
+"""Tests for agenda bucketing."""
+
+from datetime import datetime
+
+from reminders_mcp import agenda
+
+NOW = datetime(2026, 3, 2, 14, 30)
+
+
+def item(reminder_id, due, priority=0, completed=False):
+    return {"id": reminder_id, "list": "Work", "name": reminder_id, "due_date": due, "priority": priority,
+            "completed": completed}
+
+
+def ids(items):
+    return [entry["id"] for entry in items]
+
+
+class TestWindow:
+    def test_bounds(self):
+        assert agenda.window(NOW, 7) == {
+            "now": "2026-03-02T14:30:00",
+            "tomorrow": "2026-03-03T00:00:00",
+            "end": "2026-03-10T00:00:00",
+        }
+
+    def test_no_upcoming_days(self):
+        bounds = agenda.window(NOW, 0)
+        assert bounds["end"] == bounds["tomorrow"]
+
+
+class TestBuild:
+    def test_buckets(self):
+        result = agenda.build([
+            item("late", "2026-03-01T09:00:00"),
+            item("earlier today", "2026-03-02T09:00:00"),
+            item("tonight", "2026-03-02T20:00:00"),
+            item("friday", "2026-03-06T09:00:00"),
+            item("next month", "2026-04-01T09:00:00"),
+            item("someday", None),
+        ], NOW)
+        assert ids(result["overdue"]) == ["late", "earlier today"]
+        assert ids(result["today"]) == ["tonight"]
+        assert ids(result["upcoming"]) == ["friday"]
+        assert result["counts"] == {"overdue": 2, "today": 1, "upcoming": 1}
+        assert result["now"] == "2026-03-02T14:30:00"
+
+    def test_keeps_earliest_per_bucket(self):
+        items = [item(f"r{day:02d}", f"2026-02-{day:02d}T09:00:00") for day in range(28, 0, -1)]
+        result = agenda.build(items, NOW, limit=3)
+        assert ids(result["overdue"]) == ["r01", "r02", "r03"]
+        assert result["counts"]["overdue"] == 28
+
+    def test_priority_breaks_ties(self):
+        due = "2026-03-03T09:00:00"
+        result = agenda.build([item("none", due, 0), item("low", due, 9), item("high", due, 1)], NOW)
+        assert ids(result["upcoming"]) == ["high", "low", "none"]
+
+    def test_zero_limit_keeps_everything(self):
+        items = [item(f"r{i}", "2026-03-03T09:00:00") for i in range(50)]
+        assert len(agenda.build(items, NOW, limit=0)["upcoming"]) == 50
+
+    def test_completed_are_skipped(self):
+        result = agenda.build([item("done", "2026-03-01T09:00:00", completed=True)], NOW)
+        assert result["overdue"] == []
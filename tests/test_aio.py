@@ -0,0 +1,212 @@
+"""Tests for the asyncio backend — subprocesses are fully mocked."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from reminders_mcp import aio, reminders
+from reminders_mcp.scheduler import Scheduler
+
+
+class FakeStream:
+    """Stands in for a subprocess pipe, returning ``data`` in small chunks."""
+
+    def __init__(self, data, chunk_size=5):
+        self.data = data
+        self.chunk_size = chunk_size
+
+    async def read(self, n=-1):
+        size = len(self.data) if n < 0 else min(n, self.chunk_size)
+        chunk, self.data = self.data[:size], self.data[size:]
+        return chunk
+
+
+def mock_proc(stdout="", stderr="", returncode=0):
+    """Helper to build a mock asyncio subprocess."""
+    proc = MagicMock()
+    proc.stdout = FakeStream(stdout.encode())
+    proc.stderr = FakeStream(stderr.encode())
+    proc.wait = AsyncMock(return_value=returncode)
+    proc.returncode = returncode
+    return proc
+
+
+def exec_mock(*procs):
+    return patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=list(procs)))
+
+
+# ---------------------------------------------------------------------------
+# run_applescript
+# ---------------------------------------------------------------------------
+
+class TestRunApplescript:
+    def test_passes_arguments_after_script(self):
+        with exec_mock(mock_proc("ok\n")) as mock:
+            assert asyncio.run(aio.run_applescript("script", "a", "b")) == "ok"
+        assert mock.call_args[0] == ("osascript", "-e", "script", "--", "a", "b")
+
+    def test_keeps_trailing_separators(self):
+        with exec_mock(mock_proc("ok\x1e\n")):
+            assert asyncio.run(aio.run_applescript("script")) == "ok\x1e"
+
+    def test_drops_only_the_osascript_newline(self):
+        for stdout in ("ok\n\n", "ok\n\n\n"):
+            with exec_mock(mock_proc(stdout)):
+                assert asyncio.run(aio.run_applescript("script")) == stdout[:-1]
+
+    def test_multibyte_characters_split_across_chunks(self):
+        with exec_mock(mock_proc("Café ☕ über\n")):
+            assert asyncio.run(aio.run_applescript("script")) == "Café ☕ über"
+
+    def test_failure_raises(self):
+        with exec_mock(mock_proc(stderr="execution error\n", returncode=1)):
+            with pytest.raises(RuntimeError, match="AppleScript error: execution error"):
+                asyncio.run(aio.run_applescript("script"))
+
+    def test_uses_pool_when_configured(self):
+        pool = MagicMock()
+        pool.run.return_value = "pooled"
+        with patch.object(reminders, "_get_pool", return_value=pool), exec_mock() as mock:
+            assert asyncio.run(aio.run_applescript("script", "x")) == "pooled"
+        pool.run.assert_called_once_with("script", ("x",))
+        mock.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# reads and writes
+# ---------------------------------------------------------------------------
+
+class TestReads:
+    def test_get_lists(self):
+        with exec_mock(mock_proc("Work\x1eHome\n")):
+            assert asyncio.run(aio.get_lists()) == ["Work", "Home"]
+
+    def test_get_reminders_page_matches_sync_parsing(self):
+        output = "\x1e".join(["Work", "2", "id-A\x1fid-B", "A\x1fB", "false\x1ffalse",
+                              "missing value\x1fmissing value", "\x1fnote", "next:1:3"])
+        with exec_mock(mock_proc(output)) as mock:
+            items, next_cursor = asyncio.run(aio.get_reminders_page("Work", limit=2, search="x"))
+        assert [item["id"] for item in items] == ["id-A", "id-B"]
+        assert items[1]["notes"] == "note"
+        assert next_cursor is not None
+        assert list(mock.call_args[0][-9:]) == ["Work", "1", "1", "2", "", "", "x", "", "0"]
+
+    def test_streamed_notes_keep_their_trailing_newline(self):
+        # Split into five-byte chunks, the note's newline ends a chunk of its own.
+        output = "\x1e".join(["Work", "1", "id-A", "A", "false", "", "abc\n"]) + "\n"
+        with exec_mock(mock_proc(output)):
+            items, _ = asyncio.run(aio.get_reminders_page("Work"))
+        assert items[0]["notes"] == "abc\n"
+
+    def test_pooled_notes_keep_their_trailing_newline(self):
+        pool = MagicMock()
+        pool.run.return_value = "\x1e".join(["Work", "1", "id-A", "A", "false", "", "ab\n"])
+        with patch.object(reminders, "_get_pool", return_value=pool):
+            items, _ = asyncio.run(aio.get_reminders_page("Work"))
+        assert items[0]["notes"] == "ab\n"
+
+    def test_get_reminders_page_with_pool(self):
+        pool = MagicMock()
+        pool.run.return_value = "\x1e".join(["Work", "1", "id-A", "A|B", "false", "missing value", ""])
+        with patch.object(reminders, "_get_pool", return_value=pool):
+            items, next_cursor = asyncio.run(aio.get_reminders_page("Work"))
+        assert [item["name"] for item in items] == ["A|B"]
+        assert next_cursor is None
+
+    def test_get_counts(self):
+        with exec_mock(mock_proc("\x1e".join(["Work", "3", "2", "1", "0"]))) as mock:
+            counts = asyncio.run(aio.get_counts("Work"))
+        assert counts["total"]["completed"] == 1
+        assert mock.call_args[0][-1] == "Work"
+
+
+class TestWrites:
+    def test_complete_reminder_by_id(self):
+        with exec_mock(mock_proc("ok\x1fid-A")) as mock:
+            assert asyncio.run(aio.complete_reminder(reminder_id="id-A")) is True
+        assert list(mock.call_args[0][-3:]) == ["id-A", "", ""]
+
+    def test_create_reminders_returns_ids(self):
+        with exec_mock(mock_proc("ok\x1fA\x1fid-A\x1eerror\x1fbad date")):
+            results = asyncio.run(aio.create_reminders([{"name": "A", "list_name": "Work"}, {"name": "B"}]))
+        assert results[0] == {"name": "A", "id": "id-A", "success": True, "error": None}
+        assert results[1]["error"] == "bad date"
+        assert reminders.name_index.lookup("A", "Work") == "id-A"
+
+    def test_update_without_changes_skips_script(self):
+        with exec_mock() as mock:
+            assert asyncio.run(aio.update_reminder(name="A")) is True
+        mock.assert_not_called()
+
+    def test_delete_error_raises(self):
+        with exec_mock(mock_proc("error\x1fAccess denied")):
+            with pytest.raises(RuntimeError, match="Access denied"):
+                asyncio.run(aio.delete_reminder(name="A"))
+
+
+class TestFanOut:
+    @staticmethod
+    def per_list_exec(outputs, found=None):
+        """create_subprocess_exec stand-in answering each list's script on its own."""
+        async def create(*command, **kwargs):
+            script, args = command[2], list(command[4:])
+            if script == reminders.GET_LISTS_SCRIPT:
+                return mock_proc("\x1e".join(outputs))
+            if script == reminders.FIND_IDS_SCRIPT:
+                return mock_proc("\x1e".join((found or {}).get(args[0], [""] * len(args[1:]))))
+            if "by 3" in script:
+                return mock_proc("ok")
+            # Let the first list finish last.
+            await asyncio.sleep(0.01 if args[0] == next(iter(outputs)) else 0)
+            return mock_proc(outputs[args[0]])
+        return patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=create))
+
+    def test_reads_lists_concurrently_in_list_order(self):
+        outputs = {
+            "Work": "\x1e".join(["Work", "1", "id-A", "A", "false", "", ""]),
+            "Home": "\x1e".join(["Home", "1", "id-B", "B", "false", "", ""]),
+        }
+        with patch.object(reminders, "FANOUT", 2), self.per_list_exec(outputs) as mock:
+            items, next_cursor = asyncio.run(aio.get_reminders_page())
+        assert [item["name"] for item in items] == ["A", "B"]
+        assert next_cursor is None
+        assert mock.call_count == 3
+
+    def test_name_lookup_targets_first_list_holding_the_name(self):
+        with patch.object(reminders, "FANOUT", 2), \
+                self.per_list_exec({"Work": "", "Home": ""}, found={"Home": ["id-A"]}) as mock:
+            assert asyncio.run(aio.complete_reminder(name="A")) is True
+        assert list(mock.call_args[0][-3:]) == ["id-A", "A", "Home"]
+
+    def test_fan_out_stays_within_the_scheduler_cap(self):
+        lists = ["Work", "Home", "Shop", "Gym"]
+        running, peak = 0, 0
+
+        async def create(*command, **kwargs):
+            nonlocal running, peak
+            script, args = command[2], list(command[4:])
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if script == reminders.GET_LISTS_SCRIPT:
+                return mock_proc("\x1e".join(lists))
+            if script == reminders.FIND_IDS_SCRIPT:
+                return mock_proc("")
+            if "by 3" in script:
+                return mock_proc("ok")
+            return mock_proc("\x1e".join([args[0], "1", f"id-{args[0]}", args[0], "false", "", ""]))
+
+        async def main():
+            scheduler = Scheduler(2)
+            return await asyncio.gather(
+                *(scheduler.read(aio.get_reminders_page) for _ in range(3)),
+                *(scheduler.write([f"name:{i}"], aio.complete_reminders, [{"name": str(i)}]) for i in range(3)),
+            )
+
+        with patch.object(reminders, "FANOUT", 4), \
+                patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=create)):
+            results = asyncio.run(main())
+        assert [len(items) for items, _ in results[:3]] == [4, 4, 4]
+        assert peak == 2
@@ -0,0 +1,205 @@
+"""Unit tests for the read-through reminder cache."""
+
+import asyncio
+
+import pytest
+
+from reminders_mcp.cache import ReminderCache
+
+
+def item(name, list_name="Work"):
+    return {"id": f"id-{name}", "list": list_name, "name": name, "completed": False, "due_date": None, "notes": None}
+
+
+def page(*items, next_cursor=None):
+    return list(items), next_cursor
+
+
+@pytest.fixture
+def cache(clock):
+    return ReminderCache(ttl=10, max_entries=3, clock=clock)
+
+
+class Loader:
+    """Callable returning a fixed value and counting calls."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+# ---------------------------------------------------------------------------
+# reads
+# ---------------------------------------------------------------------------
+
+class TestReads:
+    def test_second_read_is_a_hit(self, cache):
+        loader = Loader(page(item("A")))
+        assert cache.get_reminders("Work", False, loader) == page(item("A"))
+        assert cache.get_reminders("Work", False, loader) == page(item("A"))
+        assert loader.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_includes_completed_flag(self, cache):
+        loader = Loader(page())
+        cache.get_reminders("Work", False, loader)
+        cache.get_reminders("Work", True, loader)
+        assert loader.calls == 2
+
+    def test_key_includes_page_window(self, cache):
+        loader = Loader(page())
+        cache.get_reminders("Work", False, loader, limit=10)
+        cache.get_reminders("Work", False, loader, limit=10, cursor="abc")
+        cache.get_reminders("Work", False, loader, limit=10)
+        assert loader.calls == 2
+
+    def test_key_includes_projection(self, cache):
+        loader = Loader(page())
+        cache.get_reminders("Work", False, loader)
+        cache.get_reminders("Work", False, loader, projection=(("id", "list", "name"), 0))
+        assert loader.calls == 2
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        loader = Loader(["Work"])
+        cache.get_lists(loader)
+        clock.now = 10
+        cache.get_lists(loader)
+        assert loader.calls == 2
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        loaders = {name: Loader(page()) for name in ("A", "B", "C", "D")}
+        for name in ("A", "B", "C"):
+            cache.get_reminders(name, False, loaders[name])
+        cache.get_reminders("A", False, loaders["A"])
+        cache.get_reminders("D", False, loaders["D"])
+        cache.get_reminders("A", False, loaders["A"])
+        cache.get_reminders("B", False, loaders["B"])
+        assert loaders["A"].calls == 1
+        assert loaders["B"].calls == 2
+
+    def test_zero_ttl_disables_cache(self, clock):
+        cache = ReminderCache(ttl=0, clock=clock)
+        loader = Loader([])
+        cache.get_lists(loader)
+        cache.get_lists(loader)
+        assert loader.calls == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_read_racing_a_write_is_not_stored(self, cache):
+        def loader():
+            cache.reminder_created("Work")
+            return page(item("old"))
+
+        cache.get_reminders("Work", False, loader)
+        assert cache.stats()["entries"] == 0
+
+    def test_async_loader_shares_entries(self, cache):
+        loader = Loader(page(item("A")))
+
+        async def load():
+            return loader()
+
+        assert asyncio.run(cache.get_reminders_async("Work", False, load)) == page(item("A"))
+        assert cache.get_reminders("Work", False, loader) == page(item("A"))
+        assert asyncio.run(cache.get_reminders_async("Work", False, load)) == page(item("A"))
+        assert loader.calls == 1
+
+    def test_async_read_racing_a_write_is_not_stored(self, cache):
+        async def load():
+            cache.reminder_created("Work")
+            return page(item("old"))
+
+        asyncio.run(cache.get_reminders_async("Work", False, load))
+        assert cache.stats()["entries"] == 0
+
+
+# ---------------------------------------------------------------------------
+# invalidation
+# ---------------------------------------------------------------------------
+
+class TestInvalidation:
+    def test_create_drops_target_and_all_list_entries(self, cache):
+        work, home, everything = Loader(page()), Loader(page()), Loader(page())
+        cache.get_reminders("Work", False, work)
+        cache.get_reminders("Home", False, home)
+        cache.get_reminders(None, False, everything)
+        cache.reminder_created("Work")
+        for name, loader in (("Work", work), ("Home", home), (None, everything)):
+            cache.get_reminders(name, False, loader)
+        assert (work.calls, home.calls, everything.calls) == (2, 1, 2)
+
+    def test_create_in_default_list_drops_all_reminder_entries(self, cache):
+        lists, work = Loader(["Work"]), Loader(page())
+        cache.get_lists(lists)
+        cache.get_reminders("Work", False, work)
+        cache.reminder_created(None)
+        cache.get_lists(lists)
+        cache.get_reminders("Work", False, work)
+        assert (lists.calls, work.calls) == (1, 2)
+
+    def test_lists_changed_drops_their_listings_and_the_list_names(self, cache):
+        lists, work, home, everything = Loader(["Work", "Home"]), Loader(page()), Loader(page()), Loader(page())
+        cache.get_lists(lists)
+        cache.get_reminders("Work", False, work)
+        cache.get_reminders("Home", False, home)
+        cache.get_reminders(None, True, everything)
+        cache.lists_changed(["Work"])
+        cache.get_lists(lists)
+        for name, loader in (("Work", work), ("Home", home), (None, everything)):
+            cache.get_reminders(name, name is None, loader)
+        assert (lists.calls, work.calls, home.calls, everything.calls) == (2, 2, 1, 2)
+
+    def test_change_drops_only_entries_containing_the_reminder(self, cache):
+        work, home = Loader(page(item("A", "Work"))), Loader(page(item("B", "Home")))
+        cache.get_reminders("Work", False, work)
+        cache.get_reminders("Home", False, home)
+        cache.reminder_changed("A", None)
+        cache.get_reminders("Work", False, work)
+        cache.get_reminders("Home", False, home)
+        assert (work.calls, home.calls) == (2, 1)
+
+    def test_change_respects_list_name(self, cache):
+        everything = Loader(page(item("A", "Work"), item("A", "Home")))
+        home = Loader(page(item("A", "Home")))
+        cache.get_reminders(None, False, everything)
+        cache.get_reminders("Home", False, home)
+        cache.reminder_changed("A", "Work")
+        cache.get_reminders(None, False, everything)
+        cache.get_reminders("Home", False, home)
+        assert (everything.calls, home.calls) == (2, 1)
+        assert cache.stats()["invalidations"] == 1
+
+    def test_change_drops_every_page_of_the_query(self, cache):
+        first = Loader(page(item("A"), next_cursor="c2"))
+        second = Loader(page(item("B")))
+        cache.get_reminders("Work", False, first, limit=1)
+        cache.get_reminders("Work", False, second, limit=1, cursor="c2")
+        cache.reminder_changed("A", "Work")
+        cache.get_reminders("Work", False, second, limit=1, cursor="c2")
+        assert second.calls == 2
+
+    def test_update_drops_filtered_queries_on_the_list(self, cache):
+        due_soon = Loader(page())
+        other_list = Loader(page())
+        plain = Loader(page())
+        cache.get_reminders("Work", False, due_soon, filters=(("due_before", "Friday"),))
+        cache.get_reminders("Home", False, other_list, filters=(("due_before", "Friday"),))
+        cache.get_reminders("Work", False, plain)
+        cache.reminder_updated("A", "Work")
+        cache.get_reminders("Work", False, due_soon, filters=(("due_before", "Friday"),))
+        cache.get_reminders("Home", False, other_list, filters=(("due_before", "Friday"),))
+        cache.get_reminders("Work", False, plain)
+        assert (due_soon.calls, other_list.calls, plain.calls) == (2, 1, 1)
+
+    def test_change_matches_by_id(self, cache):
+        work, home = Loader(page(item("A", "Work"))), Loader(page(item("B", "Home")))
+        cache.get_reminders("Work", False, work)
+        cache.get_reminders("Home", False, home)
+        cache.reminder_changed(None, None, "id-B")
+        cache.get_reminders("Work", False, work)
+        cache.get_reminders("Home", False, home)
+        assert (work.calls, home.calls) == (1, 2)
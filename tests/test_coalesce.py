@@ -0,0 +1,122 @@
+"""Tests for single-flight read coalescing."""
+
+import asyncio
+
+import pytest
+
+from reminders_mcp.coalesce import SingleFlight
+
+
+class SlowRead:
+    """Counts calls and blocks each one until ``release`` is set."""
+
+    def __init__(self, result="value"):
+        self.calls = 0
+        self.result = result
+        self.release = asyncio.Event()
+
+    async def __call__(self, *args):
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return (self.result, call, *args)
+
+
+async def settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+# ---------------------------------------------------------------------------
+# sharing
+# ---------------------------------------------------------------------------
+
+class TestSharing:
+    def test_concurrent_identical_reads_run_once(self):
+        async def scenario():
+            flights, read = SingleFlight(), SlowRead()
+            tasks = [asyncio.ensure_future(flights.do("k", read)) for _ in range(5)]
+            await settle()
+            read.release.set()
+            results = await asyncio.gather(*tasks)
+            return flights, read, results
+
+        flights, read, results = asyncio.run(scenario())
+        assert read.calls == 1
+        assert results == [("value", 1)] * 5
+        assert flights.stats() == {"executed": 1, "shared": 4, "in_flight": 0}
+
+    def test_different_keys_run_separately(self):
+        async def scenario():
+            flights, read = SingleFlight(), SlowRead()
+            tasks = [asyncio.ensure_future(flights.do(key, read, key)) for key in ("a", "b")]
+            await settle()
+            read.release.set()
+            return read, await asyncio.gather(*tasks)
+
+        read, results = asyncio.run(scenario())
+        assert read.calls == 2
+        assert [result[2] for result in results] == ["a", "b"]
+
+    def test_sequential_reads_are_not_shared(self):
+        async def scenario():
+            flights, read = SingleFlight(), SlowRead()
+            read.release.set()
+            await flights.do("k", read)
+            await flights.do("k", read)
+            return read
+
+        assert asyncio.run(scenario()).calls == 2
+
+
+# ---------------------------------------------------------------------------
+# writes and failures
+# ---------------------------------------------------------------------------
+
+class TestBarrier:
+    def test_reads_after_barrier_start_a_new_call(self):
+        async def scenario():
+            flights, read = SingleFlight(), SlowRead()
+            before = asyncio.ensure_future(flights.do("k", read))
+            await settle()
+            flights.barrier()
+            after = asyncio.ensure_future(flights.do("k", read))
+            await settle()
+            read.release.set()
+            return read, await before, await after
+
+        read, before, after = asyncio.run(scenario())
+        assert read.calls == 2
+        assert before == ("value", 1)
+        assert after == ("value", 2)
+
+
+class TestFailures:
+    def test_exception_reaches_every_caller(self):
+        async def scenario():
+            flights, read = SingleFlight(), SlowRead(RuntimeError("AppleScript error: boom"))
+            tasks = [asyncio.ensure_future(flights.do("k", read)) for _ in range(3)]
+            await settle()
+            read.release.set()
+            return flights, await asyncio.gather(*tasks, return_exceptions=True)
+
+        flights, results = asyncio.run(scenario())
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flights.stats()["in_flight"] == 0
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        async def scenario():
+            flights, read = SingleFlight(), SlowRead()
+            first = asyncio.ensure_future(flights.do("k", read))
+            second = asyncio.ensure_future(flights.do("k", read))
+            await settle()
+            first.cancel()
+            await settle()
+            read.release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(scenario()) == ("value", 1)
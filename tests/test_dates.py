@@ -0,0 +1,43 @@
+"""Tests for the ISO 8601 date codec."""
+
+from datetime import datetime, timezone
+
+from reminders_mcp import dates
+
+
+class TestParseIso:
+    def test_full_timestamp_is_kept(self):
+        assert dates.parse_iso("2026-02-27T09:00:00") == "2026-02-27T09:00:00"
+
+    def test_short_forms_are_completed(self):
+        assert dates.parse_iso("2026-02-27") == "2026-02-27T00:00:00"
+        assert dates.parse_iso("2026-02-27T09:30") == "2026-02-27T09:30:00"
+        assert dates.parse_iso("2026-02-27 09:30:15.250") == "2026-02-27T09:30:15"
+
+    def test_offsets_become_local_time(self):
+        instant = datetime(2026, 2, 27, 8, 0, tzinfo=timezone.utc)
+        expected = instant.astimezone().replace(tzinfo=None).isoformat()
+        assert dates.parse_iso("2026-02-27T08:00:00Z") == expected
+        assert dates.parse_iso("2026-02-27T09:00:00+01:00") == expected
+
+    def test_locale_text_is_not_iso(self):
+        assert dates.parse_iso("Thursday, February 27, 2026 at 9:00 AM") is None
+
+    def test_results_are_memoized(self):
+        dates.parse_iso.cache_clear()
+        dates.parse_iso("2026-02-27")
+        dates.parse_iso("2026-02-27")
+        assert dates.parse_iso.cache_info().hits == 1
+
+
+class TestScriptValues:
+    def test_to_script(self):
+        assert dates.to_script("2026-02-27T09:00") == "2026-02-27T09:00:00"
+        assert dates.to_script("February 27, 2026") == "February 27, 2026"
+        assert dates.to_script(None) == ""
+        assert dates.to_script("") == ""
+
+    def test_from_script(self):
+        assert dates.from_script("2026-02-27T09:00:00") == "2026-02-27T09:00:00"
+        assert dates.from_script("") is None
+        assert dates.from_script("missing value") is None
@@ -0,0 +1,212 @@
+"""Tests for the SQLite mirror — sync output is built by hand."""
+
+from unittest.mock import patch
+
+import pytest
+
+from reminders_mcp import reminders
+from reminders_mcp.mirror import DELTA_SYNC_SCRIPT, FULL_SYNC_SCRIPT, Mirror
+from reminders_mcp.record import Reminder
+
+RS, US = "\x1e", "\x1f"
+
+
+def row(reminder_id, name=None, completed="false", due="missing value", notes="", flagged="false", priority="0"):
+    return (reminder_id, name or reminder_id, completed, due, notes, flagged, priority)
+
+
+def list_block(list_name, all_ids, *changed):
+    columns = [US.join(values) for values in zip(*changed)] if changed else [""] * 7
+    return [list_name, US.join(all_ids), str(len(changed)), *columns]
+
+
+def sync_output(sync_time, *blocks):
+    return RS.join([sync_time, *(field for block in blocks for field in block)])
+
+
+@pytest.fixture
+def mirror(clock):
+    mirror = Mirror(":memory:", clock=clock)
+    yield mirror
+    mirror.close()
+
+
+def names(page):
+    return [item["name"] for item in page[0]]
+
+
+# ---------------------------------------------------------------------------
+# sync
+# ---------------------------------------------------------------------------
+
+class TestSync:
+    def test_first_sync_is_full(self, mirror):
+        assert mirror.sync_request() == (FULL_SYNC_SCRIPT, [""])
+
+    def test_later_syncs_pass_watermark(self, mirror):
+        mirror.apply(sync_output("T1", list_block("Work", [])))
+        assert mirror.sync_request() == (DELTA_SYNC_SCRIPT, ["T1"])
+
+    def test_full_sync_loads_everything(self, mirror):
+        counts = mirror.apply(sync_output(
+            "T1",
+            list_block("Work", ["a", "b"], row("a", "Email"), row("b", "Call", notes="x|y\nz")),
+            list_block("Home", ["c"], row("c", "Dishes", flagged="true", priority="1")),
+        ))
+        assert counts == {"changed": 3, "deleted": 0, "lists": 2}
+        assert mirror.get_lists() == ["Work", "Home"]
+        items, _ = mirror.get_reminders_page()
+        assert [item["name"] for item in items] == ["Email", "Call", "Dishes"]
+        assert items[1]["notes"] == "x|y\nz"
+
+    def test_delta_updates_changed_and_keeps_the_rest(self, mirror):
+        mirror.apply(sync_output("T1", list_block("Work", ["a", "b"], row("a", "Email"), row("b", "Call"))))
+        mirror.apply(sync_output("T2", list_block("Work", ["a", "b"], row("b", "Call mom"))))
+        assert names(mirror.get_reminders_page("Work")) == ["Email", "Call mom"]
+        assert mirror.watermark == "T2"
+
+    def test_missing_ids_are_deleted(self, mirror):
+        mirror.apply(sync_output("T1", list_block("Work", ["a", "b"], row("a"), row("b"))))
+        counts = mirror.apply(sync_output("T2", list_block("Work", ["b"])))
+        assert counts["deleted"] == 1
+        assert names(mirror.get_reminders_page()) == ["b"]
+
+    def test_moves_and_list_renames_update_unchanged_rows(self, mirror):
+        mirror.apply(sync_output("T1", list_block("Work", ["a"], row("a")), list_block("Home", ["b"], row("b"))))
+        mirror.apply(sync_output("T2", list_block("Office", ["b", "a"]), list_block("Home", [])))
+        items, _ = mirror.get_reminders_page()
+        assert [(item["list"], item["name"]) for item in items] == [("Office", "b"), ("Office", "a")]
+
+    def test_malformed_block_raises_and_leaves_mirror_unchanged(self, mirror):
+        mirror.apply(sync_output("T1", list_block("Work", ["a"], row("a"))))
+        bad = sync_output("T2", ["Work", "a", "2", "a", "A", "false", "", "", "false", "0"])
+        with pytest.raises(RuntimeError, match="malformed"):
+            mirror.apply(bad)
+        assert mirror.watermark == "T1"
+
+    def test_sync_feeds_name_index(self, mirror):
+        mirror.apply(sync_output("T1", list_block("Work", ["id-1"], row("id-1", "Email"))))
+        assert reminders.name_index.lookup("Email", "Work") == "id-1"
+
+    def test_sync_runs_delta_script(self, mirror):
+        mirror.apply(sync_output("T1", list_block("Work", [])))
+        with patch.object(reminders, "_run_applescript", return_value=sync_output("T2")) as run:
+            mirror.sync()
+        run.assert_called_once_with(DELTA_SYNC_SCRIPT, "T1")
+
+    def test_sync_script_emits_iso_dates(self):
+        assert "(current date) as «class isot» as string" in FULL_SYNC_SCRIPT
+        assert "on asDate(s)" in DELTA_SYNC_SCRIPT
+
+    def test_mirror_in_old_format_is_emptied(self, tmp_path):
+        path = tmp_path / "mirror.db"
+        first = Mirror(path)
+        first.apply(sync_output("T1", list_block("Work", ["a"], row("a"))))
+        with first._db:
+            first._db.execute("UPDATE meta SET value = '1' WHERE key = 'format'")
+        first.close()
+        second = Mirror(path)
+        try:
+            assert second.get_reminders_page() == ([], None)
+            assert second.sync_request() == (FULL_SYNC_SCRIPT, [""])
+        finally:
+            second.close()
+
+    def test_freshness(self, mirror, clock):
+        assert not mirror.is_fresh(30)
+        mirror.apply(sync_output("T1"))
+        clock.now = 29
+        assert mirror.is_fresh(30)
+        mirror.mark_stale()
+        assert not mirror.is_fresh(30)
+
+
+# ---------------------------------------------------------------------------
+# queries
+# ---------------------------------------------------------------------------
+
+class TestQueries:
+    @pytest.fixture(autouse=True)
+    def _data(self, mirror):
+        mirror.apply(sync_output(
+            "T1",
+            list_block(
+                "Work", ["a", "b", "c"],
+                row("a", "Dentist", notes="call 100%"),
+                row("b", "Report", completed="true"),
+                row("c", "Email", flagged="true", priority="1"),
+            ),
+            list_block("Home", ["d"], row("d", "Dishes")),
+        ))
+
+    def test_excludes_completed_by_default(self, mirror):
+        assert names(mirror.get_reminders_page("Work")) == ["Dentist", "Email"]
+        assert names(mirror.get_reminders_page("Work", include_completed=True)) == ["Dentist", "Report", "Email"]
+
+    def test_filters(self, mirror):
+        assert names(mirror.get_reminders_page(search="dent")) == ["Dentist"]
+        assert names(mirror.get_reminders_page(search="100%")) == ["Dentist"]
+        assert names(mirror.get_reminders_page(search="_")) == []
+        assert names(mirror.get_reminders_page(flagged=True)) == ["Email"]
+        assert names(mirror.get_reminders_page(priority=1)) == ["Email"]
+
+    def test_due_range(self, mirror):
+        mirror.apply(sync_output(
+            "T2",
+            list_block(
+                "Work", ["a", "b", "c"],
+                row("a", "Dentist", due="2026-03-01T09:00:00"),
+                row("c", "Email", due="2026-03-08T00:00:00"),
+            ),
+            list_block("Home", ["d"]),
+        ))
+        assert names(mirror.get_reminders_page(due_after="2026-03-01T09:00")) == ["Dentist", "Email"]
+        assert names(mirror.get_reminders_page(due_after="2026-03-02", due_before="2026-03-08")) == []
+        assert names(mirror.get_reminders_page(due_before="2026-03-08")) == ["Dentist"]
+        with pytest.raises(ValueError, match="ISO 8601"):
+            mirror.get_reminders_page(due_before="March 8, 2026")
+
+    def test_counts(self, mirror):
+        mirror.apply(sync_output(
+            "T2",
+            list_block("Work", ["a", "b", "c"], row("a", "Dentist", due="2026-03-01T09:00:00")),
+            list_block("Home", ["d"]),
+            list_block("Empty", []),
+        ))
+        counts = mirror.get_counts(now="2026-03-02T00:00:00")
+        assert [(entry["list"], entry["total"], entry["open"], entry["overdue"], entry["flagged"])
+                for entry in counts["lists"]] == [("Work", 3, 2, 1, 1), ("Home", 1, 1, 0, 0), ("Empty", 0, 0, 0, 0)]
+        assert counts["total"]["completed"] == 1
+        assert [entry["list"] for entry in mirror.get_counts("Home")["lists"]] == ["Home"]
+
+    def test_pagination(self, mirror):
+        first = mirror.get_reminders_page(limit=2)
+        assert names(first) == ["Dentist", "Email"]
+        second = mirror.get_reminders_page(limit=2, cursor=first[1])
+        assert second == ([second[0][0]], None)
+        assert names(second) == ["Dishes"]
+
+    def test_projection_and_notes_truncation(self, mirror):
+        items, _ = mirror.get_reminders_page("Work", fields=["notes"], notes_max_chars=4)
+        assert items == [
+            {"id": "a", "list": "Work", "name": "Dentist", "notes": "call…"},
+            {"id": "c", "list": "Work", "name": "Email", "notes": None},
+        ]
+        assert all(isinstance(item, Reminder) for item in items)
+
+    def test_cursor_from_another_query_is_rejected(self, mirror):
+        _, cursor = mirror.get_reminders_page(limit=1)
+        with pytest.raises(ValueError, match="different query"):
+            mirror.get_reminders_page("Home", limit=1, cursor=cursor)
+
+    def test_persists_across_connections(self, tmp_path):
+        path = tmp_path / "mirror.db"
+        first = Mirror(path)
+        first.apply(sync_output("T1", list_block("Work", ["a"], row("a", "Email"))))
+        first.close()
+        second = Mirror(path)
+        try:
+            assert names(second.get_reminders_page()) == ["Email"]
+            assert second.sync_request() == (DELTA_SYNC_SCRIPT, ["T1"])
+        finally:
+            second.close()
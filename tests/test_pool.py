@@ -0,0 +1,113 @@
+"""Tests for the persistent AppleScript worker pool, using a fake runner."""
+
+import sys
+import textwrap
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from reminders_mcp import reminders
+from reminders_mcp.pool import WorkerPool
+
+# Speaks the runner protocol: echoes "<script>:<args>", fails on "boom" and
+# exits on "crash" so restart behaviour can be observed.
+FAKE_RUNNER = textwrap.dedent('''
+    import json, os, sys
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["script"] == "crash":
+            sys.exit(1)
+        if request["script"] == "boom":
+            response = {"error": "execution error (-1728)"}
+        elif request["script"] == "pid":
+            response = {"result": str(os.getpid())}
+        else:
+            response = {"result": request["script"] + ":" + ",".join(request["args"])}
+        sys.stdout.write(json.dumps(response) + "\\n")
+        sys.stdout.flush()
+''')
+
+
+@pytest.fixture
+def runner(tmp_path):
+    path = tmp_path / "fake_runner.py"
+    path.write_text(FAKE_RUNNER)
+    return [sys.executable, str(path)]
+
+
+@pytest.fixture
+def pool(runner):
+    pool = WorkerPool(2, runner)
+    yield pool
+    pool.close()
+
+
+# ---------------------------------------------------------------------------
+# WorkerPool
+# ---------------------------------------------------------------------------
+
+class TestWorkerPool:
+    def test_returns_result(self, pool):
+        assert pool.run("hello", ["a", "b"]) == "hello:a,b"
+
+    def test_reuses_worker_process(self, runner):
+        pool = WorkerPool(1, runner)
+        try:
+            assert pool.run("pid") == pool.run("pid")
+        finally:
+            pool.close()
+
+    def test_error_response_raises(self, pool):
+        with pytest.raises(RuntimeError, match="AppleScript error: execution error"):
+            pool.run("boom")
+
+    def test_crash_raises_then_restarts(self, runner):
+        pool = WorkerPool(1, runner)
+        try:
+            first = pool.run("pid")
+            with pytest.raises(RuntimeError, match="exited while running"):
+                pool.run("crash")
+            assert pool.run("pid") != first
+        finally:
+            pool.close()
+
+    def test_concurrent_calls(self, pool):
+        results = [None] * 8
+
+        def call(i):
+            results[i] = pool.run("job", [str(i)])
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [f"job:{i}" for i in range(8)]
+
+    def test_size_must_be_positive(self, runner):
+        with pytest.raises(ValueError):
+            WorkerPool(0, runner)
+
+
+# ---------------------------------------------------------------------------
+# _run_applescript routing
+# ---------------------------------------------------------------------------
+
+class TestPoolRouting:
+    def test_uses_pool_when_configured(self, runner):
+        reminders.configure_pool(1, runner)
+        try:
+            with patch("subprocess.run") as mock:
+                assert reminders._run_applescript("hi", "x") == "hi:x"
+                mock.assert_not_called()
+        finally:
+            reminders.configure_pool(0)
+
+    def test_falls_back_to_subprocess_when_disabled(self):
+        reminders.configure_pool(0)
+        with patch("subprocess.run") as mock:
+            mock.return_value.returncode = 0
+            mock.return_value.stdout = "ok\n"
+            assert reminders._run_applescript("script", "arg") == "ok"
+            assert mock.call_args[0][0] == ["osascript", "-e", "script", "--", "arg"]
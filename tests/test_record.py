@@ -0,0 +1,49 @@
+"""Tests for the compact Reminder record."""
+
+import pytest
+
+from reminders_mcp.record import FIELDS, Reminder
+
+DEFAULT = ("id", "list", "name", "completed", "due_date", "notes")
+
+
+def test_behaves_like_the_dict_of_its_fields():
+    reminder = Reminder(DEFAULT, "id-A", "Work", "A", due_date="2026-02-27T09:00:00")
+    expected = {
+        "id": "id-A",
+        "list": "Work",
+        "name": "A",
+        "completed": False,
+        "due_date": "2026-02-27T09:00:00",
+        "notes": None,
+    }
+    assert reminder == expected
+    assert expected == reminder
+    assert dict(reminder) == {**reminder} == reminder.to_dict() == expected
+    assert list(reminder) == list(DEFAULT)
+    assert len(reminder) == 6
+    assert reminder["name"] == reminder.name == "A"
+
+
+def test_fields_not_read_are_hidden():
+    reminder = Reminder(("id", "list", "name", "priority"), "id-A", "Work", "A", priority=1)
+    assert reminder.to_dict() == {"id": "id-A", "list": "Work", "name": "A", "priority": 1}
+    assert "notes" not in reminder
+    assert reminder.get("notes") is None
+    with pytest.raises(KeyError):
+        reminder["notes"]
+
+
+def test_is_read_only_and_has_no_instance_dict():
+    reminder = Reminder(FIELDS, "id-A", "Work", "A")
+    assert not hasattr(reminder, "__dict__")
+    with pytest.raises(TypeError):
+        reminder["name"] = "B"
+    with pytest.raises(AttributeError):
+        reminder.extra = 1
+
+
+def test_repr_shows_fields():
+    assert repr(Reminder(("id", "list", "name"), "id-A", "Work", "A")) == (
+        "Reminder({'id': 'id-A', 'list': 'Work', 'name': 'A'})"
+    )
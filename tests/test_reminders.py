@@ -1,16 +1,29 @@
 """Unit tests for reminders.py — AppleScript calls are fully mocked."""
 
+import re
+import time
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from reminders_mcp import reminders
+from reminders_mcp.record import Reminder
 from reminders_mcp.reminders import (
+    FIND_IDS_SCRIPT,
+    GET_LISTS_SCRIPT,
     complete_reminder,
+    complete_reminders,
     create_reminder,
+    create_reminders,
     delete_reminder,
+    delete_reminders,
+    get_counts,
     get_lists,
     get_reminders,
+    get_reminders_page,
     update_reminder,
+    update_reminders,
 )
 
 
@@ -23,15 +36,48 @@ def mock_run(stdout="", returncode=0):
     return result
 
 
+def columns(list_name, *rows):
+    """Build the RS/US column block get_reminders expects for one list.
+
+    Each row is (name, completed, due_date, notes); ids are "id-<name>".
+    """
+    rows = [(f"id-{row[0]}", *row) for row in rows]
+    cols = ["\x1f".join(values) for values in zip(*rows)]
+    return "\x1e".join([list_name, str(len(rows)), *cols])
+
+
+def script_args(mock):
+    """Return the script arguments passed after ``--`` to osascript."""
+    command = mock.call_args[0][0]
+    return command[command.index("--") + 1:] if "--" in command else []
+
+
+# ---------------------------------------------------------------------------
+# _run_applescript
+# ---------------------------------------------------------------------------
+
+class TestRunApplescript:
+    def test_runs_compiled_script_with_arguments(self):
+        compiled = Path("/cache/abc.scpt")
+        with patch("reminders_mcp.scripts.compiled_path", return_value=compiled), \
+                patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders(list_name="-Work")
+            assert mock.call_args[0][0] == ["osascript", str(compiled), "-Work", "1", "1", "0", "", "", "", "", "0"]
+
+
 # ---------------------------------------------------------------------------
 # get_lists
 # ---------------------------------------------------------------------------
 
 class TestGetLists:
     def test_returns_list_of_names(self):
-        with patch("subprocess.run", return_value=mock_run("Work, Personal, Groceries")):
+        with patch("subprocess.run", return_value=mock_run("Work\x1ePersonal\x1eGroceries\n")):
             assert get_lists() == ["Work", "Personal", "Groceries"]
 
+    def test_names_with_commas_and_pipes(self):
+        with patch("subprocess.run", return_value=mock_run("Errands, Home\x1eA|B")):
+            assert get_lists() == ["Errands, Home", "A|B"]
+
     def test_single_list(self):
         with patch("subprocess.run", return_value=mock_run("Inbox")):
             assert get_lists() == ["Inbox"]
@@ -52,11 +98,12 @@ class TestGetLists:
 
 class TestGetReminders:
     def test_parses_basic_reminder(self):
-        output = "Work|Buy coffee|false|missing value|\n"
+        output = columns("Work", ("Buy coffee", "false", "missing value", ""))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert len(result) == 1
         assert result[0] == {
+            "id": "id-Buy coffee",
             "list": "Work",
             "name": "Buy coffee",
             "completed": False,
@@ -65,65 +112,335 @@ class TestGetReminders:
         }
 
     def test_missing_value_due_date_becomes_none(self):
-        output = "Personal|Call dentist|false|missing value|\n"
+        output = columns("Personal", ("Call dentist", "false", "missing value", ""))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert result[0]["due_date"] is None
 
     def test_real_due_date_is_preserved(self):
-        output = "Work|Submit report|false|Thursday, February 27, 2026 at 9:00 AM|\n"
+        output = columns("Work", ("Submit report", "false", "Thursday, February 27, 2026 at 9:00 AM", ""))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert result[0]["due_date"] == "Thursday, February 27, 2026 at 9:00 AM"
 
     def test_completed_flag_parsed_correctly(self):
-        output = "Work|Done task|true|missing value|\n"
+        output = columns("Work", ("Done task", "true", "missing value", ""))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert result[0]["completed"] is True
 
     def test_notes_returned_when_present(self):
-        output = "Work|Buy milk|false|missing value|2% fat, organic\n"
+        output = columns("Work", ("Buy milk", "false", "missing value", "2% fat, organic"))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert result[0]["notes"] == "2% fat, organic"
 
     def test_empty_notes_returns_none(self):
-        output = "Work|Buy milk|false|missing value|\n"
+        output = columns("Work", ("Buy milk", "false", "missing value", ""))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert result[0]["notes"] is None
 
     def test_multiline_notes_preserved(self):
-        output = "Work|Buy milk|false|missing value|Line 1⏎Line 2⏎Line 3\n"
+        output = columns("Work", ("Buy milk", "false", "missing value", "Line 1\nLine 2\nLine 3"))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert result[0]["notes"] == "Line 1\nLine 2\nLine 3"
 
     def test_notes_with_pipe_character_preserved(self):
-        output = "Work|Buy milk|false|missing value|step1|step2|step3\n"
+        output = columns("Work", ("Buy milk", "false", "missing value", "step1|step2|step3"))
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert result[0]["notes"] == "step1|step2|step3"
 
+    def test_pipe_in_names_does_not_shift_fields(self):
+        output = columns("A|B", ("x|y", "true", "missing value", ""))
+        with patch("subprocess.run", return_value=mock_run(output)):
+            result = get_reminders()
+        assert (result[0]["list"], result[0]["name"], result[0]["completed"]) == ("A|B", "x|y", True)
+
     def test_multiple_reminders(self):
-        output = "Work|Task A|false|missing value|\nWork|Task B|true|missing value|\n"
+        output = columns(
+            "Work",
+            ("Task A", "false", "missing value", ""),
+            ("Task B", "true", "missing value", ""),
+        )
         with patch("subprocess.run", return_value=mock_run(output)):
             result = get_reminders()
         assert len(result) == 2
         assert result[0]["name"] == "Task A"
         assert result[1]["name"] == "Task B"
 
+    def test_trailing_empty_fields_survive_osascript_newline(self):
+        output = columns("Work", ("A", "false", "", ""), ("B", "false", "", "")) + "\n"
+        with patch("subprocess.run", return_value=mock_run(output)):
+            result = get_reminders()
+        assert [r["name"] for r in result] == ["A", "B"]
+
+    def test_notes_ending_in_newlines_survive(self):
+        output = columns("Work", ("A", "false", "", "line1\n\n")) + "\n"
+        with patch("subprocess.run", return_value=mock_run(output)):
+            result = get_reminders()
+        assert result[0]["notes"] == "line1\n\n"
+
+    def test_multiple_lists(self):
+        output = "\x1e".join([
+            columns("Work", ("Task A", "false", "missing value", "")),
+            columns("Home", ("Task B", "false", "missing value", "")),
+        ])
+        with patch("subprocess.run", return_value=mock_run(output)):
+            result = get_reminders()
+        assert [(r["list"], r["name"]) for r in result] == [("Work", "Task A"), ("Home", "Task B")]
+
     def test_empty_output_returns_empty_list(self):
         with patch("subprocess.run", return_value=mock_run("")):
             assert get_reminders() == []
 
-    def test_malformed_lines_are_skipped(self):
-        output = "OnlyOneField\nWork|Task|false|missing value|\n"
+    def test_passes_list_as_argument(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders(list_name="Work")
+            assert script_args(mock)[0] == "Work"
+
+    def test_excludes_completed_in_whose_clause(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders()
+            assert "name of (reminders whose completed is false)" in mock.call_args[0][0][2]
+
+    def test_include_completed_drops_whose_clause(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders(include_completed=True)
+            assert "whose" not in mock.call_args[0][0][2]
+
+    def test_malformed_block_raises(self):
+        bad = "\x1e".join(["Work", "2", "id-1", "Only one", "false", "missing value", ""])
+        good = columns("Work", ("Task", "false", "missing value", ""))
+        with patch("subprocess.run", return_value=mock_run(bad + "\x1e" + good)):
+            with pytest.raises(RuntimeError, match="malformed block"):
+                get_reminders()
+
+
+# ---------------------------------------------------------------------------
+# get_reminders_page
+# ---------------------------------------------------------------------------
+
+class TestGetRemindersPage:
+    def test_requests_only_the_window(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders_page(list_name="Inbox", limit=50)
+            assert script_args(mock)[:4] == ["Inbox", "1", "1", "50"]
+
+    def test_last_page_has_no_cursor(self):
+        output = columns("Inbox", ("A", "false", "", ""), ("B", "false", "", ""))
         with patch("subprocess.run", return_value=mock_run(output)):
-            result = get_reminders()
-        assert len(result) == 1
-        assert result[0]["name"] == "Task"
+            reminders, cursor = get_reminders_page(list_name="Inbox", limit=50)
+        assert [r["name"] for r in reminders] == ["A", "B"]
+        assert cursor is None
+
+    def test_cursor_resumes_where_the_page_stopped(self):
+        output = columns("Inbox", ("A", "false", "", ""), ("B", "false", "", "")) + "\x1enext:1:3"
+        with patch("subprocess.run", return_value=mock_run(output)):
+            reminders, cursor = get_reminders_page(list_name="Inbox", limit=2)
+        assert len(reminders) == 2
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders_page(list_name="Inbox", limit=2, cursor=cursor)
+            assert script_args(mock)[:4] == ["Inbox", "1", "3", "2"]
+
+    def test_cursor_from_another_query_is_rejected(self):
+        output = columns("Inbox", ("A", "false", "", "")) + "\x1enext:1:2"
+        with patch("subprocess.run", return_value=mock_run(output)):
+            _, cursor = get_reminders_page(list_name="Inbox", limit=1)
+        with pytest.raises(ValueError, match="different"):
+            get_reminders_page(list_name="Work", limit=1, cursor=cursor)
+
+    def test_cursor_with_other_filters_is_rejected(self):
+        output = columns("Inbox", ("A", "false", "", "")) + "\x1enext:1:2"
+        with patch("subprocess.run", return_value=mock_run(output)):
+            _, cursor = get_reminders_page(list_name="Inbox", limit=1, search="milk")
+        with pytest.raises(ValueError, match="different"):
+            get_reminders_page(list_name="Inbox", limit=1, cursor=cursor, search="eggs")
+
+    def test_garbage_cursor_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            get_reminders_page(cursor="not-a-cursor")
+
+    def test_unfiltered_page_reads_only_its_element_range(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders_page(list_name="Inbox", include_completed=True, limit=50)
+        script = mock.call_args[0][0][2]
+        assert "set total to count of reminders" in script
+        # Every property read is over the page's range, never the whole list.
+        reads = re.findall(r" of reminders\b(.*)", script)
+        assert reads and all(rest == " firstIndex thru lastIndex" for rest in reads[1:])
+        assert reads[0] == ""  # the count
+
+    def test_filtered_page_reads_ids_then_the_window_by_id(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders_page(list_name="Inbox", limit=50)
+        script = mock.call_args[0][0][2]
+        assert "set columns's matched to id of (reminders whose completed is false)" in script
+        assert "items firstIndex thru lastIndex of columns's matched" in script
+        assert "set r to reminder id (contents of reminderId)" in script
+        assert "set end of columns's names to name of r" in script
+
+    def test_filtered_page_switches_to_whole_columns_by_cost(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders_page(list_name="Inbox", limit=50)
+        script = mock.call_args[0][0][2]
+        # Reading a column over the filter costs one event plus a value per match.
+        assert reminders._BULK_RATIO == 100
+        assert "if (lastIndex - firstIndex + 1) * 100 ≥ total then" in script
+
+
+# ---------------------------------------------------------------------------
+# server-side filters
+# ---------------------------------------------------------------------------
+
+class TestFilters:
+    def run_filters(self, **filters):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders(**filters)
+        return mock.call_args[0][0][2], script_args(mock)
+
+    def test_due_range_compiles_into_whose_clause(self):
+        script, args = self.run_filters(due_after="March 1, 2026", due_before="March 8, 2026")
+        assert "whose completed is false and due date ≥ dueAfter and due date < dueBefore" in script
+        assert args[4:6] == ["March 1, 2026", "March 8, 2026"]
+
+    def test_search_matches_name_or_notes(self):
+        script, args = self.run_filters(search="dentist")
+        assert "(name contains searchText or body contains searchText)" in script
+        assert args[6] == "dentist"
+
+    def test_flagged_filter(self):
+        script, _ = self.run_filters(flagged=True)
+        assert "flagged is true" in script
+        script, _ = self.run_filters(flagged=False)
+        assert "flagged is false" in script
+
+    def test_priority_filter(self):
+        script, args = self.run_filters(priority=1)
+        assert "priority is wantPriority" in script
+        assert args[7] == "1"
+
+    def test_iso_due_range_is_normalised(self):
+        script, args = self.run_filters(due_after="2026-03-01", due_before="2026-03-08T12:30")
+        assert args[4:6] == ["2026-03-01T00:00:00", "2026-03-08T12:30:00"]
+        assert "set dueAfter to my asDate(dueAfter)" in script
+
+    def test_filter_values_never_enter_script_text(self):
+        first, _ = self.run_filters(search='say "hi"')
+        second, _ = self.run_filters(search="other")
+        assert first == second
+
+
+# ---------------------------------------------------------------------------
+# get_counts
+# ---------------------------------------------------------------------------
+
+class TestGetCounts:
+    def test_counts_per_list_and_total(self):
+        output = "\x1e".join(["Work", "10", "4", "1", "2", "Home", "0", "0", "0", "0"])
+        with patch("subprocess.run", return_value=mock_run(output)) as mock:
+            result = get_counts()
+        assert result["lists"] == [
+            {"list": "Work", "total": 10, "open": 4, "completed": 6, "overdue": 1, "flagged": 2},
+            {"list": "Home", "total": 0, "open": 0, "completed": 0, "overdue": 0, "flagged": 0},
+        ]
+        assert result["total"] == {"total": 10, "open": 4, "completed": 6, "overdue": 1, "flagged": 2}
+        assert script_args(mock) == [""]
+
+    def test_counting_happens_in_the_app(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            assert get_counts("Work") == {"lists": [], "total": dict.fromkeys(
+                ("total", "open", "completed", "overdue", "flagged"), 0)}
+        script = mock.call_args[0][0][2]
+        assert "count of (reminders whose completed is false and due date < rightNow)" in script
+        assert "name of reminders" not in script
+        assert script_args(mock) == ["Work"]
+
+    def test_malformed_output_raises(self):
+        with patch("subprocess.run", return_value=mock_run("Work\x1e3\x1ex\x1e0\x1e0")):
+            with pytest.raises(RuntimeError, match="malformed counts"):
+                get_counts()
+
+
+# ---------------------------------------------------------------------------
+# due dates
+# ---------------------------------------------------------------------------
+
+class TestDueDates:
+    def test_listing_emits_iso_due_dates(self):
+        output = columns("Work", ("A", "false", "2026-02-27T09:00:00", ""), ("B", "false", "", ""))
+        with patch("subprocess.run", return_value=mock_run(output)) as mock:
+            result = get_reminders("Work")
+        assert [item["due_date"] for item in result] == ["2026-02-27T09:00:00", None]
+        assert "as «class isot» as string" in mock.call_args[0][0][2]
+
+    def test_create_passes_iso_through_the_codec(self):
+        with patch("subprocess.run", return_value=mock_run("ok\x1fA\x1fid-A")) as mock:
+            create_reminder("A", due_date="2026-02-27T09:00")
+        assert script_args(mock)[2] == "2026-02-27T09:00:00"
+        assert "my asDate(dueDate)" in mock.call_args[0][0][2]
+
+    def test_update_accepts_locale_text(self):
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-A")) as mock:
+            update_reminder(reminder_id="id-A", due_date="March 1, 2026 at 9:00 AM")
+        assert script_args(mock)[-2:] == ["1", "March 1, 2026 at 9:00 AM"]
+
+
+# ---------------------------------------------------------------------------
+# field projection
+# ---------------------------------------------------------------------------
+
+class TestFieldProjection:
+    def test_default_script_fetches_every_property(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders()
+        script = mock.call_args[0][0][2]
+        assert "completed of" in script and "due date of" in script and "body of" in script
+
+    def test_only_requested_properties_are_fetched(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders(fields=["completed"])
+        script = mock.call_args[0][0][2]
+        assert "completed of" in script
+        assert "due date of" not in script and "body of" not in script
+
+    def test_items_hold_only_requested_fields(self):
+        output = "\x1e".join(["Work", "2", "id-A\x1fid-B", "A\x1fB", "note\x1f"])
+        with patch("subprocess.run", return_value=mock_run(output)):
+            result = get_reminders("Work", fields=["notes"])
+        assert result == [
+            {"id": "id-A", "list": "Work", "name": "A", "notes": "note"},
+            {"id": "id-B", "list": "Work", "name": "B", "notes": None},
+        ]
+        assert all(isinstance(item, Reminder) for item in result)
+        assert result[0].list is result[1].list
+
+    def test_flagged_and_priority_on_request(self):
+        output = "\x1e".join(["Work", "1", "id-A", "A", "true", "1"])
+        with patch("subprocess.run", return_value=mock_run(output)) as mock:
+            result = get_reminders("Work", fields=["flagged", "priority"])
+        assert result == [{"id": "id-A", "list": "Work", "name": "A", "flagged": True, "priority": 1}]
+        assert "priority of" in mock.call_args[0][0][2]
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown reminder fields: color"):
+            get_reminders(fields=["notes", "color"])
+
+    def test_notes_max_chars_is_passed_to_the_script(self):
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders(notes_max_chars=80)
+        assert script_args(mock)[8] == "80"
+        assert "text 1 thru notesMax of n" in mock.call_args[0][0][2]
+
+    def test_cursor_carries_over_between_projections(self):
+        output = columns("Inbox", ("A", "false", "", "")) + "\x1enext:1:2"
+        with patch("subprocess.run", return_value=mock_run(output)):
+            _, cursor = get_reminders_page(list_name="Inbox", limit=1)
+        with patch("subprocess.run", return_value=mock_run("")) as mock:
+            get_reminders_page(list_name="Inbox", limit=1, cursor=cursor, fields=[])
+        assert script_args(mock)[:4] == ["Inbox", "1", "2", "1"]
 
 
 # ---------------------------------------------------------------------------
@@ -132,33 +449,48 @@ class TestGetReminders:
 
 class TestCreateReminder:
     def test_returns_reminder_name(self):
-        with patch("subprocess.run", return_value=mock_run("Buy milk")):
+        with patch("subprocess.run", return_value=mock_run("ok\x1fBuy milk\x1fid-1")):
             result = create_reminder("Buy milk")
         assert result == "Buy milk"
 
     def test_with_list_name(self):
-        with patch("subprocess.run", return_value=mock_run("Buy milk")) as mock:
+        with patch("subprocess.run", return_value=mock_run("ok\x1fBuy milk\x1fid-1")) as mock:
             create_reminder("Buy milk", list_name="Groceries")
-            script = mock.call_args[0][0][2]
-            assert 'list "Groceries"' in script
+            assert script_args(mock) == ["Buy milk", "Groceries", "", ""]
 
     def test_with_due_date(self):
-        with patch("subprocess.run", return_value=mock_run("Pay rent")) as mock:
+        with patch("subprocess.run", return_value=mock_run("ok\x1fPay rent\x1fid-1")) as mock:
             create_reminder("Pay rent", due_date="March 1, 2026 at 9:00 AM")
             script = mock.call_args[0][0][2]
             assert "due date" in script
+            assert script_args(mock)[2] == "March 1, 2026 at 9:00 AM"
 
     def test_with_notes(self):
-        with patch("subprocess.run", return_value=mock_run("Task")) as mock:
+        with patch("subprocess.run", return_value=mock_run("ok\x1fTask\x1fid-1")) as mock:
             create_reminder("Task", notes="Some note")
             script = mock.call_args[0][0][2]
             assert "body" in script
+            assert script_args(mock)[3] == "Some note"
 
     def test_uses_default_list_when_no_list_name(self):
-        with patch("subprocess.run", return_value=mock_run("Task")) as mock:
+        with patch("subprocess.run", return_value=mock_run("ok\x1fTask\x1fid-1")) as mock:
             create_reminder("Task")
             script = mock.call_args[0][0][2]
             assert "default list" in script
+            assert script_args(mock)[1] == ""
+
+    def test_quotes_in_name_are_passed_as_arguments(self):
+        with patch("subprocess.run", return_value=mock_run('ok\x1fSay "hi"\x1fid-1')) as mock:
+            create_reminder('Say "hi"')
+            first_script = mock.call_args[0][0][2]
+            create_reminder("Other")
+            assert mock.call_args[0][0][2] == first_script
+            assert 'Say "hi"' not in first_script
+
+    def test_error_result_raises(self):
+        with patch("subprocess.run", return_value=mock_run("error\x1fCan\u2019t get list \"Nope\".")):
+            with pytest.raises(RuntimeError, match="Nope"):
+                create_reminder("Task", list_name="Nope")
 
     def test_applescript_error_raises(self):
         with patch("subprocess.run", return_value=mock_run(returncode=1)):
@@ -182,8 +514,17 @@ class TestCompleteReminder:
     def test_with_list_name_scopes_search(self):
         with patch("subprocess.run", return_value=mock_run("ok")) as mock:
             complete_reminder("Buy milk", list_name="Groceries")
-            script = mock.call_args[0][0][2]
-            assert "Groceries" in script
+            assert script_args(mock) == ["", "Buy milk", "Groceries"]
+
+    def test_by_reminder_id(self):
+        with patch("subprocess.run", return_value=mock_run("ok\x1fx-apple-reminder://1")) as mock:
+            assert complete_reminder(reminder_id="x-apple-reminder://1") is True
+            assert script_args(mock) == ["x-apple-reminder://1", "", ""]
+            assert 'reminder id reminderId' in mock.call_args[0][0][2]
+
+    def test_requires_name_or_id(self):
+        with pytest.raises(ValueError, match="name or reminder_id"):
+            complete_reminder()
 
     def test_applescript_error_raises(self):
         with patch("subprocess.run", return_value=mock_run(returncode=1)):
@@ -209,21 +550,21 @@ class TestUpdateReminder:
             update_reminder("Buy milk", notes="2% fat")
             script = mock.call_args[0][0][2]
             assert "set body of r to" in script
-            assert "2% fat" in script
+            assert script_args(mock)[5:7] == ["1", "2% fat"]
 
     def test_update_name_includes_name_in_script(self):
         with patch("subprocess.run", return_value=mock_run("ok")) as mock:
             update_reminder("Buy milk", new_name="Buy oat milk")
             script = mock.call_args[0][0][2]
             assert "set name of r to" in script
-            assert "Buy oat milk" in script
+            assert script_args(mock)[3:5] == ["1", "Buy oat milk"]
 
     def test_update_due_date_includes_date_in_script(self):
         with patch("subprocess.run", return_value=mock_run("ok")) as mock:
             update_reminder("Buy milk", due_date="March 1, 2026 at 9:00 AM")
             script = mock.call_args[0][0][2]
             assert "set due date of r to" in script
-            assert "March 1, 2026" in script
+            assert script_args(mock)[7:9] == ["1", "March 1, 2026 at 9:00 AM"]
 
     def test_no_updates_returns_true_without_applescript_call(self):
         with patch("subprocess.run", return_value=mock_run("ok")) as mock:
@@ -234,8 +575,12 @@ class TestUpdateReminder:
     def test_with_list_name_scopes_search(self):
         with patch("subprocess.run", return_value=mock_run("ok")) as mock:
             update_reminder("Buy milk", list_name="Groceries", notes="organic")
-            script = mock.call_args[0][0][2]
-            assert "Groceries" in script
+            assert script_args(mock)[2] == "Groceries"
+
+    def test_unchanged_fields_are_flagged_off(self):
+        with patch("subprocess.run", return_value=mock_run("ok")) as mock:
+            update_reminder("Buy milk", notes="")
+            assert script_args(mock)[3:] == ["0", "", "1", "", "0", ""]
 
     def test_applescript_error_raises(self):
         with patch("subprocess.run", return_value=mock_run(returncode=1)):
@@ -260,16 +605,256 @@ class TestDeleteReminder:
         with patch("subprocess.run", return_value=mock_run("ok")) as mock:
             delete_reminder("Buy milk", list_name="Groceries")
             script = mock.call_args[0][0][2]
-            assert 'list "Groceries"' in script
             assert "whose name is" in script
+            assert script_args(mock) == ["", "Buy milk", "Groceries"]
 
     def test_without_list_name_searches_all_lists(self):
         with patch("subprocess.run", return_value=mock_run("ok")) as mock:
             delete_reminder("Buy milk")
             script = mock.call_args[0][0][2]
-            assert "repeat with l in lists" in script
+            assert "set theLists to allLists" in script
+            assert script_args(mock) == ["", "Buy milk", ""]
 
     def test_applescript_error_raises(self):
         with patch("subprocess.run", return_value=mock_run(returncode=1)):
             with pytest.raises(RuntimeError):
                 delete_reminder("Task")
+
+
+# ---------------------------------------------------------------------------
+# batch mutations
+# ---------------------------------------------------------------------------
+
+class TestBatchMutations:
+    def test_complete_runs_one_script_for_all_items(self):
+        with patch("subprocess.run", return_value=mock_run("ok\x1eok")) as mock:
+            results = complete_reminders([{"name": "A"}, {"name": "B", "list_name": "Work"}])
+        assert mock.call_count == 1
+        assert script_args(mock) == ["", "A", "", "", "B", "Work"]
+        assert [r["success"] for r in results] == [True, True]
+
+    def test_reports_per_item_failures(self):
+        output = "ok\x1fid-A\x1enot found\x1eerror\x1fCan\u2019t get list \"Nope\"."
+        with patch("subprocess.run", return_value=mock_run(output)):
+            results = delete_reminders([{"name": "A"}, {"name": "B"}, {"name": "C", "list_name": "Nope"}])
+        assert results == [
+            {"name": "A", "id": "id-A", "success": True, "error": None},
+            {"name": "B", "id": None, "success": False, "error": "not found"},
+            {"name": "C", "id": None, "success": False, "error": "Can\u2019t get list \"Nope\"."},
+        ]
+
+    def test_create_returns_created_names(self):
+        with patch("subprocess.run", return_value=mock_run("ok\x1fTask A\x1fid-A\x1eok\x1fTask B\x1fid-B")) as mock:
+            results = create_reminders([
+                {"name": "Task A", "list_name": "Work", "notes": "n"},
+                {"name": "Task B", "due_date": "March 1, 2026"},
+            ])
+        assert script_args(mock) == ["Task A", "Work", "", "n", "Task B", "", "March 1, 2026", ""]
+        assert [(r["name"], r["id"]) for r in results] == [("Task A", "id-A"), ("Task B", "id-B")]
+
+    def test_update_flags_fields_per_item(self):
+        with patch("subprocess.run", return_value=mock_run("ok")) as mock:
+            update_reminders([{"name": "A", "notes": ""}])
+        assert script_args(mock) == ["", "A", "", "0", "", "1", "", "0", ""]
+        assert "by 9" in mock.call_args[0][0][2]
+
+    def test_empty_batch_skips_applescript(self):
+        with patch("subprocess.run") as mock:
+            assert complete_reminders([]) == []
+            mock.assert_not_called()
+
+    def test_result_count_mismatch_raises(self):
+        with patch("subprocess.run", return_value=mock_run("ok")):
+            with pytest.raises(RuntimeError, match="expected 2 batch results"):
+                complete_reminders([{"name": "A"}, {"name": "B"}])
+
+
+# ---------------------------------------------------------------------------
+# Fan-out across lists
+# ---------------------------------------------------------------------------
+
+def per_list_run(blocks, found=None, delays=None):
+    """Build a subprocess.run stand-in answering each list's script on its own.
+
+    ``blocks`` maps list names to listing output and ``found`` maps them to
+    the ids a name lookup returns; ``delays`` slows down single lists.
+    """
+    def run(command, **kwargs):
+        script = command[2]
+        args = command[command.index("--") + 1:] if "--" in command else []
+        if script == GET_LISTS_SCRIPT:
+            return mock_run("\x1e".join(blocks))
+        time.sleep((delays or {}).get(args[0], 0))
+        if script == FIND_IDS_SCRIPT:
+            return mock_run("\x1e".join((found or {}).get(args[0], [""] * len(args[1:]))))
+        return mock_run(blocks[args[0]])
+    return run
+
+
+class TestFanOut:
+    BLOCKS = {
+        "Work": columns("Work", ("A", "false", "", "")),
+        "Home": columns("Home", ("B", "false", "", ""), ("C", "false", "", "")),
+    }
+
+    def test_reads_lists_concurrently_in_list_order(self):
+        run = per_list_run(self.BLOCKS, delays={"Work": 0.05})
+        with patch.object(reminders, "FANOUT", 4), patch("subprocess.run", side_effect=run) as mock:
+            items = get_reminders()
+        assert [(item["list"], item["name"]) for item in items] == [("Work", "A"), ("Home", "B"), ("Home", "C")]
+        assert mock.call_count == 3
+        assert sorted(call[0][0][4] for call in mock.call_args_list[1:]) == ["Home", "Work"]
+
+    def test_paged_and_single_list_reads_keep_one_script(self):
+        with patch.object(reminders, "FANOUT", 4), \
+                patch("subprocess.run", return_value=mock_run(self.BLOCKS["Work"])) as mock:
+            get_reminders_page(limit=10)
+            get_reminders("Work")
+        assert mock.call_count == 2
+        assert all(call[0][0][2] != GET_LISTS_SCRIPT for call in mock.call_args_list)
+
+    def test_duplicate_list_names_fall_back_to_one_script(self):
+        outputs = [mock_run("Work\x1eWork"), mock_run(self.BLOCKS["Work"])]
+        with patch.object(reminders, "FANOUT", 4), patch("subprocess.run", side_effect=outputs) as mock:
+            items = get_reminders()
+        assert [item["name"] for item in items] == ["A"]
+        assert script_args(mock)[0] == ""
+
+    def test_list_failure_raises(self):
+        def run(command, **kwargs):
+            if command[2] == GET_LISTS_SCRIPT:
+                return mock_run("Work\x1eHome")
+            return mock_run(returncode=1) if command[4] == "Home" else mock_run(self.BLOCKS["Work"])
+        with patch.object(reminders, "FANOUT", 4), patch("subprocess.run", side_effect=run):
+            with pytest.raises(RuntimeError, match="AppleScript error"):
+                get_reminders()
+
+    def test_name_lookup_targets_first_list_holding_the_name(self):
+        lookup = per_list_run(self.BLOCKS, found={"Work": ["", "id-W"], "Home": ["id-H", "id-H2"]})
+
+        def run(command, **kwargs):
+            return mock_run("ok\x1fid-H\x1eok\x1fid-W") if "by 3" in command[2] else lookup(command)
+
+        with patch.object(reminders, "FANOUT", 4), patch("subprocess.run", side_effect=run) as mock:
+            results = complete_reminders([{"name": "A"}, {"name": "B"}])
+        assert script_args(mock) == ["id-H", "A", "Home", "id-W", "B", "Work"]
+        assert [result["id"] for result in results] == ["id-H", "id-W"]
+        lookups = [call[0][0] for call in mock.call_args_list if call[0][0][2] == FIND_IDS_SCRIPT]
+        assert sorted(command[4:] for command in lookups) == [["Home", "A", "B"], ["Work", "A", "B"]]
+
+    def test_unknown_name_is_left_to_the_batch(self):
+        lookup = per_list_run(self.BLOCKS)
+
+        def run(command, **kwargs):
+            return mock_run("not found") if "by 9" in command[2] else lookup(command)
+
+        with patch.object(reminders, "FANOUT", 4), patch("subprocess.run", side_effect=run) as mock:
+            assert update_reminder(name="Nope", notes="x") is False
+        assert script_args(mock)[:3] == ["", "Nope", ""]
+
+    def test_items_with_list_or_id_skip_lookup(self):
+        reminders.name_index.add("Known", "Work", "id-K")
+        with patch.object(reminders, "FANOUT", 4), \
+                patch("subprocess.run", return_value=mock_run("ok\x1eok\x1eok")) as mock:
+            delete_reminders([{"name": "A", "list_name": "Work"}, {"reminder_id": "id-B"}, {"name": "Known"}])
+        assert mock.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# name -> id index
+# ---------------------------------------------------------------------------
+
+class TestNameIndex:
+    def list_work(self, *names):
+        output = columns("Work", *((name, "false", "", "") for name in names))
+        with patch("subprocess.run", return_value=mock_run(output)):
+            get_reminders("Work")
+
+    def test_listing_lets_name_calls_use_the_id(self):
+        self.list_work("Buy milk")
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-Buy milk")) as mock:
+            complete_reminder("Buy milk", list_name="Work")
+            assert script_args(mock) == ["id-Buy milk", "Buy milk", "Work"]
+
+    def test_unique_name_resolves_without_list(self):
+        self.list_work("Buy milk")
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-Buy milk")) as mock:
+            complete_reminder("Buy milk")
+            assert script_args(mock)[0] == "id-Buy milk"
+
+    def test_duplicate_names_are_not_resolved(self):
+        output = "\x1e".join([
+            columns("Work", ("Dup", "false", "", "")),
+            "Work", "1", "id-other", "Dup", "false", "", "",
+        ])
+        with patch("subprocess.run", return_value=mock_run(output)):
+            get_reminders("Work")
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-Dup")) as mock:
+            complete_reminder("Dup", list_name="Work")
+            assert script_args(mock)[0] == ""
+
+    def test_rename_moves_the_index_entry(self):
+        self.list_work("Old")
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-Old")):
+            update_reminder("Old", list_name="Work", new_name="New")
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-Old")) as mock:
+            complete_reminder("New", list_name="Work")
+            assert script_args(mock)[0] == "id-Old"
+            complete_reminder("Old", list_name="Work")
+            assert script_args(mock)[0] == ""
+
+    def test_delete_forgets_the_id(self):
+        self.list_work("Gone")
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-Gone")):
+            delete_reminder("Gone", list_name="Work")
+        with patch("subprocess.run", return_value=mock_run("not found")) as mock:
+            delete_reminder("Gone", list_name="Work")
+            assert script_args(mock)[0] == ""
+
+    @pytest.mark.parametrize("call", [
+        lambda: complete_reminder("Call mom", reminder_id="id-X"),
+        lambda: update_reminder("Call mom", notes="n", reminder_id="id-X"),
+        lambda: delete_reminder("Call mom", reminder_id="id-X"),
+    ])
+    def test_caller_id_is_trusted_whatever_the_name(self, call):
+        # id-X has since been renamed: the name must not redirect the write.
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-X")) as mock:
+            assert call() is True
+        assert script_args(mock)[:3] == ["id-X", "", ""]
+
+    def test_indexed_id_is_passed_with_its_name_for_checking(self):
+        reminders.name_index.add("Call mom", "Home", "id-X")
+        with patch("subprocess.run", return_value=mock_run("ok\x1fid-X")) as mock:
+            delete_reminder("Call mom", list_name="Home")
+        assert script_args(mock)[:3] == ["id-X", "Call mom", "Home"]
+
+    def test_discard_looks_the_id_up_instead_of_scanning(self):
+        class Unscannable(dict):
+            def __iter__(self):
+                raise AssertionError("discard scanned the index")
+
+            items = values = keys = __iter__
+
+        index = reminders._NameIndex()
+        index.add_many((f"R{i}", "Work", f"id-{i}") for i in range(1000))
+        index._ids = Unscannable(index._ids)
+        assert index.discard("id-500") == "Work"
+        assert index.discard("id-500") is None
+        assert index.lookup("R500", "Work") is None
+        assert index.lookup("R501", "Work") == "id-501"
+
+    def test_discard_after_a_move_forgets_only_the_new_place(self):
+        index = reminders._NameIndex()
+        index.add("A", "Work", "id-A")
+        index.add("A", "Home", "id-A")
+        assert index.lookup("A", "Work") is None
+        assert index.discard("id-A") == "Home"
+        assert index.lookup("A", None) is None
+
+    def test_ambiguous_names_cannot_be_discarded(self):
+        index = reminders._NameIndex()
+        index.add("Dup", "Work", "id-1")
+        index.add("Dup", "Work", "id-2")
+        assert index.discard("id-1") is None
+        assert index.discard("id-2") is None
+        assert index.lookup("Dup", "Work") is None
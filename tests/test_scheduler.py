@@ -0,0 +1,115 @@
+"""Tests for the async call scheduler."""
+
+import asyncio
+
+import pytest
+
+from reminders_mcp import reminders
+from reminders_mcp.scheduler import Scheduler, reminder_keys
+
+
+class Recorder:
+    """Async callable that logs start/end events and tracks peak concurrency."""
+
+    def __init__(self):
+        self.events = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, label, delay=0.01):
+        self.events.append(("start", label))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(delay)
+        self.running -= 1
+        self.events.append(("end", label))
+        return label
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+class TestScheduler:
+    def test_reads_run_in_parallel(self):
+        async def main():
+            scheduler, call = Scheduler(4), Recorder()
+            results = await asyncio.gather(*(scheduler.read(call, i) for i in range(4)))
+            return results, call.peak
+
+        assert run(main()) == ([0, 1, 2, 3], 4)
+
+    def test_concurrency_is_capped(self):
+        async def main():
+            scheduler, call = Scheduler(2), Recorder()
+            await asyncio.gather(*(scheduler.read(call, i) for i in range(6)))
+            return call.peak
+
+        assert run(main()) == 2
+
+    def test_writes_to_same_reminder_keep_arrival_order(self):
+        async def main():
+            scheduler, call = Scheduler(4), Recorder()
+            await asyncio.gather(
+                scheduler.write(["id:1"], call, "first", 0.03),
+                scheduler.write(["id:1"], call, "second", 0.0),
+            )
+            return call.events
+
+        assert run(main()) == [("start", "first"), ("end", "first"), ("start", "second"), ("end", "second")]
+
+    def test_writes_to_different_reminders_overlap(self):
+        async def main():
+            scheduler, call = Scheduler(4), Recorder()
+            await asyncio.gather(scheduler.write(["id:1"], call, "a"), scheduler.write(["id:2"], call, "b"))
+            return call.peak
+
+        assert run(main()) == 2
+
+    def test_overlapping_key_sets_do_not_deadlock(self):
+        async def main():
+            scheduler, call = Scheduler(4), Recorder()
+            return await asyncio.wait_for(asyncio.gather(
+                scheduler.write(["a", "b"], call, 1),
+                scheduler.write(["b", "a"], call, 2),
+            ), timeout=1)
+
+        assert run(main()) == [1, 2]
+
+    def test_locks_are_released(self):
+        async def main():
+            scheduler = Scheduler(1)
+
+            async def fail():
+                raise RuntimeError("boom")
+
+            with pytest.raises(RuntimeError):
+                await scheduler.write(["id:1"], fail)
+            await scheduler.write(["id:1"], Recorder(), "again")
+            return scheduler._locks
+
+        assert run(main()) == {}
+
+    def test_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            Scheduler(0)
+
+
+# ---------------------------------------------------------------------------
+# reminder_keys
+# ---------------------------------------------------------------------------
+
+class TestReminderKeys:
+    def test_id_and_names(self):
+        assert reminder_keys({"reminder_id": "x", "name": "A", "new_name": "B"}) == {"id:x", "name:A", "name:B"}
+
+    def test_resolves_id_through_name_index(self):
+        reminders.name_index.add("A", "Work", "id-A")
+        assert reminder_keys({"name": "A", "list_name": "Work"}) == {"id:id-A", "name:A"}
+
+    def test_empty_values_are_ignored(self):
+        assert reminder_keys({"name": "", "reminder_id": "id-A", "new_name": ""}) == {"id:id-A"}
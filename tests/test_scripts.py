@@ -0,0 +1,83 @@
+"""Tests for the compiled AppleScript cache — osacompile is mocked."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from reminders_mcp import scripts
+
+
+def fake_osacompile(command, **kwargs):
+    """Write a placeholder .scpt where osacompile would."""
+    Path(command[command.index("-o") + 1]).write_text("compiled")
+    result = type("Result", (), {})()
+    result.returncode = 0
+    result.stderr = ""
+    return result
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("REMINDERS_MCP_SCRIPT_CACHE", str(tmp_path))
+    monkeypatch.setattr(scripts, "_compiled", {})
+    monkeypatch.setattr(scripts, "_pruned", False)
+    with patch("shutil.which", return_value="/usr/bin/osacompile"):
+        yield tmp_path
+
+
+class TestCompiledPath:
+    def test_compiles_once_per_source(self, cache):
+        with patch("subprocess.run", side_effect=fake_osacompile) as mock:
+            first = scripts.compiled_path("return 1")
+            second = scripts.compiled_path("return 1")
+        assert first == second
+        assert first.read_text() == "compiled"
+        assert mock.call_count == 1
+
+    def test_keyed_by_content_hash(self, cache):
+        with patch("subprocess.run", side_effect=fake_osacompile):
+            assert scripts.compiled_path("return 1") != scripts.compiled_path("return 2")
+
+    def test_reuses_file_from_previous_process(self, cache):
+        with patch("subprocess.run", side_effect=fake_osacompile):
+            path = scripts.compiled_path("return 1")
+        scripts._compiled.clear()
+        with patch("subprocess.run") as mock:
+            assert scripts.compiled_path("return 1") == path
+            mock.assert_not_called()
+
+    def test_lives_under_package_version(self, cache):
+        with patch("subprocess.run", side_effect=fake_osacompile):
+            path = scripts.compiled_path("return 1")
+        assert path.parent == cache / "compiled" / scripts.package_version()
+
+    def test_other_versions_are_pruned(self, cache):
+        stale = cache / "compiled" / "0.0.1"
+        stale.mkdir(parents=True)
+        (stale / "old.scpt").write_text("old")
+        with patch("subprocess.run", side_effect=fake_osacompile):
+            scripts.compiled_path("return 1")
+        assert not stale.exists()
+
+    def test_foreign_directories_in_the_cache_dir_survive(self, cache):
+        foreign = cache / "important_app_cache"
+        foreign.mkdir()
+        (foreign / "data").write_text("keep")
+        with patch("subprocess.run", side_effect=fake_osacompile):
+            scripts.compiled_path("return 1")
+        assert (foreign / "data").read_text() == "keep"
+
+    def test_compile_error_raises(self, cache):
+        failed = type("Result", (), {"returncode": 1, "stderr": "syntax error"})()
+        with patch("subprocess.run", return_value=failed):
+            with pytest.raises(RuntimeError, match="AppleScript compile error"):
+                scripts.compiled_path("return (")
+
+    def test_disabled_cache_returns_none(self, cache, monkeypatch):
+        monkeypatch.setenv("REMINDERS_MCP_SCRIPT_CACHE", "off")
+        assert scripts.compiled_path("return 1") is None
+
+    def test_missing_osacompile_returns_none(self, cache):
+        with patch("shutil.which", return_value=None):
+            assert scripts.compiled_path("return 1") is None
@@ -0,0 +1,136 @@
+"""Tests for the in-process search index."""
+
+from unittest.mock import patch
+
+import pytest
+
+from reminders_mcp.search import SearchIndex, tokenize
+
+
+def item(reminder_id, name, notes=None, list_name="Work", completed=False):
+    return {"id": reminder_id, "list": list_name, "name": name, "completed": completed, "due_date": None, "notes": notes}
+
+
+def ids(results):
+    return [result["id"] for result in results]
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.rebuild([
+        item("1", "Dentist appointment", "Call Dr. Smith"),
+        item("2", "Buy groceries", "milk, eggs, dental floss"),
+        item("3", "Dentist bill", list_name="Home", completed=True),
+        item("4", "Call mom"),
+    ])
+    return index
+
+
+# ---------------------------------------------------------------------------
+# search
+# ---------------------------------------------------------------------------
+
+class TestSearch:
+    def test_tokenize_folds_case_and_punctuation(self):
+        assert tokenize("Call Dr. SMITH, café!") == ["call", "dr", "smith", "café"]
+
+    def test_exact_match(self, index):
+        assert ids(index.search("groceries")) == ["2"]
+
+    def test_prefix_match(self, index):
+        assert ids(index.search("dent")) == ["1", "2"]
+
+    def test_name_match_ranks_above_notes(self, index):
+        results = index.search("call")
+        assert ids(results) == ["4", "1"]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_exact_term_ranks_above_prefix_expansion(self):
+        index = SearchIndex()
+        index.rebuild([item("1", "Cart repair"), item("2", "Car wash")])
+        assert ids(index.search("car")) == ["2", "1"]
+
+    def test_all_words_must_match(self, index):
+        assert ids(index.search("dentist smith")) == ["1"]
+        assert index.search("dentist mom") == []
+
+    def test_completed_and_list_filters(self, index):
+        assert ids(index.search("dentist")) == ["1"]
+        assert ids(index.search("dentist", include_completed=True)) == ["3", "1"]
+        assert ids(index.search("dentist", list_name="Home", include_completed=True)) == ["3"]
+
+    def test_limit(self, index):
+        assert len(index.search("dent", limit=1)) == 1
+
+    def test_empty_query(self, index):
+        assert index.search("  ,, ") == []
+
+
+# ---------------------------------------------------------------------------
+# incremental updates
+# ---------------------------------------------------------------------------
+
+    def test_rebuild_sorts_the_vocabulary_once(self):
+        index = SearchIndex()
+        with patch("bisect.insort", side_effect=AssertionError("insort during rebuild")):
+            index.rebuild([item(str(i), f"Task {i}", f"see https://example.com/{i * 7919}") for i in range(500)])
+        assert index._terms == sorted(index._postings)
+        index.add(item("x", "Zebra crossing"))
+        assert index._terms == sorted(index._postings)
+        assert ids(index.search("zeb")) == ["x"]
+
+
+class TestUpdates:
+    def test_update_reindexes_text(self, index):
+        index.update("4", name="Call dad")
+        assert index.search("mom") == []
+        assert ids(index.search("dad")) == ["4"]
+
+    def test_remove_drops_unique_terms(self, index):
+        index.remove("4")
+        assert index.search("mom") == []
+        assert "mom" not in index._terms
+
+    def test_created_hook_adds_reminder(self, index):
+        index.reminder_created({"name": "Renew passport", "list_name": "Home"}, "5")
+        assert ids(index.search("passport")) == ["5"]
+
+    def test_created_in_default_list_marks_stale(self, index):
+        index.reminder_created({"name": "Renew passport"}, "5")
+        assert not index.is_fresh(300)
+
+    def test_hooks_resolve_names(self, index):
+        index.reminder_completed({"name": "Call mom"}, None)
+        assert index.search("mom") == []
+        index.reminder_updated({"name": "Buy groceries", "new_name": "Buy bread"}, None)
+        assert ids(index.search("bread")) == ["2"]
+        index.reminder_deleted({"name": "Dentist appointment", "list_name": "Work"}, None)
+        assert ids(index.search("dentist", include_completed=True)) == ["3"]
+
+    def test_hooks_store_iso_due_dates(self, index):
+        index.reminder_created({"name": "Renew passport", "list_name": "Home", "due_date": "2026-03-01"}, "5")
+        assert index.search("passport")[0]["due_date"] == "2026-03-01T00:00:00"
+        index.reminder_updated({"name": "Renew passport", "due_date": "2026-03-02T10:00"}, "5")
+        assert index.search("passport")[0]["due_date"] == "2026-03-02T10:00:00"
+
+    def test_locale_due_date_marks_stale(self, index):
+        index.reminder_updated({"name": "Call mom", "due_date": "March 1, 2026"}, None)
+        assert not index.is_fresh(300)
+
+    def test_unknown_reminder_marks_stale(self, index):
+        index.reminder_completed({"name": "Nope"}, None)
+        assert not index.is_fresh(300)
+
+    def test_hooks_ignored_before_first_build(self):
+        index = SearchIndex()
+        index.reminder_created({"name": "A", "list_name": "Work"}, "1")
+        assert len(index) == 0
+
+    def test_freshness(self, clock):
+        index = SearchIndex(clock)
+        index.rebuild([])
+        clock.now = 299
+        assert index.is_fresh(300)
+        clock.now = 300
+        assert not index.is_fresh(300)
@@ -1,6 +1,22 @@
 """Tests for MCP server tool registration."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp import types
+from mcp.server.lowlevel import NotificationOptions
+from mcp.shared.memory import create_connected_server_and_client_session
+from pydantic import AnyUrl
+
+from reminders_mcp import server
+from reminders_mcp.mirror import Mirror
+from reminders_mcp.record import Reminder
+from reminders_mcp.search import SearchIndex
 from reminders_mcp.server import mcp
+from reminders_mcp.stats import metrics
+from reminders_mcp.watch import SNAPSHOT_SCRIPT, Watcher
+from reminders_mcp.writeback import WriteQueue
 
 EXPECTED_TOOLS = {
     "list_reminder_lists",
@@ -9,13 +25,607 @@ EXPECTED_TOOLS = {
     "update_reminder",
     "complete_reminder",
     "delete_reminder",
+    "create_reminders",
+    "update_reminders",
+    "complete_reminders",
+    "delete_reminders",
+    "search_reminders",
+    "agenda",
+    "reminder_counts",
+    "flush",
+    "export_reminders",
+    "import_reminders",
 }
 
 
+def record(name, list_name="Work", **values):
+    """A reminder as the backend returns it, with the default fields."""
+    return Reminder(("id", "list", "name", "completed", "due_date", "notes"), f"id-{name}", list_name, name, **values)
+
+
 def test_all_tools_registered():
     registered = set(mcp._tool_manager._tools.keys())
     assert EXPECTED_TOOLS == registered
 
 
 def test_tool_count():
-    assert len(mcp._tool_manager._tools) == 6
+    assert len(mcp._tool_manager._tools) == 16
+
+
+def test_tools_are_async():
+    assert all(tool.is_async for tool in mcp._tool_manager._tools.values())
+
+
+def test_cache_stats_resource_registered():
+    assert "reminders://cache/stats" in {str(uri) for uri in mcp._resource_manager._resources}
+
+
+def test_stats_resource_registered():
+    assert "reminders://stats" in {str(uri) for uri in mcp._resource_manager._resources}
+
+
+def test_tool_latency_is_recorded():
+    metrics.reset()
+    with patch("reminders_mcp.aio.get_lists", return_value=["Work"]):
+        asyncio.run(mcp.call_tool("list_reminder_lists", {}))
+    stats = server.server_stats()
+    assert stats["timers"]["tool.list_reminder_lists"]["count"] == 1
+    assert "hit_rate" in stats["cache"]
+
+
+@pytest.fixture
+def cache():
+    server.cache.clear()
+    yield server.cache
+    server.cache.clear()
+
+
+def test_list_reminders_is_cached(cache):
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=([], None)) as mock:
+        asyncio.run(server.list_reminders("Work"))
+        asyncio.run(server.list_reminders("Work"))
+    assert mock.call_count == 1
+
+
+def test_list_reminders_returns_page_and_cursor(cache):
+    page = ([record("A", "Inbox")], "next")
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=page) as mock:
+        result = asyncio.run(server.list_reminders("Inbox", limit=1))
+    assert result == {"reminders": [page[0][0].to_dict()], "next_cursor": "next"}
+    assert type(result["reminders"][0]) is dict
+    assert mock.call_args.kwargs["limit"] == 1
+
+
+def test_create_reminder_invalidates_its_list(cache):
+    created = [{"name": "Task", "id": "id-Task", "success": True, "error": None}]
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=([], None)) as mock, \
+            patch("reminders_mcp.aio.create_reminders", return_value=created):
+        asyncio.run(server.list_reminders("Work"))
+        asyncio.run(server.create_reminder("Task", list_name="Work"))
+        asyncio.run(server.list_reminders("Work"))
+    assert mock.call_count == 2
+
+
+def test_list_reminders_passes_filters(cache):
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=([], None)) as mock:
+        asyncio.run(server.list_reminders(search="dentist", flagged=True))
+    assert mock.call_args.kwargs["search"] == "dentist"
+    assert mock.call_args.kwargs["flagged"] is True
+    assert mock.call_args.kwargs["due_before"] is None
+
+
+def test_list_reminders_passes_projection(cache):
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=([], None)) as mock:
+        asyncio.run(server.list_reminders(fields=["notes"], notes_max_chars=50))
+        asyncio.run(server.list_reminders())
+    assert mock.call_args_list[0].kwargs["fields"] == ("id", "list", "name", "notes")
+    assert mock.call_args_list[0].kwargs["notes_max_chars"] == 50
+    assert mock.call_args_list[1].kwargs["fields"] == ("id", "list", "name", "completed", "due_date", "notes")
+
+
+def test_list_reminders_rejects_unknown_fields(cache):
+    with pytest.raises(ValueError, match="Unknown reminder fields"):
+        asyncio.run(server.list_reminders(fields=["colour"]))
+
+
+def test_batch_complete_invalidates_only_successful_items(cache):
+    results = [
+        {"name": "A", "id": "id-A", "success": True, "error": None},
+        {"name": "B", "id": None, "success": False, "error": "not found"},
+    ]
+    with patch("reminders_mcp.aio.complete_reminders", return_value=results) as mock, \
+            patch.object(server.cache, "reminder_changed") as changed:
+        assert asyncio.run(server.complete_reminders([{"name": "A", "list_name": ""}, {"name": "B"}])) == results
+    assert mock.call_args[0][0] == [{"name": "A"}, {"name": "B"}]
+    changed.assert_called_once_with("A", None, "id-A")
+
+
+def test_complete_reminder_by_id(cache):
+    with patch("reminders_mcp.aio.complete_reminder", return_value=True) as mock, \
+            patch.object(server.cache, "reminder_changed") as changed:
+        assert asyncio.run(server.complete_reminder(reminder_id="id-A")) is True
+    assert mock.call_args.kwargs == {"name": None, "list_name": None, "reminder_id": "id-A"}
+    changed.assert_called_once_with(None, None, "id-A")
+
+
+def test_agenda_reads_incomplete_reminders_due_in_window(cache):
+    fields = ("id", "list", "name", "due_date", "priority")
+    items = [Reminder(fields, "id-A", "Work", "A", due_date="2000-01-01T09:00:00", priority=1)]
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=(items, None)) as mock:
+        result = asyncio.run(server.agenda(list_name="Work", days=3, limit=5))
+    kwargs = mock.call_args.kwargs
+    assert kwargs["include_completed"] is False
+    assert kwargs["fields"] == ("id", "list", "name", "due_date", "priority")
+    assert kwargs["due_before"].endswith("T00:00:00")
+    assert [item["id"] for item in result["overdue"]] == ["id-A"]
+    assert result["counts"] == {"overdue": 1, "today": 0, "upcoming": 0}
+
+
+def test_reminder_counts_share_concurrent_calls():
+    async def slow_counts(list_name):
+        await asyncio.sleep(0.01)
+        return {"lists": [], "total": {}}
+
+    async def scenario():
+        return await asyncio.gather(server.reminder_counts(), server.reminder_counts())
+
+    with patch("reminders_mcp.aio.get_counts", side_effect=slow_counts) as mock:
+        asyncio.run(scenario())
+    assert mock.call_count == 1
+
+
+@pytest.fixture
+def mirror(monkeypatch):
+    mirror = Mirror(":memory:")
+    monkeypatch.setattr(server, "mirror", mirror)
+    yield mirror
+    mirror.close()
+
+
+def test_list_reminders_answers_from_mirror(mirror, cache):
+    output = "\x1e".join(["T1", "Work", "id-A", "1", "id-A", "A", "false", "missing value", "", "false", "0"])
+    with patch("reminders_mcp.aio.run_applescript", return_value=output) as run, \
+            patch("reminders_mcp.aio.get_reminders_page") as live:
+        first = asyncio.run(server.list_reminders("Work"))
+        second = asyncio.run(server.list_reminders("Work"))
+    assert first == second
+    assert [item["id"] for item in first["reminders"]] == ["id-A"]
+    assert run.call_count == 1
+    live.assert_not_called()
+
+
+def test_mutation_makes_mirror_resync(mirror, cache):
+    output = "\x1e".join(["T1"])
+    with patch("reminders_mcp.aio.run_applescript", return_value=output) as run, \
+            patch("reminders_mcp.aio.complete_reminder", return_value=True):
+        asyncio.run(server.list_reminders())
+        asyncio.run(server.complete_reminder(reminder_id="id-A"))
+        asyncio.run(server.list_reminders())
+    assert run.call_count == 2
+
+
+def test_due_date_filters_bypass_mirror(mirror, cache):
+    with patch("reminders_mcp.aio.run_applescript") as run, \
+            patch("reminders_mcp.aio.get_reminders_page", return_value=([], None)) as live:
+        asyncio.run(server.list_reminders(due_before="March 1, 2026"))
+    run.assert_not_called()
+    assert live.call_count == 1
+
+
+def test_iso_due_date_filters_use_mirror(mirror, cache):
+    output = "\x1e".join(["T1", "Work", "id-A", "1", "id-A", "A", "false", "2026-03-01T09:00:00", "", "false", "0"])
+    with patch("reminders_mcp.aio.run_applescript", return_value=output), \
+            patch("reminders_mcp.aio.get_reminders_page") as live:
+        result = asyncio.run(server.list_reminders(due_before="2026-03-02"))
+    assert [item["due_date"] for item in result["reminders"]] == ["2026-03-01T09:00:00"]
+    live.assert_not_called()
+
+
+@pytest.fixture
+def search_index(monkeypatch):
+    index = SearchIndex()
+    monkeypatch.setattr(server, "search_index", index)
+    return index
+
+
+def test_search_reminders_builds_index_once(search_index, cache):
+    items = [
+        {"id": "1", "list": "Work", "name": "Dentist appointment", "completed": False, "due_date": None, "notes": None},
+        {"id": "2", "list": "Work", "name": "Email", "completed": False, "due_date": None, "notes": "about dentist"},
+    ]
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=(items, None)) as mock:
+        first = asyncio.run(server.search_reminders("dent"))
+        second = asyncio.run(server.search_reminders("email"))
+    assert [item["id"] for item in first] == ["1", "2"]
+    assert [item["id"] for item in second] == ["2"]
+    assert mock.call_count == 1
+    assert mock.call_args.kwargs["include_completed"] is True
+
+
+def test_writes_update_search_index(search_index, cache):
+    search_index.rebuild([
+        {"id": "1", "list": "Work", "name": "Dentist", "completed": False, "due_date": None, "notes": None},
+    ])
+    created = [{"name": "Dentist bill", "id": "2", "success": True, "error": None}]
+    with patch("reminders_mcp.aio.create_reminders", return_value=created), \
+            patch("reminders_mcp.aio.complete_reminder", return_value=True):
+        asyncio.run(server.create_reminders([{"name": "Dentist bill", "list_name": "Work"}]))
+        asyncio.run(server.complete_reminder(reminder_id="1"))
+    assert [item["id"] for item in asyncio.run(server.search_reminders("dentist"))] == ["2"]
+
+
+def test_create_reminder_indexes_the_created_id(search_index, cache):
+    search_index.rebuild([])
+    created = [{"name": "Dentist", "id": "id-new", "success": True, "error": None}]
+    with patch("reminders_mcp.aio.create_reminders", return_value=created) as create:
+        assert asyncio.run(server.create_reminder("Dentist", list_name="Work")) == "Dentist"
+    create.assert_called_once_with([{"name": "Dentist", "list_name": "Work"}])
+    assert [item["id"] for item in asyncio.run(server.search_reminders("dentist"))] == ["id-new"]
+
+
+def test_create_reminder_failure_raises(cache):
+    failed = [{"name": "Dentist", "id": None, "success": False, "error": "Can't get list"}]
+    with patch("reminders_mcp.aio.create_reminders", return_value=failed):
+        with pytest.raises(RuntimeError, match="Can't get list"):
+            asyncio.run(server.create_reminder("Dentist", list_name="Nope"))
+
+
+def test_concurrent_list_reminders_share_one_read(cache):
+    async def slow_page(**kwargs):
+        await asyncio.sleep(0.01)
+        return [record("A")], None
+
+    async def scenario():
+        return await asyncio.gather(*(server.list_reminders("Work") for _ in range(4)))
+
+    with patch("reminders_mcp.aio.get_reminders_page", side_effect=slow_page) as mock:
+        results = asyncio.run(scenario())
+    assert mock.call_count == 1
+    assert all(result["reminders"][0]["name"] == "A" for result in results)
+
+
+# ---------------------------------------------------------------------------
+# list resources and subscriptions
+# ---------------------------------------------------------------------------
+
+def test_list_resource_template_registered():
+    assert "reminders://list/{name}" in mcp._resource_manager._templates
+
+
+def test_list_resource_reads_open_reminders_of_the_list(cache):
+    milk = record("Milk", "Grocery List")
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=([milk], None)) as mock:
+        result = asyncio.run(server.list_resource("Grocery%20List"))
+    assert result == {"list": "Grocery List", "reminders": [milk.to_dict()]}
+    assert mock.call_args.kwargs["list_name"] == "Grocery List"
+    assert mock.call_args.kwargs["include_completed"] is False
+
+
+def test_changed_lists_drop_cached_reads(cache):
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=([], None)) as mock:
+        asyncio.run(server.list_reminders("Work"))
+        server._lists_changed(["Work"])
+        asyncio.run(server.list_reminders("Work"))
+    assert mock.call_count == 2
+
+
+def test_subscribers_are_notified_of_changed_lists(monkeypatch):
+    snapshots = ["Work\x1eid-1\x1ed1\x1eHome\x1eid-2\x1ed1"]
+
+    async def run_applescript(script, *args):
+        assert script == SNAPSHOT_SCRIPT
+        return snapshots[-1]
+
+    monkeypatch.setattr(server, "watcher", Watcher(lambda: run_applescript(SNAPSHOT_SCRIPT), interval=0.01))
+    updated = []
+
+    async def on_message(message):
+        if isinstance(message, types.ServerNotification):
+            updated.append(str(message.root.params.uri))
+
+    async def scenario():
+        server_ = mcp._mcp_server
+        async with create_connected_server_and_client_session(server_, message_handler=on_message) as client:
+            await client.subscribe_resource("reminders://list/Home")
+            await asyncio.sleep(0.05)
+            snapshots.append("Work\x1eid-1\x1ed2\x1eHome\x1eid-2\x1ed2")
+            await asyncio.sleep(0.05)
+            await client.unsubscribe_resource("reminders://list/Home")
+        capabilities = server_.get_capabilities(NotificationOptions(), {})
+        return capabilities.resources.subscribe
+
+    assert asyncio.run(scenario()) is True
+    assert updated == ["reminders://list/Home"]
+
+
+def test_disconnecting_without_unsubscribing_stops_the_watcher(monkeypatch):
+    async def read():
+        return "Work\x1eid-1\x1ed1"
+
+    watcher = Watcher(read, interval=0.01)
+    monkeypatch.setattr(server, "watcher", watcher)
+
+    async def scenario():
+        async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+            await client.subscribe_resource("reminders://list/Work")
+            await client.subscribe_resource("reminders://list/Home")
+            await asyncio.sleep(0.03)
+            assert watcher.stats()["subscriptions"] == 2
+        await asyncio.sleep(0.03)
+        return watcher._task.done()
+
+    assert asyncio.run(scenario()) is True
+    assert watcher.stats()["subscriptions"] == 0
+
+
+def test_subscribing_without_a_session_exit_stack(monkeypatch):
+    watcher = Watcher(AsyncMock(), interval=60)
+    monkeypatch.setattr(server, "watcher", watcher)
+    session = MagicMock(spec=["send_resource_updated"])
+    context = MagicMock(session=session)
+
+    async def scenario():
+        with patch.object(type(server._server), "request_context", new=context):
+            await server._subscribe(AnyUrl("reminders://list/Work"))
+        subscribed = watcher.is_subscribed(session)
+        watcher.unsubscribe("reminders://list/Work", session)
+        return subscribed
+
+    assert asyncio.run(scenario()) is True
+
+
+# ---------------------------------------------------------------------------
+# write-behind
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def write_behind(monkeypatch):
+    queue = WriteQueue(delay=60, max_pending=3)
+    monkeypatch.setattr(server, "write_queue", queue)
+    monkeypatch.setattr(server, "_flush_timer", None)
+    return queue
+
+
+def succeeded(items):
+    return [{"name": item.get("name"), "id": f"id-{item.get('name')}", "success": True, "error": None} for item in items]
+
+
+def test_writes_are_queued_and_merged_until_flush(write_behind, cache):
+    async def scenario():
+        receipts = [
+            await server.create_reminder("Task", list_name="Work"),
+            await server.update_reminder("Task", list_name="Work", notes="n"),
+        ]
+        return receipts, await server.flush([receipt["ticket"] for receipt in receipts])
+
+    with patch("reminders_mcp.aio.create_reminders", side_effect=succeeded) as create, \
+            patch("reminders_mcp.aio.update_reminders") as update:
+        receipts, outcomes = asyncio.run(scenario())
+    assert [receipt["ticket"] for receipt in receipts] == [1, 2]
+    assert all(receipt["queued"] for receipt in receipts)
+    create.assert_called_once_with([{"name": "Task", "list_name": "Work", "notes": "n"}])
+    update.assert_not_called()
+    assert outcomes == [
+        {"tickets": [1, 2], "action": "create", "name": "Task", "id": "id-Task", "success": True, "error": None}
+    ]
+
+
+def test_reads_apply_queued_writes_first(write_behind, cache):
+    calls = []
+
+    def complete(items):
+        calls.append("complete")
+        return succeeded(items)
+
+    def page(**kwargs):
+        calls.append("read")
+        return [], None
+
+    async def scenario():
+        await server.complete_reminder("Task")
+        await server.list_reminders("Work")
+
+    with patch("reminders_mcp.aio.complete_reminders", side_effect=complete), \
+            patch("reminders_mcp.aio.get_reminders_page", side_effect=page):
+        asyncio.run(scenario())
+    assert calls == ["complete", "read"]
+    assert len(write_behind) == 0
+
+
+def test_full_queue_flushes_in_one_batch_per_kind(write_behind, cache):
+    async def scenario():
+        for name in ("A", "B", "C"):
+            await server.delete_reminder(name)
+
+    with patch("reminders_mcp.aio.delete_reminders", side_effect=succeeded) as delete:
+        asyncio.run(scenario())
+    delete.assert_called_once_with([{"name": "A"}, {"name": "B"}, {"name": "C"}])
+    assert [outcome["tickets"] for outcome in write_behind.outcomes([1, 2, 3])] == [[1], [2], [3]]
+
+
+def test_flush_reports_only_the_callers_tickets(write_behind, cache):
+    async def scenario():
+        mine = await server.complete_reminder("A")
+        theirs = await server.complete_reminder("B")
+        return await server.flush([mine["ticket"]]), await server.flush([theirs["ticket"]])
+
+    with patch("reminders_mcp.aio.complete_reminders", side_effect=succeeded):
+        mine, theirs = asyncio.run(scenario())
+    assert [outcome["name"] for outcome in mine] == ["A"]
+    assert [outcome["name"] for outcome in theirs] == ["B"]
+
+
+def test_queued_writes_flush_after_the_delay(write_behind, cache):
+    write_behind.delay = 0.01
+
+    async def scenario():
+        await server.complete_reminder(reminder_id="id-A")
+        await asyncio.sleep(0.05)
+
+    with patch("reminders_mcp.aio.complete_reminders", side_effect=succeeded) as complete:
+        asyncio.run(scenario())
+    complete.assert_called_once_with([{"reminder_id": "id-A"}])
+
+
+def test_background_flush_logs_any_error_and_retries(write_behind, cache, caplog):
+    write_behind.delay = 0.01
+    calls = []
+
+    def complete(items):
+        calls.append(items)
+        if len(calls) == 1:
+            raise OSError("pool worker died")
+        return succeeded(items)
+
+    async def scenario():
+        await server.complete_reminder(reminder_id="id-A")
+        await asyncio.sleep(0.1)
+
+    with patch("reminders_mcp.aio.complete_reminders", side_effect=complete):
+        asyncio.run(scenario())
+    assert len(calls) == 2
+    assert len(write_behind) == 0
+    assert "pool worker died" in caplog.text
+
+
+def test_failed_flush_keeps_writes_queued(write_behind, cache):
+    async def scenario():
+        await server.create_reminder("A")
+        await server.flush()
+
+    with patch("reminders_mcp.aio.create_reminders", side_effect=RuntimeError("AppleScript error: boom")):
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(scenario())
+    assert [write.item for write in write_behind.take()] == [{"name": "A"}]
+
+
+def test_queued_write_needs_a_target(write_behind):
+    with pytest.raises(ValueError, match="Either name or reminder_id"):
+        asyncio.run(server.complete_reminder())
+
+
+def test_shutdown_applies_queued_writes(write_behind, monkeypatch):
+    write_behind.add("complete", {"name": "A"})
+    with patch.object(server.reminders, "complete_reminders", side_effect=succeeded) as complete, \
+            patch.object(server.mcp, "run"):
+        server.main(["--transport", "stdio"])
+    complete.assert_called_once_with([{"name": "A"}])
+    assert len(write_behind) == 0
+
+
+# ---------------------------------------------------------------------------
+# export and import
+# ---------------------------------------------------------------------------
+
+def test_import_drops_cached_reads(cache, tmp_path):
+    backup = tmp_path / "backup.ndjson"
+    backup.write_text('{"id": "x", "list": "Work", "name": "A"}\n')
+    result = {"created": 1, "completed": 0, "failed": 0, "errors": [], "resumed_at_line": 0, "lists": ["Work"]}
+    with patch("reminders_mcp.aio.get_reminders_page", return_value=([], None)) as page, \
+            patch.object(server.transfer, "import_reminders", return_value=result) as import_:
+        asyncio.run(server.list_reminders("Work"))
+        assert asyncio.run(server.import_reminders(str(backup))) == result
+        asyncio.run(server.list_reminders("Work"))
+    import_.assert_called_once_with(backup, 100)
+    assert page.call_count == 2
+
+
+@pytest.mark.parametrize("path", ["-", "backup.ndjson", "./backup.ndjson"])
+def test_import_tool_rejects_stdin_and_relative_paths(path):
+    with patch.object(server.transfer, "import_reminders") as import_:
+        with pytest.raises(ValueError, match="must be absolute"):
+            asyncio.run(server.import_reminders(path))
+    import_.assert_not_called()
+
+
+def test_import_tool_only_reads_exports(tmp_path):
+    other = tmp_path / "notes.txt"
+    other.write_text("not an export\n")
+    with patch.object(server.transfer, "import_reminders") as import_:
+        with pytest.raises(ValueError, match="Refusing to import"):
+            asyncio.run(server.import_reminders(str(other)))
+        with pytest.raises(ValueError, match="Refusing to import"):
+            asyncio.run(server.import_reminders(str(tmp_path / "missing.ndjson")))
+    import_.assert_not_called()
+
+
+@pytest.mark.parametrize("path", ["-", "backup.ndjson", "./backup.ndjson"])
+def test_export_tool_rejects_stdout_and_relative_paths(path):
+    with patch.object(server.transfer, "export_file") as export:
+        with pytest.raises(ValueError, match="must be absolute"):
+            asyncio.run(server.export_reminders(path))
+    export.assert_not_called()
+
+
+def test_export_tool_only_replaces_earlier_exports(tmp_path):
+    other = tmp_path / "notes.txt"
+    other.write_text("not an export\n")
+    earlier = tmp_path / "backup.ndjson"
+    earlier.write_text('{"id": "x", "list": "Work", "name": "A"}\n')
+    with patch.object(server.transfer, "export_file", return_value={"reminders": 0}) as export:
+        with pytest.raises(ValueError, match="Refusing to overwrite"):
+            asyncio.run(server.export_reminders(str(other)))
+        with pytest.raises(ValueError, match="Refusing to overwrite"):
+            asyncio.run(server.export_reminders(str(tmp_path)))
+        asyncio.run(server.export_reminders(str(earlier)))
+        asyncio.run(server.export_reminders(str(tmp_path / "new.ndjson")))
+    assert [call.args[0] for call in export.call_args_list] == [earlier, tmp_path / "new.ndjson"]
+    assert other.read_text() == "not an export\n"
+
+
+def test_export_subcommand_runs_without_serving(capsys):
+    with patch.object(server.transfer, "export_file", return_value={"reminders": 3}) as export, \
+            patch.object(server.mcp, "run") as run, patch.object(server.reminders, "configure_pool"):
+        server.main(["export", "-", "--open-only"])
+    export.assert_called_once_with("-", False)
+    run.assert_not_called()
+    assert '"reminders": 3' in capsys.readouterr().err
+
+
+def test_import_subcommand_options():
+    args = server._parse_args(["import", "backup.ndjson", "--chunk-size", "50", "--checkpoint", "progress.json"])
+    assert (args.command, args.path, args.chunk_size, args.checkpoint) == (
+        "import", "backup.ndjson", 50, "progress.json"
+    )
+    assert server._parse_args([]).command is None
+
+
+# ---------------------------------------------------------------------------
+# transports
+# ---------------------------------------------------------------------------
+
+def test_stdio_is_the_default_transport(monkeypatch):
+    monkeypatch.delenv("REMINDERS_MCP_TRANSPORT", raising=False)
+    with patch.object(mcp, "run") as run:
+        server.main([])
+    run.assert_called_once_with()
+
+
+def test_transport_options_default_from_environment(monkeypatch):
+    monkeypatch.setenv("REMINDERS_MCP_TRANSPORT", "http")
+    monkeypatch.setenv("REMINDERS_MCP_PORT", "9001")
+    monkeypatch.setenv("REMINDERS_MCP_MAX_CONNECTIONS", "32")
+    args = server._parse_args([])
+    assert (args.transport, args.host, args.port, args.max_connections) == ("http", "127.0.0.1", 9001, 32)
+    assert server._parse_args(["--port", "9002"]).port == 9002
+
+
+def test_http_transport_configures_limits_and_shutdown(monkeypatch):
+    monkeypatch.setattr(mcp.settings, "host", mcp.settings.host)
+    monkeypatch.setattr(mcp.settings, "port", mcp.settings.port)
+    with patch("uvicorn.Server") as uvicorn_server, patch.object(server.reminders, "configure_pool") as pool:
+        server.main(["--transport", "http", "--port", "9003", "--max-connections", "64", "--shutdown-timeout", "5"])
+    config = uvicorn_server.call_args[0][0]
+    assert (config.host, config.port) == ("127.0.0.1", 9003)
+    assert config.limit_concurrency == 64
+    assert config.timeout_graceful_shutdown == 5
+    uvicorn_server.return_value.run.assert_called_once_with()
+    pool.assert_called_once_with(0)
+
+
+def test_http_transport_on_all_interfaces_accepts_any_host(monkeypatch):
+    for name in ("host", "port", "transport_security"):
+        monkeypatch.setattr(mcp.settings, name, getattr(mcp.settings, name))
+    with patch("uvicorn.Server"), patch.object(server.reminders, "configure_pool"):
+        server.main(["--transport", "http", "--host", "0.0.0.0"])
+    assert mcp.settings.transport_security is None
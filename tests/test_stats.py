@@ -0,0 +1,109 @@
+"""Tests for latency instrumentation."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from reminders_mcp import reminders
+from reminders_mcp.stats import Histogram, Metrics, Reporter, metrics
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+# ---------------------------------------------------------------------------
+# Histogram
+# ---------------------------------------------------------------------------
+
+class TestHistogram:
+    def test_percentiles_within_bucket_error(self):
+        histogram = Histogram()
+        for ms in range(1, 101):
+            histogram.add(ms / 1000)
+        for fraction, expected in ((0.5, 0.050), (0.95, 0.095), (0.99, 0.099)):
+            assert expected <= histogram.percentile(fraction) <= expected * 1.1
+
+    def test_percentile_never_exceeds_max(self):
+        histogram = Histogram()
+        histogram.add(0.0123)
+        assert histogram.percentile(0.99) == 0.0123
+
+    def test_empty(self):
+        assert Histogram().percentile(0.5) == 0.0
+
+    def test_tiny_durations_share_first_bucket(self):
+        histogram = Histogram()
+        histogram.add(0.0)
+        histogram.add(1e-7)
+        assert histogram.buckets == {0: 2}
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+class TestMetrics:
+    def test_timer_records_duration_and_bytes(self, clock):
+        stats = Metrics(clock)
+        with stats.timer("applescript.execute") as sample:
+            clock.now = 0.25
+            sample.nbytes = 42
+        timer = stats.snapshot()["timers"]["applescript.execute"]
+        assert timer["count"] == 1
+        assert timer["max_ms"] == pytest.approx(250)
+        assert timer["bytes"] == 42
+        assert timer["errors"] == 0
+
+    def test_timer_counts_errors(self):
+        stats = Metrics()
+        with pytest.raises(ValueError):
+            with stats.timer("tool.x"):
+                raise ValueError
+        assert stats.snapshot()["timers"]["tool.x"]["errors"] == 1
+
+    def test_reset(self):
+        stats = Metrics()
+        stats.record("a", 0.1)
+        stats.reset()
+        assert stats.snapshot()["timers"] == {}
+
+
+class TestReporter:
+    def test_emits_one_json_line(self):
+        stats = Metrics()
+        stats.record("tool.list_reminders", 0.01)
+        stream = io.StringIO()
+        Reporter(60, stream, stats).emit()
+        line = json.loads(stream.getvalue())
+        assert line["timers"]["tool.list_reminders"]["count"] == 1
+        assert "timestamp" in line
+
+
+# ---------------------------------------------------------------------------
+# hot-path instrumentation
+# ---------------------------------------------------------------------------
+
+class TestInstrumentation:
+    def test_get_reminders_records_execute_and_parse(self):
+        output = "\x1e".join(["Work", "1", "id-A", "A", "false", "missing value", ""])
+        with patch("subprocess.run") as run:
+            run.return_value.returncode = 0
+            run.return_value.stdout = output + "\n"
+            reminders.get_reminders("Work")
+        timers = metrics.snapshot()["timers"]
+        assert timers["applescript.execute"]["bytes"] == len(output.encode())
+        assert timers["applescript.parse"]["count"] == 1
+
+    def test_failed_script_counts_as_error(self):
+        with patch("subprocess.run") as run:
+            run.return_value.returncode = 1
+            run.return_value.stderr = "boom"
+            with pytest.raises(RuntimeError):
+                reminders.get_lists()
+        assert metrics.snapshot()["timers"]["applescript.execute"]["errors"] == 1
@@ -0,0 +1,186 @@
+"""Tests for NDJSON export and import."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from reminders_mcp import transfer
+from reminders_mcp.record import FIELDS, Reminder
+
+
+def reminder(name, list_name, completed=False, **values):
+    return Reminder(FIELDS, f"id-{name}", list_name, name, completed, **values)
+
+
+def created(items):
+    return [{"name": item["name"], "id": f"new-{item['name']}", "success": True, "error": None} for item in items]
+
+
+def completed(items):
+    return [{"name": None, "id": item["reminder_id"], "success": True, "error": None} for item in items]
+
+
+def write_export(path, *records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# export
+# ---------------------------------------------------------------------------
+
+class TestExport:
+    def test_streams_each_list_page_by_page(self):
+        pages = {
+            ("Work", None): ([reminder("A", "Work"), reminder("B", "Work")], "next"),
+            ("Work", "next"): ([reminder("C", "Work", notes="n")], None),
+            ("Home", None): ([], None),
+        }
+
+        def page(list_name, include_completed, limit, cursor, fields):
+            assert (include_completed, limit, fields) == (True, 2, FIELDS)
+            return pages[list_name, cursor]
+
+        out = io.StringIO()
+        with patch.object(transfer.reminders, "get_lists", return_value=["Work", "Home", "Work"]), \
+                patch.object(transfer.reminders, "get_reminders_page", side_effect=page):
+            result = transfer.export_reminders(out, page_size=2)
+        assert result == {"lists": {"Work": 3, "Home": 0}, "reminders": 3}
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [line["name"] for line in lines] == ["A", "B", "C"]
+        assert lines[2] == {
+            "id": "id-C", "list": "Work", "name": "C", "completed": False,
+            "due_date": None, "notes": "n", "flagged": False, "priority": 0,
+        }
+
+    def test_failed_export_keeps_the_previous_file(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        path.write_text("old\n")
+        with patch.object(transfer.reminders, "get_lists", side_effect=RuntimeError("AppleScript error: boom")):
+            with pytest.raises(RuntimeError):
+                transfer.export_file(path)
+        assert path.read_text() == "old\n"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_overlapping_exports_to_one_path_do_not_collide(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        export = transfer.export_reminders
+        nested = []
+
+        def overlapping(out, include_completed):
+            # A second export to the same path starts and finishes meanwhile.
+            if not nested:
+                nested.append(None)
+                nested[0] = transfer.export_file(path)
+            return export(out, include_completed)
+
+        with patch.object(transfer.reminders, "get_lists", return_value=["Work"]), \
+                patch.object(transfer.reminders, "get_reminders_page", return_value=([reminder("A", "Work")], None)), \
+                patch.object(transfer, "export_reminders", side_effect=overlapping):
+            transfer.export_file(path)
+        assert nested[0]["reminders"] == 1
+        assert list(tmp_path.iterdir()) == [path]
+        assert json.loads(path.read_text())["name"] == "A"
+
+    def test_export_file_reports_its_path(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        with patch.object(transfer.reminders, "get_lists", return_value=["Work"]), \
+                patch.object(transfer.reminders, "get_reminders_page", return_value=([reminder("A", "Work")], None)):
+            result = transfer.export_file(path)
+        assert result["path"] == str(path)
+        assert json.loads(path.read_text())["name"] == "A"
+
+
+# ---------------------------------------------------------------------------
+# import
+# ---------------------------------------------------------------------------
+
+class TestImport:
+    def test_creates_in_chunks_and_completes_completed_reminders(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        write_export(
+            path,
+            {"list": "Work", "name": "A", "completed": True, "due_date": "2026-03-01T09:00:00", "notes": None},
+            {"list": "Work", "name": "B", "completed": False, "due_date": None, "notes": "n"},
+            {"list": "Home", "name": "C", "completed": False},
+        )
+        with patch.object(transfer.reminders, "get_lists", return_value=["Work", "Home"]), \
+                patch.object(transfer.reminders, "create_reminders", side_effect=created) as create, \
+                patch.object(transfer.reminders, "complete_reminders", side_effect=completed) as complete:
+            result = transfer.import_reminders(path, chunk_size=2)
+        assert [call.args[0] for call in create.call_args_list] == [
+            [
+                {"name": "A", "list_name": "Work", "due_date": "2026-03-01T09:00:00"},
+                {"name": "B", "list_name": "Work", "notes": "n"},
+            ],
+            [{"name": "C", "list_name": "Home"}],
+        ]
+        complete.assert_called_once_with([{"reminder_id": "new-A"}])
+        assert result == {
+            "created": 3, "completed": 1, "failed": 0, "errors": [], "resumed_at_line": 0, "lists": ["Work", "Home"],
+        }
+        assert not (tmp_path / "backup.ndjson.progress").exists()
+
+    def test_creates_missing_lists_once(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        write_export(path, {"list": "New", "name": "A"}, {"list": "New", "name": "B"})
+        with patch.object(transfer.reminders, "get_lists", return_value=[]), \
+                patch.object(transfer.reminders, "_run_applescript", return_value="") as run, \
+                patch.object(transfer.reminders, "create_reminders", side_effect=created):
+            transfer.import_reminders(path, chunk_size=1)
+        run.assert_called_once_with(transfer.ENSURE_LISTS_SCRIPT, "New")
+
+    def test_interrupted_import_resumes_after_the_last_chunk(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        write_export(path, *({"list": "Work", "name": name} for name in "ABCDE"))
+        calls = []
+
+        def flaky(items):
+            calls.append([item["name"] for item in items])
+            if len(calls) == 2:
+                raise RuntimeError("AppleScript error: Reminders quit")
+            return created(items)
+
+        with patch.object(transfer.reminders, "get_lists", return_value=["Work"]), \
+                patch.object(transfer.reminders, "create_reminders", side_effect=flaky):
+            with pytest.raises(RuntimeError):
+                transfer.import_reminders(path, chunk_size=2)
+            assert json.loads((tmp_path / "backup.ndjson.progress").read_text()) == {"lines": 2}
+            result = transfer.import_reminders(path, chunk_size=2)
+        assert calls == [["A", "B"], ["C", "D"], ["C", "D"], ["E"]]
+        assert result["resumed_at_line"] == 2
+        assert result["created"] == 3
+
+    @pytest.mark.parametrize("content", ["not json", "[]", '{"lines": "2"}', '{"lines": -1}', '{"done": 2}'])
+    def test_refuses_a_progress_file_that_is_not_a_checkpoint(self, tmp_path, content):
+        path = tmp_path / "backup.ndjson"
+        write_export(path, {"list": "Work", "name": "A"})
+        progress = tmp_path / "backup.ndjson.progress"
+        progress.write_text(content)
+        with patch.object(transfer.reminders, "get_lists", return_value=["Work"]), \
+                patch.object(transfer.reminders, "create_reminders", side_effect=created) as create:
+            with pytest.raises(ValueError, match="not an import checkpoint"):
+                transfer.import_reminders(path)
+        create.assert_not_called()
+        assert progress.read_text() == content
+
+    def test_failures_are_counted_with_their_errors(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        write_export(path, {"name": "A"}, {"name": "B"})
+        outcomes = [
+            {"name": "A", "id": "new-A", "success": True, "error": None},
+            {"name": "B", "id": None, "success": False, "error": "Can't make list"},
+        ]
+        with patch.object(transfer.reminders, "get_lists", return_value=[]), \
+                patch.object(transfer.reminders, "create_reminders", return_value=outcomes):
+            result = transfer.import_reminders(path)
+        assert (result["created"], result["failed"]) == (1, 1)
+        assert result["errors"] == [{"name": "B", "error": "Can't make list"}]
+
+    def test_rejects_reminders_without_a_name(self, tmp_path):
+        path = tmp_path / "backup.ndjson"
+        write_export(path, {"list": "Work", "name": ""})
+        with patch.object(transfer.reminders, "get_lists", return_value=["Work"]):
+            with pytest.raises(ValueError, match="without a name"):
+                transfer.import_reminders(path)
@@ -0,0 +1,158 @@
+"""Tests for list snapshots and change notifications."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from reminders_mcp import watch
+from reminders_mcp.watch import Watcher
+
+
+def snapshot(*lists):
+    """Build SNAPSHOT_SCRIPT output from ``(name, ids, modified)`` tuples."""
+    return "\x1e".join(field for block in lists for field in block)
+
+
+def session():
+    fake = MagicMock()
+    fake.send_resource_updated = AsyncMock()
+    return fake
+
+
+class Snapshots:
+    """Stands in for the snapshot read, returning ``outputs`` in turn."""
+
+    def __init__(self, *outputs):
+        self.outputs = list(outputs)
+
+    async def __call__(self):
+        return self.outputs.pop(0) if len(self.outputs) > 1 else self.outputs[0]
+
+
+# ---------------------------------------------------------------------------
+# snapshots
+# ---------------------------------------------------------------------------
+
+class TestSnapshots:
+    def test_uri_round_trip(self):
+        assert watch.list_uri("Grocery List") == "reminders://list/Grocery%20List"
+        assert watch.list_name("reminders://list/Grocery%20List") == "Grocery List"
+        assert watch.list_name("reminders://stats") is None
+        assert watch.list_name("reminders://list/") is None
+
+    def test_fingerprint_follows_ids_and_modification_dates(self):
+        base = watch.parse_snapshot(snapshot(("Work", "a\x1fb", "d1\x1fd2")))
+        assert watch.parse_snapshot(snapshot(("Work", "a\x1fb", "d1\x1fd2"))) == base
+        assert watch.parse_snapshot(snapshot(("Work", "a\x1fb", "d1\x1fd3"))) != base
+        assert watch.parse_snapshot(snapshot(("Work", "a", "d1"))) != base
+
+    def test_empty_lists_and_malformed_output(self):
+        assert list(watch.parse_snapshot(snapshot(("Work", "", "")))) == ["Work"]
+        assert watch.parse_snapshot("") == {}
+        with pytest.raises(RuntimeError, match="malformed snapshot"):
+            watch.parse_snapshot("Work\x1ea")
+
+    def test_diff_reports_added_changed_and_removed_lists(self):
+        old = {"Work": "1", "Home": "2", "Old": "3"}
+        new = {"Work": "1", "Home": "9", "New": "4"}
+        assert watch.diff(old, new) == ["Home", "New", "Old"]
+        assert watch.diff(new, new) == []
+
+
+# ---------------------------------------------------------------------------
+# Watcher
+# ---------------------------------------------------------------------------
+
+class TestWatcher:
+    def test_notifies_only_subscribers_of_changed_lists(self):
+        changed = []
+        read = Snapshots(
+            snapshot(("Work", "a", "d1"), ("Home", "b", "d1")),
+            snapshot(("Work", "a", "d2"), ("Home", "b", "d1")),
+        )
+        watcher = Watcher(read, on_change=changed.extend)
+        work, home = session(), session()
+
+        async def scenario():
+            watcher._sessions = {watch.list_uri("Work"): {work}, watch.list_uri("Home"): {home}}
+            assert await watcher.poll() == []
+            assert await watcher.poll() == ["Work"]
+
+        asyncio.run(scenario())
+        assert changed == ["Work"]
+        work.send_resource_updated.assert_awaited_once()
+        assert str(work.send_resource_updated.call_args[0][0]) == "reminders://list/Work"
+        home.send_resource_updated.assert_not_awaited()
+        assert watcher.stats() == {"subscriptions": 2, "polls": 2, "changes": 1, "notifications": 1}
+
+    def test_closed_session_is_dropped(self):
+        read = Snapshots(snapshot(("Work", "a", "d1")), snapshot(("Work", "a", "d2")))
+        watcher = Watcher(read)
+        gone = session()
+        gone.send_resource_updated.side_effect = ConnectionError("closed")
+
+        async def scenario():
+            watcher._sessions = {watch.list_uri("Work"): {gone}}
+            await watcher.poll()
+            await watcher.poll()
+
+        asyncio.run(scenario())
+        assert watcher.stats()["subscriptions"] == 0
+
+    def test_polls_while_subscribed(self):
+        read = Snapshots(snapshot(("My List", "a", "d1")), snapshot(("My List", "a", "d2")))
+        watcher = Watcher(read, interval=0.01)
+        client = session()
+
+        async def scenario():
+            watcher.subscribe("reminders://list/My%20List", client)
+            await asyncio.sleep(0.05)
+            watcher.unsubscribe("reminders://list/My%20List", client)
+            await asyncio.sleep(0.03)
+            return watcher._task.done()
+
+        assert asyncio.run(scenario()) is True
+        client.send_resource_updated.assert_awaited_once()
+        assert watcher.stats()["subscriptions"] == 0
+
+    def test_forgetting_a_session_drops_all_its_subscriptions(self):
+        watcher = Watcher(Snapshots(snapshot(("Work", "a", "d1"))), interval=0.01)
+        gone, staying = session(), session()
+
+        async def scenario():
+            watcher.subscribe(watch.list_uri("Work"), gone)
+            watcher.subscribe(watch.list_uri("Home"), gone)
+            watcher.subscribe(watch.list_uri("Work"), staying)
+            watcher.forget(gone)
+            assert not watcher.is_subscribed(gone)
+            assert watcher.stats()["subscriptions"] == 1
+            watcher.forget(staying)
+            await asyncio.sleep(0.03)
+            return watcher._task.done()
+
+        assert asyncio.run(scenario()) is True
+
+    def test_failed_snapshot_is_retried(self):
+        outputs = [RuntimeError("AppleScript error: timeout"), snapshot(("Work", "a", "d1"))]
+
+        async def read():
+            output = outputs.pop(0) if len(outputs) > 1 else outputs[0]
+            if isinstance(output, Exception):
+                raise output
+            return output
+
+        watcher = Watcher(read, interval=0.01)
+
+        async def scenario():
+            watcher.subscribe(watch.list_uri("Work"), session())
+            await asyncio.sleep(0.05)
+            watcher._sessions.clear()
+            await asyncio.sleep(0.02)
+
+        asyncio.run(scenario())
+        assert watcher.polls >= 1
+
+    def test_only_lists_can_be_subscribed(self):
+        with pytest.raises(ValueError, match="Only reminder lists"):
+            Watcher(Snapshots("")).subscribe("reminders://stats", session())
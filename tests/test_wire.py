@@ -0,0 +1,117 @@
+"""Tests for the RS/US wire format decoder."""
+
+import pytest
+
+from reminders_mcp.wire import RS, US, FieldReader, PageDecoder, decode_page, iter_fields
+
+
+def block(list_name, *rows):
+    """Build one list block from (id, name, completed, due, notes) rows."""
+    columns = [US.join(values) for values in zip(*rows)]
+    return RS.join([list_name, str(len(rows)), *columns])
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+# ---------------------------------------------------------------------------
+# FieldReader
+# ---------------------------------------------------------------------------
+
+class TestFieldReader:
+    def test_splits_on_record_separator(self):
+        assert list(iter_fields(["a" + RS + "b" + RS + "c"])) == ["a", "b", "c"]
+
+    def test_fields_spanning_chunks(self):
+        text = RS.join(["first field", "", "third, with | pipes\nand lines"])
+        for size in (1, 2, 7):
+            assert list(iter_fields(chunked(text, size))) == ["first field", "", "third, with | pipes\nand lines"]
+
+    def test_feed_returns_only_completed_fields(self):
+        reader = FieldReader()
+        assert reader.feed("ab") == []
+        assert reader.feed("c" + RS + "d") == ["abc"]
+        assert reader.close() == ["d"]
+
+    def test_keeps_trailing_newline(self):
+        # osascript's own newline is dropped where the output is read.
+        assert list(iter_fields(["a" + RS + "b\n"])) == ["a", "b\n"]
+
+    def test_empty_input_has_no_fields(self):
+        assert list(iter_fields([])) == []
+        assert list(iter_fields([""])) == []
+
+
+# ---------------------------------------------------------------------------
+# PageDecoder
+# ---------------------------------------------------------------------------
+
+class TestPageDecoder:
+    def test_decodes_rows(self):
+        output = block("Work", ("id-1", "A", "false", "missing value", ""), ("id-2", "B", "true", "d", "n"))
+        rows, next_position = decode_page(output)
+        assert rows == [
+            ("Work", "id-1", "A", "false", "missing value", "", "", ""),
+            ("Work", "id-2", "B", "true", "d", "n", "", ""),
+        ]
+        assert next_position is None
+
+    def test_names_may_contain_any_printable_text(self):
+        output = block("A|B, C", ("id-1", "x|y|z", "false", "", "line 1\nline 2 ⏎"))
+        rows, _ = decode_page(output)
+        assert rows == [("A|B, C", "id-1", "x|y|z", "false", "", "line 1\nline 2 ⏎", "", "")]
+
+    def test_list_names_are_shared_across_reads(self):
+        name = "".join(["Gro", "ceries"])
+        first, _ = decode_page(block(name, ("id-1", "A", "false", "", "")))
+        second, _ = decode_page(block("Groceries", ("id-2", "B", "false", "", "")))
+        assert first[0][0] is second[0][0]
+
+    def test_next_marker(self):
+        output = RS.join([block("Work", ("id-1", "A", "false", "", "")), "next:1:2"])
+        assert decode_page(output)[1] == (1, 2)
+
+    def test_rows_arrive_per_block(self):
+        first = block("Work", ("id-1", "A", "false", "", ""))
+        second = block("Home", ("id-2", "B", "false", "", ""))
+        decoder = PageDecoder()
+        assert decoder.feed(first + RS) == [("Work", "id-1", "A", "false", "", "", "", "")]
+        assert decoder.feed(second) == []
+        assert decoder.close() == [("Home", "id-2", "B", "false", "", "", "", "")]
+
+    def test_chunked_input_matches_whole(self):
+        output = RS.join([block("L", *((f"id-{i}", f"R{i}", "false", "", f"n{i}") for i in range(20))), "next:2:1"])
+        decoder = PageDecoder()
+        rows = [row for chunk in chunked(output, 3) for row in decoder.feed(chunk)] + decoder.close()
+        assert (rows, decoder.next_position) == decode_page(output)
+
+    def test_inconsistent_block_raises(self):
+        bad = RS.join(["Work", "2", "id-1", "A", "false", "", ""])
+        good = block("Home", ("id-2", "B", "false", "", ""))
+        with pytest.raises(RuntimeError, match="malformed block for list 'Work'"):
+            decode_page(bad + RS + good)
+
+    def test_block_cut_short_raises(self):
+        output = block("Home", ("id-2", "B", "false", "", "")) + RS + RS.join(["Work", "1", "id-3"])
+        decoder = PageDecoder()
+        decoder.feed(output)
+        with pytest.raises(RuntimeError, match="malformed block for list 'Work'"):
+            decoder.close()
+
+    def test_projected_block_leaves_missing_fields_empty(self):
+        output = RS.join(["Work", "2", US.join(["id-1", "id-2"]), US.join(["A", "B"]), US.join(["n1", ""])])
+        rows, _ = decode_page(output, ("notes",))
+        assert rows == [("Work", "id-1", "A", "", "", "n1", "", ""), ("Work", "id-2", "B", "", "", "", "", "")]
+
+    def test_flagged_and_priority_columns(self):
+        output = RS.join(["Work", "1", "id-1", "A", "2026-03-01T09:00:00", "true", "1"])
+        rows, _ = decode_page(output, ("due_date", "flagged", "priority"))
+        assert rows == [("Work", "id-1", "A", "", "2026-03-01T09:00:00", "", "true", "1")]
+
+    def test_names_only_block(self):
+        output = RS.join([RS.join(["Work", "1", "id-1", "A"]), RS.join(["Home", "1", "id-2", "B"]), "next:2:2"])
+        decoder = PageDecoder(())
+        rows = decoder.feed(output) + decoder.close()
+        assert rows == [("Work", "id-1", "A", "", "", "", "", ""), ("Home", "id-2", "B", "", "", "", "", "")]
+        assert decoder.next_position == (2, 2)
@@ -0,0 +1,207 @@
+"""Tests for the write-behind queue."""
+
+import json
+
+import pytest
+
+from reminders_mcp.writeback import WriteQueue, batches
+
+
+def pending(queue):
+    return [(write.kind, write.item, write.tickets) for write in queue.take()]
+
+
+# ---------------------------------------------------------------------------
+# merging
+# ---------------------------------------------------------------------------
+
+class TestMerge:
+    def test_receipts_number_tickets(self):
+        queue = WriteQueue(delay=1)
+        assert queue.add("create", {"name": "A"}) == {"queued": True, "ticket": 1, "pending": 1}
+        assert queue.add("create", {"name": "B"}) == {"queued": True, "ticket": 2, "pending": 2}
+
+    def test_create_then_update_is_one_create(self):
+        queue = WriteQueue(delay=1)
+        queue.add("create", {"name": "A", "list_name": "Work"})
+        queue.add("update", {"name": "A", "list_name": "Work", "new_name": "B", "notes": "n"})
+        assert pending(queue) == [("create", {"name": "B", "list_name": "Work", "notes": "n"}, [1, 2])]
+        assert queue.merged == 1
+
+    def test_renamed_create_is_found_by_its_new_name(self):
+        queue = WriteQueue(delay=1)
+        queue.add("create", {"name": "A"})
+        queue.add("update", {"name": "A", "new_name": "B"})
+        queue.add("complete", {"name": "B"})
+        assert [write.kind for write in queue.take()] == ["create", "complete"]
+
+    def test_create_then_delete_cancels_both(self):
+        queue = WriteQueue(delay=1)
+        queue.add("create", {"name": "A"})
+        queue.add("delete", {"name": "A"})
+        assert len(queue) == 0
+        assert queue.outcomes([1, 2]) == [
+            {"tickets": [1, 2], "action": "cancel", "name": "A", "id": None, "success": True, "error": None}
+        ]
+
+    def test_update_then_update_merges_changes(self):
+        queue = WriteQueue(delay=1)
+        queue.add("update", {"reminder_id": "id-1", "notes": "n"})
+        queue.add("update", {"reminder_id": "id-1", "due_date": "2026-03-01T09:00"})
+        assert pending(queue) == [
+            ("update", {"reminder_id": "id-1", "notes": "n", "due_date": "2026-03-01T09:00"}, [1, 2])
+        ]
+
+    def test_update_then_delete_deletes_the_original(self):
+        queue = WriteQueue(delay=1)
+        queue.add("update", {"name": "A", "list_name": "Work", "new_name": "B"})
+        queue.add("delete", {"name": "B", "list_name": "Work"})
+        assert pending(queue) == [("delete", {"name": "A", "list_name": "Work"}, [1, 2])]
+
+    def test_repeated_complete_is_one(self):
+        queue = WriteQueue(delay=1)
+        queue.add("complete", {"reminder_id": "id-1"})
+        queue.add("complete", {"reminder_id": "id-1"})
+        assert pending(queue) == [("complete", {"reminder_id": "id-1"}, [1, 2])]
+
+    def test_other_reminders_are_not_merged(self):
+        queue = WriteQueue(delay=1)
+        queue.add("create", {"name": "A", "list_name": "Work"})
+        queue.add("update", {"name": "A", "list_name": "Home", "notes": "n"})
+        queue.add("complete", {"name": "A", "list_name": "Work"})
+        assert [write.kind for write in queue.take()] == ["create", "update", "complete"]
+
+    def test_write_after_a_rename_away_is_not_merged_past_it(self):
+        queue = WriteQueue(delay=1)
+        queue.add("update", {"name": "A", "new_name": "B"})
+        queue.add("update", {"name": "A", "notes": "n"})
+        # Once A is renamed, "A" means some other reminder.
+        assert [write.item for write in queue.take()] == [
+            {"name": "A", "new_name": "B"},
+            {"name": "A", "notes": "n"},
+        ]
+
+    def test_complete_after_update_is_kept_separate(self):
+        queue = WriteQueue(delay=1)
+        queue.add("update", {"reminder_id": "id-1", "notes": "n"})
+        queue.add("complete", {"reminder_id": "id-1"})
+        assert [write.kind for write in queue.take()] == ["update", "complete"]
+
+    def test_unknown_kind_rejected(self):
+        with pytest.raises(ValueError, match="Unknown write kind"):
+            WriteQueue(delay=1).add("archive", {"name": "A"})
+
+
+# ---------------------------------------------------------------------------
+# flushing
+# ---------------------------------------------------------------------------
+
+class TestFlush:
+    def test_batches_group_consecutive_kinds(self):
+        queue = WriteQueue(delay=1)
+        for kind, name in (("create", "A"), ("create", "B"), ("complete", "C"), ("create", "D")):
+            queue.add(kind, {"name": name})
+        assert [[write.item["name"] for write in run] for run in batches(queue.take())] == [
+            ["A", "B"], ["C"], ["D"]
+        ]
+
+    def test_full_at_max_pending(self):
+        queue = WriteQueue(delay=1, max_pending=2)
+        queue.add("create", {"name": "A"})
+        assert not queue.full()
+        queue.add("create", {"name": "B"})
+        assert queue.full()
+
+    def test_settle_records_outcomes_once(self):
+        queue = WriteQueue(delay=1)
+        queue.add("complete", {"name": "A"})
+        writes = queue.take()
+        queue.settle(writes, [{"name": "A", "id": "id-A", "success": True, "error": None}])
+        assert queue.outcomes([1]) == [
+            {"tickets": [1], "action": "complete", "name": "A", "id": "id-A", "success": True, "error": None}
+        ]
+        assert queue.outcomes([1]) == [
+            {"tickets": [1], "action": "unknown", "name": None, "id": None, "success": None, "error": None}
+        ]
+        assert queue.stats()["flushed"] == 1
+
+    def test_outcomes_go_only_to_their_tickets(self):
+        queue = WriteQueue(delay=1)
+        queue.add("complete", {"name": "A"})
+        queue.add("complete", {"name": "B"})
+        queue.settle(queue.take(), [
+            {"name": name, "id": f"id-{name}", "success": True, "error": None} for name in "AB"
+        ])
+        assert [outcome["name"] for outcome in queue.outcomes([2])] == ["B"]
+        assert [outcome["name"] for outcome in queue.outcomes([1, 2])] == ["A", None]
+
+    def test_merged_tickets_are_reported_to_each_asker(self):
+        queue = WriteQueue(delay=1)
+        queue.add("create", {"name": "A"})
+        queue.add("update", {"name": "A", "notes": "n"})
+        queue.settle(queue.take(), [{"name": "A", "id": "id-A", "success": True, "error": None}])
+        assert queue.outcomes([1, 2]) == [
+            {"tickets": [1, 2], "action": "create", "name": "A", "id": "id-A", "success": True, "error": None}
+        ]
+
+    def test_queued_ticket_is_pending(self):
+        queue = WriteQueue(delay=1)
+        queue.add("complete", {"name": "A"})
+        assert queue.outcomes([1])[0]["action"] == "pending"
+
+    def test_unreported_failures_are_never_evicted(self):
+        queue = WriteQueue(delay=1, max_outcomes=2)
+        queue.add("complete", {"name": "lost"})
+        queue.settle(queue.take(), [{"name": "lost", "id": None, "success": False, "error": "not found"}])
+        for name in "ABC":
+            queue.add("complete", {"name": name})
+        queue.settle(queue.take(), [
+            {"name": name, "id": f"id-{name}", "success": True, "error": None} for name in "ABC"
+        ])
+        assert queue.stats()["unreported_failures"] == 1
+        assert [(outcome["action"], outcome["error"]) for outcome in queue.outcomes([1, 2, 4])] == [
+            ("complete", "not found"), ("unknown", None), ("complete", None)
+        ]
+
+    def test_restore_puts_writes_back_in_front(self):
+        queue = WriteQueue(delay=1)
+        queue.add("create", {"name": "A"})
+        writes = queue.take()
+        queue.add("create", {"name": "B"})
+        queue.restore(writes)
+        assert [write.item["name"] for write in queue.take()] == ["A", "B"]
+
+    def test_disabled_without_delay(self):
+        assert not WriteQueue().enabled
+        assert WriteQueue(delay=0.5).enabled
+
+
+# ---------------------------------------------------------------------------
+# journal
+# ---------------------------------------------------------------------------
+
+class TestJournal:
+    def test_acknowledged_writes_survive_a_restart(self, tmp_path):
+        journal = tmp_path / "writes.jsonl"
+        queue = WriteQueue(delay=1, journal=journal)
+        queue.add("create", {"name": "A"})
+        queue.add("update", {"name": "A", "notes": "n"})
+        queue.add("complete", {"reminder_id": "id-1"})
+
+        restarted = WriteQueue(delay=1, journal=journal)
+        assert pending(restarted) == [
+            ("create", {"name": "A", "notes": "n"}, [1, 2]),
+            ("complete", {"reminder_id": "id-1"}, [3]),
+        ]
+        assert restarted.add("delete", {"name": "B"})["ticket"] == 4
+
+    def test_commit_keeps_only_pending_writes(self, tmp_path):
+        journal = tmp_path / "writes.jsonl"
+        queue = WriteQueue(delay=1, journal=journal)
+        queue.add("create", {"name": "A"})
+        queue.take()
+        queue.add("create", {"name": "B"})
+        queue.commit()
+        lines = [json.loads(line) for line in journal.read_text().splitlines()]
+        assert lines == [{"kind": "create", "item": {"name": "B"}, "tickets": [2]}]
+        assert not (tmp_path / "writes.jsonl.tmp").exists()